@@ -8,3 +8,4 @@ SHOCK_PROBABILITY = 0.05  # 5% chance of geopolitical event
 
 # AI/LLM Parameters
 LLM_MODEL = "llama-3-8b-quantized"  # Simulated for local run
+RISK_MODEL_DIR = "models/risk-classifier"  # Local BERT/RoBERTa checkpoint for TransformerRiskBackend (offline)
@@ -0,0 +1,161 @@
+"""
+GovSignal Backfill Module
+Fetches historical documents for a date range by splitting it into time partitions,
+fetching partitions in parallel within per-source rate limits, and checkpointing
+finished partitions so an interrupted backfill resumes where it stopped.
+"""
+import json
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import date, timedelta
+
+from .connectors import FILTER_DATE_RANGE
+from .ratelimit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARTITION_DAYS = 30
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_REQUESTS_PER_SECOND = 2.0
+
+
+def partition_date_range(start: str, end: str, partition_days: int = DEFAULT_PARTITION_DAYS) -> list:
+    """Splits the inclusive ISO date range [start, end] into consecutive (from, to) windows."""
+    if partition_days < 1:
+        raise ValueError("partition_days must be at least 1")
+    current = date.fromisoformat(start)
+    last = date.fromisoformat(end)
+    if last < current:
+        raise ValueError(f"Backfill range ends before it starts: {start} > {end}")
+
+    partitions = []
+    while current <= last:
+        window_end = min(current + timedelta(days=partition_days - 1), last)
+        partitions.append((current.isoformat(), window_end.isoformat()))
+        current = window_end + timedelta(days=1)
+    return partitions
+
+
+class BackfillRunner:
+    """
+    Time-partitioned backfill over the scout's date-capable sources.
+    Only sources whose connectors push down FILTER_DATE_RANGE take part; sources
+    without a date dimension cannot be backfilled and are skipped.
+    Results stream through the scout's normal scoring path as partitions finish.
+    """
+
+    def __init__(self, scout, checkpoint_path: str = None, partition_days: int = DEFAULT_PARTITION_DAYS,
+                 max_workers: int = DEFAULT_MAX_WORKERS, requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND):
+        self.scout = scout
+        self.checkpoint_path = checkpoint_path
+        self.partition_days = partition_days
+        self.max_workers = max_workers
+
+        self.sources = []
+        for source in scout._sources():
+            source_key, connector = source[0], source[1]
+            if FILTER_DATE_RANGE in getattr(connector, 'SUPPORTED_FILTERS', ()):
+                self.sources.append(source)
+            else:
+                logger.warning(f"Backfill: {source_key} has no date-range filter, skipping")
+        # One limiter per source: parallel partitions share each host's budget
+        self.limiters = {source[0]: RateLimiter(requests_per_second) for source in self.sources}
+
+    def _load_checkpoint(self) -> set:
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return set()
+        with open(self.checkpoint_path, 'r') as f:
+            state = json.load(f)
+        if state.get('partition_days') != self.partition_days:
+            logger.warning("Backfill checkpoint was written with a different partition size; starting over")
+            return set()
+        return set(state.get('completed', []))
+
+    def _save_checkpoint(self, completed: set):
+        if not self.checkpoint_path:
+            return
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({"partition_days": self.partition_days, "completed": sorted(completed)}, f)
+        # Atomic rename: a crash mid-write never leaves a truncated checkpoint
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _fetch_partition(self, partition: tuple) -> list:
+        """Fetches one time window from every source; returns [(source, records)]."""
+        posted_from, posted_to = partition
+        keywords, filters = self.scout._build_query(posted_from, posted_to)
+        if not self.scout._keyword_pushdown():
+            keywords = []
+        results = []
+        for source in self.sources:
+            source_key, connector, fetch = source[:3]
+            self.limiters[source_key].acquire()
+            results.append((source, self.scout._query_source(connector, fetch, keywords, filters)))
+        return results
+
+    def run(self, start: str, end: str, before_checkpoint=None):
+        """
+        Backfills [start, end] (ISO dates) and yields signals as partitions complete.
+        A partition is checkpointed only after all of its signals have been yielded (and
+        before_checkpoint() has returned, for consumers that buffer), so a crash re-fetches
+        at most the partitions that were in flight.
+        """
+        partitions = partition_date_range(start, end, self.partition_days)
+        completed = self._load_checkpoint()
+        pending = [p for p in partitions if f"{p[0]}_{p[1]}" not in completed]
+        logger.info(f"Backfill {start}..{end}: {len(pending)} of {len(partitions)} partitions pending")
+
+        # At most max_workers partitions are in flight, so fetched-but-unconsumed results stay
+        # bounded when scoring is slower than fetching
+        pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        queued = iter(pending)
+        in_flight = {}
+        try:
+            for partition in queued:
+                in_flight[pool.submit(self._fetch_partition, partition)] = partition
+                if len(in_flight) >= self.max_workers:
+                    break
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    partition = in_flight.pop(future)
+                    results = future.result()
+                    # Refill before scoring, so the fetchers keep working while signals are consumed
+                    following = next(queued, None)
+                    if following is not None:
+                        in_flight[pool.submit(self._fetch_partition, following)] = following
+                    for (source_key, connector, fetch, source_name, text_fields), records in results:
+                        yield from self.scout.score_documents(records, source_name, text_fields,
+                                                              connector.FILTER_FIELDS)
+                    if before_checkpoint:
+                        before_checkpoint()
+                    completed.add(f"{partition[0]}_{partition[1]}")
+                    self._save_checkpoint(completed)
+                    logger.info(f"Backfill partition {partition[0]}..{partition[1]} complete")
+        finally:
+            # Closing the stream (or Ctrl-C) drops partitions not yet started instead of fetching them
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def deliver(self, start: str, end: str, batch_size: int = 500) -> int:
+        """
+        Backfills [start, end] into the scout's sinks through emit() in batches (delta sync,
+        rollups and sinks apply). Each partition's signals are emitted before it is
+        checkpointed; the whole run is one top-K budget period. Returns the number of
+        signals emitted.
+        """
+        batch = []
+        emitted = 0
+
+        def flush():
+            nonlocal emitted
+            if batch:
+                emitted += len(self.scout.emit(list(batch)))
+                batch.clear()
+
+        for signal in self.run(start, end, before_checkpoint=flush):
+            batch.append(signal)
+            if len(batch) >= batch_size:
+                flush()
+        flush()
+        return emitted + len(self.scout.flush_budget())
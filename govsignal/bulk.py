@@ -0,0 +1,267 @@
+"""
+GovSignal Bulk Readers Module
+Streams documents out of large government bulk files on local disk.
+
+Bulk files replace per-keyword API queries for full-coverage scans: every reader
+here is a generator that holds at most one document (plus a small read buffer)
+in memory, regardless of file size.
+"""
+import csv
+import json
+import logging
+import mmap
+import os
+import xml.etree.ElementTree as ET
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Federal Register daily XML: document-level elements and the type they map to.
+FR_XML_DOCUMENT_TYPES = {
+    "RULE": "Rule",
+    "PRORULE": "Proposed Rule",
+    "NOTICE": "Notice",
+    "PRESDOCU": "Presidential Document",
+}
+
+JSON_READ_SIZE = 64 * 1024
+
+# SAM.gov Contract Opportunities full-extract CSV columns -> API response fields.
+# Columns not listed here are dropped to keep per-record memory small.
+SAM_CSV_FIELD_MAP = {
+    "NoticeId": "noticeId",
+    "Title": "title",
+    "Sol#": "solicitationNumber",
+    "Department/Ind.Agency": "department",
+    "Sub-Tier": "subTier",
+    "Office": "office",
+    "PostedDate": "postedDate",
+    "Type": "type",
+    "ArchiveDate": "archiveDate",
+    "ResponseDeadLine": "responseDeadLine",
+    "NaicsCode": "naicsCode",
+    "ClassificationCode": "classificationCode",
+    "Link": "uiLink",
+    "Description": "description",
+}
+SAM_CSV_CHUNK_SIZE = 1000
+
+
+def _element_text(elem) -> str:
+    """Flattens an element's text content into a single whitespace-normalized string."""
+    if elem is None:
+        return ""
+    return " ".join("".join(elem.itertext()).split())
+
+
+def _parse_fr_date(text: str) -> str:
+    """Converts 'Friday, December 15, 2023' to ISO format; returns the input if unparseable."""
+    try:
+        return datetime.strptime(text, "%A, %B %d, %Y").date().isoformat()
+    except ValueError:
+        return text
+
+
+def _fr_document_number(frdoc_text: str) -> str:
+    """Extracts '2023-28912' from '[FR Doc. 2023-28912 Filed 12-14-23; 8:45 am]'."""
+    parts = frdoc_text.replace("[", " ").replace("]", " ").split()
+    for i, part in enumerate(parts):
+        if part == "Doc." and i + 1 < len(parts):
+            return parts[i + 1]
+    return ""
+
+
+def _fr_xml_record(elem, publication_date: str) -> dict:
+    """Maps a Federal Register XML document element to the connector's response fields."""
+    summary = elem.find(".//SUM")
+    if summary is not None:
+        # Drop the 'SUMMARY:' heading so only the abstract body is scored
+        abstract = " ".join(_element_text(p) for p in summary.findall("P"))
+    else:
+        abstract = ""
+    return {
+        "document_number": _fr_document_number(_element_text(elem.find(".//FRDOC"))),
+        "title": _element_text(elem.find(".//SUBJECT")),
+        "agency": _element_text(elem.find(".//AGENCY")),
+        "abstract": abstract,
+        "publication_date": publication_date,
+        "type": FR_XML_DOCUMENT_TYPES[elem.tag],
+    }
+
+
+def iter_federal_register_xml(path: str):
+    """
+    Yields Federal Register documents from a daily bulk XML file (govinfo.gov FR format).
+    Uses incremental parsing and detaches each document element, and every other completed
+    child of the root (front matter, CNTNTS, finished sections), once it is consumed, so
+    memory use stays constant no matter how many documents the file holds.
+    """
+    publication_date = ""
+    stack = []
+    count = 0
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            stack.append(elem)
+            continue
+
+        stack.pop()
+        if elem.tag in FR_XML_DOCUMENT_TYPES:
+            yield _fr_xml_record(elem, publication_date)
+            count += 1
+        elif len(stack) == 1:
+            if elem.tag == "DATE" and not publication_date:
+                publication_date = _parse_fr_date(_element_text(elem))
+        else:
+            # Still part of an open document or section
+            continue
+        elem.clear()
+        if stack:
+            stack[-1].remove(elem)
+
+    logger.info(f"Streamed {count} documents from Federal Register XML: {path}")
+
+
+def _iter_json_array(f, read_size: int = JSON_READ_SIZE):
+    """
+    Incrementally decodes the objects of the document array in a JSON file.
+    The array may be top-level or stored under a "results" key (Federal Register API format).
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    eof = False
+
+    def fill() -> bool:
+        nonlocal buffer, eof
+        chunk = f.read(read_size)
+        if not chunk:
+            eof = True
+            return False
+        buffer += chunk
+        return True
+
+    # Locate the opening bracket of the document array
+    pos = -1
+    while pos < 0:
+        stripped = buffer.lstrip()
+        if stripped.startswith("["):
+            pos = len(buffer) - len(stripped) + 1
+            break
+        key = buffer.find('"results"')
+        while key >= 0:
+            rest = buffer[key + len('"results"'):].lstrip()
+            if rest.startswith(":"):
+                value = rest[1:].lstrip()
+                if value.startswith("["):
+                    pos = buffer.index("[", key) + 1
+                    break
+                if not value and not eof:
+                    break  # value not buffered yet
+            elif not rest and not eof:
+                break  # separator not buffered yet
+            key = buffer.find('"results"', key + 1)
+        if pos < 0 and not fill():
+            raise ValueError("No document array found in JSON bulk file")
+
+    buffer = buffer[pos:]
+    while True:
+        buffer = buffer.lstrip().lstrip(",").lstrip()
+        if not buffer:
+            if not fill():
+                raise ValueError("Unterminated document array in JSON bulk file")
+            continue
+        if buffer[0] == "]":
+            return
+        try:
+            obj, end = decoder.raw_decode(buffer)
+        except json.JSONDecodeError:
+            if not fill():
+                raise
+            continue
+        yield obj
+        buffer = buffer[end:]
+
+
+def _fr_json_record(record: dict) -> dict:
+    """Fills the connector's flat 'agency' field from the API's nested 'agencies' list."""
+    if "agency" not in record and record.get("agencies"):
+        record["agency"] = "; ".join(a.get("name", "") for a in record["agencies"] if a.get("name"))
+    record["abstract"] = record.get("abstract") or ""
+    return record
+
+
+def iter_federal_register_json(path: str):
+    """
+    Yields Federal Register documents from a JSON bulk file.
+    Accepts newline-delimited JSON (.ndjson/.jsonl) or a JSON document array,
+    either top-level or under the API's "results" key.
+    """
+    count = 0
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith((".ndjson", ".jsonl")):
+            records = (json.loads(line) for line in f if line.strip())
+        else:
+            records = _iter_json_array(f)
+        for record in records:
+            yield _fr_json_record(record)
+            count += 1
+
+    logger.info(f"Streamed {count} documents from Federal Register JSON: {path}")
+
+
+def _mmap_lines(path: str, encoding: str):
+    """Yields decoded lines from a memory-mapped file, letting the OS page cache do the buffering."""
+    if os.path.getsize(path) == 0:
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for raw in iter(mm.readline, b""):
+            yield raw.decode(encoding, errors="replace")
+
+
+def iter_sam_csv_chunks(path: str, chunk_size: int = SAM_CSV_CHUNK_SIZE,
+                        use_mmap: bool = False, encoding: str = "utf-8"):
+    """
+    Yields lists of at most chunk_size opportunity records from a SAM.gov
+    Contract Opportunities CSV extract. Rows are mapped to the API's field names
+    (noticeId, title, description, ...) so downstream scoring is source-agnostic.
+    """
+    if use_mmap:
+        lines = _mmap_lines(path, encoding)
+        f = None
+    else:
+        f = open(path, "r", encoding=encoding, errors="replace", newline="")
+        lines = f
+
+    count = 0
+    try:
+        reader = csv.reader(lines)
+        header = next(reader, None)
+        if header is None:
+            return
+        header[0] = header[0].lstrip("\ufeff")
+        # Resolve column positions once instead of building a dict per row
+        columns = [(i, SAM_CSV_FIELD_MAP[name]) for i, name in enumerate(header) if name in SAM_CSV_FIELD_MAP]
+
+        chunk = []
+        for row in reader:
+            if not row:
+                continue
+            chunk.append({field: row[i] if i < len(row) else "" for i, field in columns})
+            if len(chunk) >= chunk_size:
+                count += len(chunk)
+                yield chunk
+                chunk = []
+        if chunk:
+            count += len(chunk)
+            yield chunk
+    finally:
+        if f is not None:
+            f.close()
+
+    logger.info(f"Streamed {count} opportunities from SAM.gov CSV extract: {path}")
+
+
+def iter_sam_csv(path: str, chunk_size: int = SAM_CSV_CHUNK_SIZE,
+                 use_mmap: bool = False, encoding: str = "utf-8"):
+    """Record-level iterator over iter_sam_csv_chunks(); memory is bounded by chunk_size."""
+    for chunk in iter_sam_csv_chunks(path, chunk_size, use_mmap, encoding):
+        yield from chunk
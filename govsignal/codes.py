@@ -0,0 +1,107 @@
+"""
+GovSignal Code Routing Module
+NAICS/PSC code extraction and a precomputed code -> asset index derived from the asset
+ontology (naics_codes / psc_codes per asset).
+
+Documents that carry classification codes (SAM.gov's naicsCode / classificationCode, or
+"NAICS 334511" / "PSC 5865" mentions in text) are routed to assets with a few dict
+lookups, so they reach targets whose keywords they never mention. Code evidence is
+combined with the keyword scan and never lowers a keyword score.
+"""
+import re
+
+from .routing import _stems
+
+# Record fields that carry codes, per code system
+NAICS_FIELDS = ("naicsCode", "naics_code", "naics")
+PSC_FIELDS = ("classificationCode", "psc_code", "psc")
+NAICS_PATTERN = re.compile(r"\bNAICS(?:\s+code)?[\s:#]*(\d{2,6})\b", re.IGNORECASE)
+PSC_PATTERN = re.compile(r"\bPSC(?:\s+code)?[\s:#]*([A-Z0-9]{4})\b", re.IGNORECASE)
+MIN_NAICS_PREFIX = 2
+
+
+def extract_codes(record: dict, text_fields: tuple = ()) -> tuple:
+    """Returns (naics codes, psc codes) from the record's code fields and code mentions in text_fields."""
+    naics, psc = set(), set()
+    for fields, codes in ((NAICS_FIELDS, naics), (PSC_FIELDS, psc)):
+        for field in fields:
+            value = record.get(field)
+            if isinstance(value, (list, tuple)):
+                codes.update(str(v).strip().upper() for v in value if v)
+            elif value:
+                codes.add(str(value).strip().upper())
+    for field in text_fields:
+        text = str(record.get(field) or "")
+        naics.update(NAICS_PATTERN.findall(text))
+        psc.update(code.upper() for code in PSC_PATTERN.findall(text))
+    return naics, psc
+
+
+class CodeIndex:
+    """
+    Compact code -> asset lookup. Ontology NAICS entries may be prefixes ("3345" covers
+    334511); a document code is resolved by probing its prefixes from longest to
+    MIN_NAICS_PREFIX digits, so each lookup costs at most five dict probes. PSC codes
+    match exactly.
+    """
+
+    def __init__(self, assets: list):
+        naics, psc = {}, {}
+        for asset in assets:
+            for table, key in ((naics, 'naics_codes'), (psc, 'psc_codes')):
+                for code in asset.get(key) or []:
+                    table.setdefault(str(code).upper(), []).append(asset['name'])
+        # Frozen tuples: the index is built once and only read afterwards
+        self.naics = {code: tuple(names) for code, names in naics.items()}
+        self.psc = {code: tuple(names) for code, names in psc.items()}
+
+    def __len__(self):
+        return len(self.naics) + len(self.psc)
+
+    def assets_for_naics(self, code: str) -> tuple:
+        code = str(code)
+        for length in range(min(len(code), 6), MIN_NAICS_PREFIX - 1, -1):
+            names = self.naics.get(code[:length])
+            if names:
+                return names
+        return ()
+
+    def assets_for_psc(self, code: str) -> tuple:
+        return self.psc.get(str(code).upper(), ())
+
+    def lookup(self, naics_codes, psc_codes) -> dict:
+        """{asset name: [matched codes as 'NAICS:x' / 'PSC:y']} for the given codes."""
+        matches = {}
+        for code in naics_codes:
+            for name in self.assets_for_naics(code):
+                matches.setdefault(name, []).append(f"NAICS:{code}")
+        for code in psc_codes:
+            for name in self.assets_for_psc(code):
+                matches.setdefault(name, []).append(f"PSC:{code}")
+        return matches
+
+
+def asset_categories(targets: dict, assets: list) -> dict:
+    """
+    {asset name: [target categories]} linking the ontology to surveillance targets.
+    A target may list ontology asset names explicitly under `assets`; otherwise it is
+    linked to assets that share a word stem with its category, related_asset and keywords,
+    or whose NAICS codes overlap its naics_codes.
+    """
+    links = {asset['name']: [] for asset in assets}
+    for category, criteria in targets.items():
+        explicit = criteria.get('assets')
+        vocabulary = _stems(" ".join([category.replace("_", " "), criteria.get('related_asset', '')]
+                                     + list(criteria.get('keywords', []))))
+        target_naics = [str(code) for code in criteria.get('naics_codes') or []]
+        for asset in assets:
+            if explicit is not None:
+                linked = asset['name'] in explicit
+            else:
+                asset_vocabulary = _stems(" ".join([asset['name']] + list(asset.get('keywords', []))))
+                linked = bool(vocabulary & asset_vocabulary) or any(
+                    str(a).startswith(t) or t.startswith(str(a))
+                    for a in asset.get('naics_codes') or [] for t in target_naics)
+            if linked:
+                links[asset['name']].append(category)
+    return links
@@ -3,57 +3,135 @@ GovSignal Connectors Module
 Mocks external government APIs (SAM.gov, Federal Register) for the research prototype.
 """
 import logging
+from .bulk import iter_federal_register_xml, iter_federal_register_json, iter_sam_csv, SAM_CSV_CHUNK_SIZE
 
 # Type Alias for connector responses
 ConnectorResponse = list[dict]
 
 logger = logging.getLogger(__name__)
 
+# Filters a connector may declare in SUPPORTED_FILTERS to have them pushed upstream.
+# Queries carry keywords separately; the remaining filters travel in a dict:
+#   {"naics": ["3344", ...], "agency": ["Defense", ...], "date_range": ("2024-01-01", "2024-06-30")}
+FILTER_KEYWORD = "keyword"
+FILTER_NAICS = "naics"
+FILTER_AGENCY = "agency"
+FILTER_DATE_RANGE = "date_range"
+
+
+def matches_filters(record: dict, keywords: list, filters: dict, search_fields: tuple, filter_fields: dict) -> bool:
+    """
+    Evaluates a query against a single record.
+    Keywords use the same case-insensitive substring test as the scout's scorer, so a
+    pushed-down query never drops a record the scorer would have matched.
+    Filters on fields the source does not carry (absent from filter_fields) are skipped.
+    """
+    if keywords:
+        text = " ".join(str(record.get(field) or "") for field in search_fields).lower()
+        if not any(keyword.lower() in text for keyword in keywords):
+            return False
+    if not filters:
+        return True
+
+    naics_codes = filters.get(FILTER_NAICS)
+    if naics_codes and FILTER_NAICS in filter_fields:
+        # NAICS is hierarchical: a 4-digit code matches every 6-digit code beneath it
+        code = str(record.get(filter_fields[FILTER_NAICS]) or "")
+        if not any(code.startswith(str(prefix)) for prefix in naics_codes):
+            return False
+
+    agencies = filters.get(FILTER_AGENCY)
+    if agencies and FILTER_AGENCY in filter_fields:
+        agency = str(record.get(filter_fields[FILTER_AGENCY]) or "").lower()
+        if not any(name.lower() in agency for name in agencies):
+            return False
+
+    date_range = filters.get(FILTER_DATE_RANGE)
+    if date_range and FILTER_DATE_RANGE in filter_fields:
+        # ISO dates compare correctly as strings
+        posted = str(record.get(filter_fields[FILTER_DATE_RANGE]) or "")[:10]
+        start, end = date_range
+        if not posted or (start and posted < start) or (end and posted > end):
+            return False
+    return True
+
+
+def apply_filters(records: ConnectorResponse, keywords: list, filters: dict,
+                  search_fields: tuple, filter_fields: dict) -> ConnectorResponse:
+    """Returns the records matching a query (see matches_filters)."""
+    if not keywords and not filters:
+        return records
+    return [r for r in records if matches_filters(r, keywords, filters, search_fields, filter_fields)]
+
+
 class SamGovConnector:
     """
     Mock connector for SAM.gov (System for Award Management).
     Simulates fetching government contract solicitations.
     """
+    SUPPORTED_FILTERS = frozenset({FILTER_KEYWORD, FILTER_NAICS, FILTER_AGENCY, FILTER_DATE_RANGE})
+    SEARCH_FIELDS = ("title", "description", "department", "subTier")
+    FILTER_FIELDS = {FILTER_NAICS: "naicsCode", FILTER_AGENCY: "department", FILTER_DATE_RANGE: "postedDate"}
+
     def __init__(self):
         logger.info("Initializing SamGovConnector (Mock Mode) - Prototype v1.0")
 
-    def get_opportunities(self, keywords: list) -> ConnectorResponse:
+    def get_opportunities(self, keywords: list, filters: dict = None) -> ConnectorResponse:
         """
         Simulates an API call to SAM.gov to find solicitations matching keywords.
+        Keywords and any SUPPORTED_FILTERS are evaluated at the source, so only matching
+        solicitations are returned.
         In this research prototype, we return a fixed mock response associated with Defense/Electronic Warfare.
         """
-        logger.info(f"Querying SAM.gov with keywords: {keywords}")
+        logger.info(f"Querying SAM.gov with keywords: {keywords} filters: {filters}")
         
         # Mock Data 2 (Defense) as per requirements
         # NOTE: This structure mimics the official SAM.gov API "opportunities" endpoint
         mock_response = [
             {
                 "noticeId": "N00014-24-R-0001",
+                "solicitationNumber": "N00014-24-R-0001",
                 "title": "DoD Solicitation: Electronic Warfare Readiness and Countermeasures",
                 "department": "Department of Defense",
                 "subTier": "Department of the Navy",
                 "description": "The Office of Naval Research is soliciting proposals for advanced Electronic Warfare (EW) systems. Key areas of interest include next-generation jamming pods and high-power microwave integration for airborne platforms.",
                 "type": "Solicitation",
+                "naicsCode": "334511",
                 "postedDate": "2023-10-25",
                 "archiveDate": "2024-01-25"
             }
         ]
-        return mock_response
+        return apply_filters(mock_response, keywords, filters, self.SEARCH_FIELDS, self.FILTER_FIELDS)
+
+    def iter_bulk_opportunities(self, path: str, chunk_size: int = SAM_CSV_CHUNK_SIZE,
+                                use_mmap: bool = False, encoding: str = "utf-8"):
+        """
+        Bulk mode: streams a SAM.gov Contract Opportunities CSV extract from local disk
+        instead of going through the rate-limited search API.
+        Yields records with the same fields as get_opportunities().
+        """
+        logger.info(f"Reading SAM.gov bulk extract: {path} (chunk_size={chunk_size}, mmap={use_mmap})")
+        return iter_sam_csv(path, chunk_size=chunk_size, use_mmap=use_mmap, encoding=encoding)
 
 class FederalRegisterConnector:
     """
     Mock connector for the Federal Register API.
     Simulates fetching government notices and funding opportunities.
     """
+    SUPPORTED_FILTERS = frozenset({FILTER_KEYWORD, FILTER_AGENCY, FILTER_DATE_RANGE})
+    SEARCH_FIELDS = ("title", "abstract", "agency")
+    FILTER_FIELDS = {FILTER_AGENCY: "agency", FILTER_DATE_RANGE: "publication_date"}
+
     def __init__(self):
         logger.info("Initializing FederalRegisterConnector (Mock Mode) - Prototype v1.0")
 
-    def get_documents(self, keywords: list) -> ConnectorResponse:
+    def get_documents(self, keywords: list, filters: dict = None) -> ConnectorResponse:
         """
         Simulates an API call to Federal Register.
+        Keywords and any SUPPORTED_FILTERS are evaluated at the source.
         In this research prototype, we return a fixed mock response associated with CHIPS Act/Semiconductors.
         """
-        logger.info(f"Querying Federal Register with keywords: {keywords}")
+        logger.info(f"Querying Federal Register with keywords: {keywords} filters: {filters}")
 
         # Mock Data 1 (Semiconductor) as per requirements
         mock_response = [
@@ -66,5 +144,15 @@ class FederalRegisterConnector:
                 "type": "Notice of Funding Opportunity"
             }
         ]
-        return mock_response
+        return apply_filters(mock_response, keywords, filters, self.SEARCH_FIELDS, self.FILTER_FIELDS)
 
+    def iter_bulk_documents(self, path: str):
+        """
+        Bulk mode: streams every document from a daily Federal Register bulk file
+        on local disk (XML or JSON) instead of issuing keyword queries.
+        Yields records in the same shape as get_documents().
+        """
+        logger.info(f"Reading Federal Register bulk file: {path}")
+        if path.lower().endswith(".xml"):
+            return iter_federal_register_xml(path)
+        return iter_federal_register_json(path)
@@ -0,0 +1,135 @@
+"""
+GovSignal Delta Sync Module
+Forwards only what changed since the last emission, so each scout cycle does not re-send
+the same signals for the same opportunities to the ERP.
+
+For every (document, category) fingerprint the tracker remembers the probability and
+action it last emitted. A signal passes when it is new, when its probability moved more
+than epsilon away from the last emitted value, or when its action changed. Every passing
+signal is also written to a compact JSONL change log.
+
+The scout stages each batch's changes and commits them only after its sinks accepted the
+batch, so a failing sink never marks signals as sent.
+
+    delta_sync:
+      enabled: true
+      state_path: "output/delta_state.json"
+      changelog_path: "output/changes.jsonl"
+      epsilon: 0.05
+"""
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+CHANGE_NEW = "new"
+CHANGE_ACTION = "action"
+CHANGE_PROBABILITY = "probability"
+
+
+class DeltaTracker:
+    """
+    Last-emitted state per signal fingerprint: {fingerprint: [probability, action, last_seen]}.
+    Fingerprints not seen for retention_days are forgotten (and count as new if they return).
+    State persists to state_path as JSON.
+    """
+
+    def __init__(self, epsilon: float = 0.05, state_path: str = None, changelog_path: str = None,
+                 retention_days: int = 90):
+        self.epsilon = epsilon
+        self.state_path = state_path
+        self.changelog_path = changelog_path
+        self.retention_days = retention_days
+        self.state = {}
+        self._staged = {}         # fingerprint -> record, applied to state on commit()
+        self._staged_entries = []
+
+        if changelog_path and os.path.dirname(changelog_path):
+            os.makedirs(os.path.dirname(changelog_path), exist_ok=True)
+        if state_path and os.path.exists(state_path):
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.state_path, 'r') as f:
+                self.state = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable delta state {self.state_path}: {e}")
+
+    def _previous(self, fingerprint):
+        return self._staged.get(fingerprint) or self.state.get(fingerprint)
+
+    def classify(self, signal: dict):
+        """The signal's change type relative to the last emission, or None when unchanged."""
+        previous = self._previous(signal.get("fingerprint"))
+        if previous is None:
+            return CHANGE_NEW
+        probability, action = previous[0], previous[1]
+        if signal.get("erp_action_recommendation") != action:
+            return CHANGE_ACTION
+        if abs(signal.get("demand_probability", 0.0) - probability) > self.epsilon:
+            return CHANGE_PROBABILITY
+        return None
+
+    def filter(self, signals: list, commit: bool = True) -> list:
+        """
+        Returns the signals that changed, records them as emitted and appends them to the
+        change log. With commit=False the changes are only staged until commit() (or
+        dropped by discard()).
+        """
+        now = datetime.now().isoformat()
+        changed = []
+        for signal in signals:
+            fingerprint = signal.get("fingerprint")
+            if fingerprint is None:
+                # Signals without a fingerprint cannot be tracked: always forward them
+                changed.append(signal)
+                continue
+            change = self.classify(signal)
+            previous = self._previous(fingerprint)
+            if change is None:
+                previous[2] = now
+                continue
+            self._staged_entries.append({
+                "timestamp": now,
+                "signal_id": signal.get("signal_id"),
+                "fingerprint": fingerprint,
+                "change": change,
+                "from": previous[:2] if previous else None,
+                "to": [signal.get("demand_probability"), signal.get("erp_action_recommendation")],
+            })
+            self._staged[fingerprint] = [signal.get("demand_probability"), signal.get("erp_action_recommendation"), now]
+            changed.append(signal)
+
+        logger.info(f"Delta sync: {len(changed)} of {len(signals)} signals changed")
+        if commit:
+            self.commit()
+        return changed
+
+    def commit(self):
+        """Records the staged changes as emitted and appends them to the change log."""
+        self.state.update(self._staged)
+        if self.changelog_path and self._staged_entries:
+            with open(self.changelog_path, 'a') as f:
+                for entry in self._staged_entries:
+                    f.write(json.dumps(entry) + "\n")
+        self.discard()
+
+    def discard(self):
+        """Drops the staged changes: those signals count as changed again next time."""
+        self._staged = {}
+        self._staged_entries = []
+
+    def save(self):
+        """Drops expired fingerprints and atomically persists the state."""
+        if self.retention_days:
+            cutoff = (datetime.now() - timedelta(days=self.retention_days)).isoformat()
+            self.state = {k: v for k, v in self.state.items() if v[2] >= cutoff}
+        if not self.state_path:
+            return
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.state, f)
+        os.replace(tmp_path, self.state_path)
@@ -0,0 +1,312 @@
+"""
+GovSignal ERP Delivery Module
+Network sink that delivers signals to an ERP HTTP endpoint (SAP middleware, Oracle
+Fusion, ...) through a durable on-disk outbox.
+
+emit() only appends to the outbox (a local SQLite write), so slow ERP endpoints never
+block scoring. Background workers claim due batches, POST them as JSON arrays over
+pooled keep-alive connections, and retry failures with exponential backoff. Entries
+are deduplicated by signal_id, both while pending and after delivery. Delivery is
+at-least-once: a crash between a successful POST and its acknowledgement re-sends that
+batch, which the ERP side deduplicates by the payload's signal_id idempotency key.
+
+    sinks:
+      - type: erp_http
+        url: "https://erp.example.com/govsignal/triggers"
+        outbox_path: "output/erp_outbox.db"
+"""
+import http.client
+import json
+import logging
+import os
+import queue
+import random
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit
+
+from .sap_export import SapPayloadMapper, compile_validator, load_schema
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    signal_id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox (status, next_attempt);
+CREATE TABLE IF NOT EXISTS delivered (
+    signal_id TEXT PRIMARY KEY,
+    delivered_at REAL NOT NULL
+);
+"""
+DELIVERED_RETENTION_SECONDS = 30 * 24 * 3600
+
+
+class Outbox:
+    """
+    Durable SQLite queue of pending ERP payloads keyed by signal_id.
+    Workers claim batches under a lease; a claim that is never acknowledged (e.g. the
+    process crashed) becomes due again when its lease expires.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(OUTBOX_SCHEMA)
+        self.prune()
+
+    def enqueue(self, payloads: list) -> int:
+        """Adds payloads not already pending or delivered; returns how many were added."""
+        now = time.time()
+        with self._lock:
+            before = self.conn.total_changes
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO outbox (signal_id, payload, next_attempt) "
+                "SELECT ?, ?, ? WHERE NOT EXISTS (SELECT 1 FROM delivered WHERE signal_id = ?)",
+                [(p["signal_id"], json.dumps(p), now, p["signal_id"]) for p in payloads],
+            )
+            self.conn.execute("COMMIT")
+            return self.conn.total_changes - before
+
+    def claim(self, batch_size: int, lease_seconds: float) -> list:
+        """Leases up to batch_size due payloads; returns [(signal_id, payload, attempts)]."""
+        now = time.time()
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            rows = self.conn.execute(
+                "SELECT signal_id, payload, attempts FROM outbox WHERE status = 'pending' AND next_attempt <= ? "
+                "ORDER BY next_attempt LIMIT ?", (now, batch_size)).fetchall()
+            self.conn.executemany("UPDATE outbox SET next_attempt = ? WHERE signal_id = ?",
+                                  [(now + lease_seconds, row[0]) for row in rows])
+            self.conn.execute("COMMIT")
+        return [(row[0], json.loads(row[1]), row[2]) for row in rows]
+
+    def ack(self, signal_ids: list):
+        """Marks payloads delivered: removes them from the outbox and remembers their ids."""
+        now = time.time()
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.executemany("DELETE FROM outbox WHERE signal_id = ?", [(i,) for i in signal_ids])
+            self.conn.executemany("INSERT OR REPLACE INTO delivered (signal_id, delivered_at) VALUES (?, ?)",
+                                  [(i, now) for i in signal_ids])
+            self.conn.execute("COMMIT")
+
+    def fail(self, entries: list, error: str, retry_at: dict = None):
+        """
+        Records a failed attempt. Entries with a time in retry_at are rescheduled;
+        the rest are parked as 'dead' for manual inspection.
+        """
+        retry_at = retry_at or {}
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            for signal_id, _, attempts in entries:
+                if signal_id in retry_at:
+                    self.conn.execute(
+                        "UPDATE outbox SET attempts = ?, next_attempt = ?, last_error = ? WHERE signal_id = ?",
+                        (attempts + 1, retry_at[signal_id], error, signal_id))
+                else:
+                    self.conn.execute(
+                        "UPDATE outbox SET attempts = ?, status = 'dead', last_error = ? WHERE signal_id = ?",
+                        (attempts + 1, error, signal_id))
+            self.conn.execute("COMMIT")
+
+    def counts(self) -> dict:
+        with self._lock:
+            rows = self.conn.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall()
+            delivered = self.conn.execute("SELECT COUNT(*) FROM delivered").fetchone()[0]
+        counts = {"pending": 0, "dead": 0, "delivered": delivered}
+        counts.update(dict(rows))
+        return counts
+
+    def next_due(self):
+        """Earliest next_attempt among pending payloads, or None when nothing is pending."""
+        with self._lock:
+            return self.conn.execute(
+                "SELECT MIN(next_attempt) FROM outbox WHERE status = 'pending'").fetchone()[0]
+
+    def prune(self, retention_seconds: float = DELIVERED_RETENTION_SECONDS):
+        """Forgets delivered ids older than the retention window to bound the dedup table."""
+        with self._lock:
+            self.conn.execute("DELETE FROM delivered WHERE delivered_at < ?", (time.time() - retention_seconds,))
+
+    def close(self):
+        self.conn.close()
+
+
+class ConnectionPool:
+    """Fixed-size pool of keep-alive HTTP(S) connections to one host."""
+
+    def __init__(self, url: str, size: int = 2, timeout: float = 60.0):
+        parts = urlsplit(url)
+        self.path = parts.path or "/"
+        if parts.query:
+            self.path += f"?{parts.query}"
+        connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self._factory = lambda: connection_class(parts.hostname, parts.port, timeout=timeout)
+        # None slots are created lazily; get() blocks once `size` connections are in use
+        self._slots = queue.LifoQueue(maxsize=size)
+        for _ in range(size):
+            self._slots.put(None)
+
+    def post(self, body: bytes, headers: dict):
+        """POSTs body on a pooled connection; returns (status, response body)."""
+        conn = self._slots.get() or self._factory()
+        try:
+            conn.request("POST", self.path, body=body, headers=headers)
+            response = conn.getresponse()
+            data = response.read()  # drain fully so the connection can be reused
+        except Exception:
+            conn.close()
+            self._slots.put(None)
+            raise
+        if response.will_close:
+            conn.close()
+            conn = None
+        self._slots.put(conn)
+        return response.status, data
+
+    def close(self):
+        while not self._slots.empty():
+            conn = self._slots.get_nowait()
+            if conn is not None:
+                conn.close()
+
+
+class ErpHttpSink:
+    """
+    Sink that enqueues signals into a durable outbox and delivers them in bulk batches
+    from background worker threads. payload_format 'sap' sends schema-validated
+    integration/sap_payload_schema.json payloads; 'signal' sends signals unchanged.
+    workers=0 disables background delivery (use deliver_pending() to drain).
+    """
+
+    def __init__(self, url: str, outbox_path: str, payload_format: str = "signal", batch_size: int = 100,
+                 pool_size: int = 2, workers: int = 2, timeout: float = 60.0, max_attempts: int = 8,
+                 base_backoff: float = 1.0, max_backoff: float = 300.0, headers: dict = None,
+                 drain_timeout: float = 10.0):
+        self.outbox = Outbox(outbox_path)
+        self.pool = ConnectionPool(url, size=pool_size, timeout=timeout)
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.lease_seconds = timeout * 2
+        self.drain_timeout = drain_timeout
+        self.headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+        self.headers.update(headers or {})
+
+        if payload_format == "sap":
+            schema = load_schema()
+            self.mapper = SapPayloadMapper(schema)
+            self.validate = compile_validator(schema)
+        elif payload_format == "signal":
+            self.mapper = None
+        else:
+            raise ValueError(f"Unknown payload_format: {payload_format}")
+
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._threads = [threading.Thread(target=self._worker, name=f"erp-delivery-{i}", daemon=True)
+                         for i in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def emit(self, signals: list):
+        payloads = []
+        for signal in signals:
+            if self.mapper is None:
+                payloads.append(signal)
+                continue
+            payload = self.mapper.map(signal)
+            if self.validate(payload):
+                logger.debug(f"Signal {signal.get('signal_id')} not mappable to the SAP payload schema")
+                continue
+            payloads.append(payload)
+        added = self.outbox.enqueue(payloads)
+        logger.info(f"ERP outbox: queued {added} of {len(signals)} signals")
+        self._wake.set()
+
+    def _backoff(self, attempts: int) -> float:
+        # Exponential backoff with full jitter
+        return random.uniform(0, min(self.max_backoff, self.base_backoff * (2 ** attempts)))
+
+    def _deliver(self, batch: list):
+        body = json.dumps([payload for _, payload, _ in batch]).encode("utf-8")
+        try:
+            status, _ = self.pool.post(body, self.headers)
+        except Exception as e:
+            status, error = None, f"{type(e).__name__}: {e}"
+        else:
+            error = f"HTTP {status}"
+
+        if status is not None and 200 <= status < 300:
+            self.outbox.ack([signal_id for signal_id, _, _ in batch])
+            return True
+
+        # Client errors other than throttling will not succeed on retry
+        retryable = status is None or status == 429 or status >= 500
+        now = time.time()
+        retry_at = {
+            signal_id: now + self._backoff(attempts)
+            for signal_id, _, attempts in batch
+            if retryable and attempts + 1 < self.max_attempts
+        }
+        self.outbox.fail(batch, error, retry_at)
+        logger.warning(f"ERP delivery of {len(batch)} payloads failed ({error}); {len(retry_at)} will be retried")
+        return False
+
+    def deliver_pending(self) -> int:
+        """
+        Synchronously delivers due batches until the outbox is drained or a batch fails;
+        returns payloads acknowledged.
+        """
+        delivered = 0
+        while True:
+            batch = self.outbox.claim(self.batch_size, self.lease_seconds)
+            if not batch or not self._deliver(batch):
+                return delivered
+            delivered += len(batch)
+
+    def _worker(self):
+        while not self._stop.is_set():
+            batch = self.outbox.claim(self.batch_size, self.lease_seconds)
+            if batch:
+                self._deliver(batch)
+                continue
+            next_due = self.outbox.next_due()
+            wait = 1.0 if next_due is None else max(0.0, min(1.0, next_due - time.time()))
+            self._wake.wait(wait)
+            self._wake.clear()
+
+    def close(self):
+        """Gives in-flight deliveries up to drain_timeout, then stops; undelivered payloads stay in the outbox."""
+        deadline = time.time() + self.drain_timeout
+        while self._threads and time.time() < deadline:
+            next_due = self.outbox.next_due()
+            if next_due is None or next_due > deadline:
+                break
+            time.sleep(0.05)
+        self._stop.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(max(0, deadline - time.time()))
+        stuck = [thread.name for thread in self._threads if thread.is_alive()]
+        if stuck:
+            # Leave the pool and outbox open under the daemon workers; their leased
+            # payloads are redelivered once the lease expires
+            logger.warning(f"ERP delivery workers still busy after drain_timeout: {', '.join(stuck)}")
+            return
+        self.pool.close()
+        self.outbox.close()
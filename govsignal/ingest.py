@@ -0,0 +1,164 @@
+"""
+GovSignal Push Ingestion Module
+Bounded queue for documents that partners push to us (see POST /ingest in
+govsignal.service) instead of waiting to be polled.
+
+A single consumer thread drains the queue in batches through the scout's scoring stream
+and delivers the signals with ProcurementScout.emit(), exactly like a polled cycle
+(delta sync, rollups, top-K and sinks all apply). Push traffic has no cycle end, so a
+top-K budget needs `period_seconds`; the consumer closes due periods even while idle. Backpressure is all-or-nothing: a push
+that does not fit in the remaining capacity is rejected as a whole, with a retry hint.
+
+    push_ingestion:
+      enabled: true
+      max_queue: 10000
+      batch_size: 100
+      max_wait_seconds: 0.5
+      retry_after_seconds: 5
+"""
+import logging
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+PUSH_SOURCE_NAME = "Push Ingestion"
+PUSH_TEXT_FIELDS = ("title", "description", "abstract")
+IDLE_TICK_SECONDS = 1.0
+
+
+class PushIngestor:
+    """
+    Bounded push queue feeding the scoring stream. offer() never blocks: it accepts a
+    whole batch of documents or rejects it when the queue lacks room.
+    """
+
+    def __init__(self, scout, max_queue: int = 10000, batch_size: int = 100, max_wait_seconds: float = 0.5,
+                 retry_after_seconds: int = 5, text_fields: tuple = PUSH_TEXT_FIELDS):
+        self.scout = scout
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self.retry_after_seconds = retry_after_seconds
+        self.text_fields = tuple(text_fields)
+        self._items = deque()  # (enqueued at, document)
+        self._cond = threading.Condition()
+        self._stopping = False
+        self.accepted = 0
+        self.rejected = 0
+        self.scored = 0
+        self.failed = 0
+        self.signals = 0
+        self.max_lag_seconds = 0.0
+        self._thread = threading.Thread(target=self._consume, name="push-ingestor", daemon=True)
+        self._thread.start()
+
+    @property
+    def depth(self) -> int:
+        return len(self._items)
+
+    def offer(self, documents: list, source_name: str = None) -> bool:
+        """Queues documents for scoring; returns False (nothing queued) when they do not fit."""
+        now = time.monotonic()
+        with self._cond:
+            if self._stopping or len(self._items) + len(documents) > self.max_queue:
+                self.rejected += len(documents)
+                return False
+            for document in documents:
+                # Pushed records name their partner in 'source'; otherwise the push endpoint's source
+                document.setdefault('source_name', source_name or document.get('source') or PUSH_SOURCE_NAME)
+                self._items.append((now, document))
+            self.accepted += len(documents)
+            self._cond.notify()
+        return True
+
+    def _next_batch(self):
+        """Next batch of queued items; [] after an idle tick, None once stopping and drained."""
+        with self._cond:
+            if not self._items and not self._stopping:
+                self._cond.wait(IDLE_TICK_SECONDS)
+            if not self._items:
+                return None if self._stopping else []
+            # Give a burst a moment to fill the batch, unless shutting down
+            deadline = time.monotonic() + self.max_wait_seconds
+            while len(self._items) < self.batch_size and not self._stopping:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            return [self._items.popleft() for _ in range(min(self.batch_size, len(self._items)))]
+
+    def _score(self, documents: list):
+        """Scores a batch; if it fails, rescores document by document and skips the bad ones. Returns (signals, failed)."""
+        try:
+            return list(self.scout.score_documents(documents, text_fields=self.text_fields)), 0
+        except Exception:
+            pass
+        signals, failed = [], 0
+        for document in documents:
+            try:
+                signals.extend(self.scout.score_documents([document], text_fields=self.text_fields))
+            except Exception as e:
+                failed += 1
+                logger.error(f"Push ingestion: skipping document {document.get('title')!r}: {e}")
+        return signals, failed
+
+    def _consume(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return  # stopping and drained
+            if batch:
+                self._process(batch)
+            try:
+                self.scout.flush_budget(due_only=True)
+            except Exception as e:
+                logger.error(f"Push ingestion: failed to deliver the top-K budget: {e}")
+
+    def _process(self, batch: list):
+        signals, failed = self._score([document for _, document in batch])
+        try:
+            self.scout.emit(signals)
+        except Exception as e:
+            logger.error(f"Push ingestion: failed to deliver {len(signals)} signals: {e}")
+            failed = len(batch)
+            signals = []
+        lag = time.monotonic() - batch[0][0]
+        with self._cond:
+            self.scored += len(batch) - failed
+            self.failed += failed
+            self.signals += len(signals)
+            self.max_lag_seconds = max(self.max_lag_seconds, lag)
+            self._cond.notify_all()
+
+    def wait_idle(self, timeout: float = None) -> bool:
+        """Blocks until every accepted document has been processed; returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self.scored + self.failed < self.accepted:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "queue_depth": len(self._items),
+                "max_queue": self.max_queue,
+                "accepted": self.accepted,
+                "rejected": self.rejected,
+                "scored": self.scored,
+                "failed": self.failed,
+                "signals": self.signals,
+                "max_lag_seconds": round(self.max_lag_seconds, 3),
+            }
+
+    def close(self):
+        """Stops accepting pushes, scores what is queued and stops the consumer."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join()
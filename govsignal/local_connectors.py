@@ -3,18 +3,32 @@ GovSignal Local Connectors Module
 Mocks data from State, Local, and Non-Profit sources for deeper supply chain signals.
 """
 import logging
-from .connectors import ConnectorResponse
+from .connectors import ConnectorResponse, FILTER_KEYWORD, apply_filters
 
 logger = logging.getLogger(__name__)
 
-# Base class or common util could go here, but for prototype we'll keep classes independent.
+class LocalConnector:
+    """
+    Common query interface for state/local/non-profit sources.
+    Subclasses implement _fetch(); keyword filters are pushed down here so only
+    matching records leave the connector.
+    """
+    SUPPORTED_FILTERS = frozenset({FILTER_KEYWORD})
+    SEARCH_FIELDS = ("title", "description")
+    FILTER_FIELDS = {}
+
+    def get_opportunities(self, keywords: list, filters: dict = None) -> ConnectorResponse:
+        return apply_filters(self._fetch(), keywords, filters, self.SEARCH_FIELDS, self.FILTER_FIELDS)
+
+    def _fetch(self) -> ConnectorResponse:
+        raise NotImplementedError
 
-class CaliforniaGoBizConnector:
+class CaliforniaGoBizConnector(LocalConnector):
     """
     Mock connector for California Governor's Office of Business and Economic Development.
     Target: Semiconductor grants.
     """
-    def get_opportunities(self, keywords: list) -> ConnectorResponse:
+    def _fetch(self) -> ConnectorResponse:
         logger.info("Querying CA GO-Biz")
         return [{
             "source": "CA GO-Biz",
@@ -23,12 +37,12 @@ class CaliforniaGoBizConnector:
             "url": "https://business.ca.gov/"
         }]
 
-class TexasEnterpriseFundConnector:
+class TexasEnterpriseFundConnector(LocalConnector):
     """
     Mock connector for Texas Enterprise Fund.
     Target: Defense manufacturing.
     """
-    def get_opportunities(self, keywords: list) -> ConnectorResponse:
+    def _fetch(self) -> ConnectorResponse:
         logger.info("Querying Texas TEF")
         return [{
             "source": "Texas TEF",
@@ -37,12 +51,12 @@ class TexasEnterpriseFundConnector:
             "url": "https://gov.texas.gov/business/page/texas-enterprise-fund"
         }]
 
-class NewYorkEmpireStateConnector:
+class NewYorkEmpireStateConnector(LocalConnector):
     """
     Mock connector for New York Empire State Development.
     Target: GlobalFoundries/Semiconductors.
     """
-    def get_opportunities(self, keywords: list) -> ConnectorResponse:
+    def _fetch(self) -> ConnectorResponse:
         logger.info("Querying NY ESD")
         return [{
             "source": "NY ESD",
@@ -51,12 +65,12 @@ class NewYorkEmpireStateConnector:
             "url": "https://esd.ny.gov/green-chips"
         }]
 
-class ArizonaCommerceConnector:
+class ArizonaCommerceConnector(LocalConnector):
     """
     Mock connector for Arizona Commerce Authority.
     Target: TSMC/Semiconductor supply chain.
     """
-    def get_opportunities(self, keywords: list) -> ConnectorResponse:
+    def _fetch(self) -> ConnectorResponse:
         logger.info("Querying AZ Commerce")
         return [{
             "source": "AZ Commerce",
@@ -65,12 +79,12 @@ class ArizonaCommerceConnector:
             "url": "https://www.azcommerce.com/"
         }]
 
-class OhioDevelopmentConnector:
+class OhioDevelopmentConnector(LocalConnector):
     """
     Mock connector for Ohio Department of Development.
     Target: Intel/Silicon Heartland.
     """
-    def get_opportunities(self, keywords: list) -> ConnectorResponse:
+    def _fetch(self) -> ConnectorResponse:
         logger.info("Querying Ohio Development")
         return [{
             "source": "Ohio Development",
@@ -79,12 +93,12 @@ class OhioDevelopmentConnector:
             "url": "https://development.ohio.gov/"
         }]
 
-class MassLifeSciencesConnector:
+class MassLifeSciencesConnector(LocalConnector):
     """
     Mock connector for Massachusetts Life Sciences Center.
     Target: Bio-Pharma manufacturing.
     """
-    def get_opportunities(self, keywords: list) -> ConnectorResponse:
+    def _fetch(self) -> ConnectorResponse:
         logger.info("Querying Mass Life Sciences")
         return [{
             "source": "Mass Life Sciences",
@@ -93,12 +107,12 @@ class MassLifeSciencesConnector:
             "url": "https://www.masslifesciences.com/"
         }]
 
-class FloridaDefenseConnector:
+class FloridaDefenseConnector(LocalConnector):
     """
     Mock connector for Florida Defense Support Task Force.
     Target: Aerospace & Simulation.
     """
-    def get_opportunities(self, keywords: list) -> ConnectorResponse:
+    def _fetch(self) -> ConnectorResponse:
         logger.info("Querying Florida Defense TF")
         return [{
             "source": "Florida Defense TF",
@@ -107,12 +121,12 @@ class FloridaDefenseConnector:
             "url": "https://www.enterpriseflorida.com/fdstf/"
         }]
 
-class VirginiaEconomicDevConnector:
+class VirginiaEconomicDevConnector(LocalConnector):
     """
     Mock connector for Virginia Economic Development Partnership.
     Target: Defense & Cybersecurity.
     """
-    def get_opportunities(self, keywords: list) -> ConnectorResponse:
+    def _fetch(self) -> ConnectorResponse:
         logger.info("Querying VEDP")
         return [{
             "source": "VEDP",
@@ -121,12 +135,12 @@ class VirginiaEconomicDevConnector:
             "url": "https://www.vedp.org/"
         }]
 
-class CityOfAustinConnector:
+class CityOfAustinConnector(LocalConnector):
     """
     Mock connector for City of Austin.
     Target: High-Tech/Software services.
     """
-    def get_opportunities(self, keywords: list) -> ConnectorResponse:
+    def _fetch(self) -> ConnectorResponse:
         logger.info("Querying City of Austin")
         return [{
             "source": "City of Austin",
@@ -135,12 +149,12 @@ class CityOfAustinConnector:
             "url": "https://www.austintexas.gov/financeonline/finance/index.cfm"
         }]
 
-class CityOfBostonConnector:
+class CityOfBostonConnector(LocalConnector):
     """
     Mock connector for City of Boston.
     Target: Bio-tech/Lab space.
     """
-    def get_opportunities(self, keywords: list) -> ConnectorResponse:
+    def _fetch(self) -> ConnectorResponse:
         logger.info("Querying City of Boston")
         return [{
             "source": "City of Boston",
@@ -149,12 +163,12 @@ class CityOfBostonConnector:
             "url": "https://www.boston.gov/departments/procurement"
         }]
 
-class WashingtonCommerceConnector:
+class WashingtonCommerceConnector(LocalConnector):
     """
     Mock connector for Washington State Dept of Commerce.
     Target: Aerospace (Boeing supply chain).
     """
-    def get_opportunities(self, keywords: list) -> ConnectorResponse:
+    def _fetch(self) -> ConnectorResponse:
         logger.info("Querying WA Commerce")
         return [{
             "source": "WA Commerce",
@@ -163,12 +177,12 @@ class WashingtonCommerceConnector:
             "url": "https://www.commerce.wa.gov/"
         }]
 
-class CityOfHuntsvilleConnector:
+class CityOfHuntsvilleConnector(LocalConnector):
     """
     Mock connector for City of Huntsville (Alabama).
     Target: Defense/Rocket Propulsion.
     """
-    def get_opportunities(self, keywords: list) -> ConnectorResponse:
+    def _fetch(self) -> ConnectorResponse:
         logger.info("Querying City of Huntsville")
         return [{
             "source": "City of Huntsville",
@@ -177,12 +191,12 @@ class CityOfHuntsvilleConnector:
             "url": "https://www.huntsvilleal.gov/business/bids-rfps/"
         }]
 
-class NorthCarolinaBiotechConnector:
+class NorthCarolinaBiotechConnector(LocalConnector):
     """
     Mock connector for North Carolina Biotechnology Center (Research Triangle).
     Target: Bio-Manufacturing.
     """
-    def get_opportunities(self, keywords: list) -> ConnectorResponse:
+    def _fetch(self) -> ConnectorResponse:
         logger.info("Querying NC Biotech")
         return [{
             "source": "NC Biotech",
@@ -191,12 +205,12 @@ class NorthCarolinaBiotechConnector:
             "url": "https://www.ncbiotech.org/funding"
         }]
 
-class PortAuthorityNYNJConnector:
+class PortAuthorityNYNJConnector(LocalConnector):
     """
     Mock connector for Port Authority of NY & NJ.
     Target: Logistics/Supply Chain.
     """
-    def get_opportunities(self, keywords: list) -> ConnectorResponse:
+    def _fetch(self) -> ConnectorResponse:
         logger.info("Querying Port Authority NYNJ")
         return [{
             "source": "PA NYNJ",
@@ -205,12 +219,12 @@ class PortAuthorityNYNJConnector:
             "url": "https://www.panynj.gov/port-authority/en/business-opportunities.html"
         }]
 
-class GeorgiaEconomicDevConnector:
+class GeorgiaEconomicDevConnector(LocalConnector):
     """
     Mock connector for Georgia Dept of Economic Development.
     Target: EV/Battery Manufacturing.
     """
-    def get_opportunities(self, keywords: list) -> ConnectorResponse:
+    def _fetch(self) -> ConnectorResponse:
         logger.info("Querying Georgia Economic Dev")
         return [{
             "source": "Georgia Eco Dev",
@@ -219,12 +233,12 @@ class GeorgiaEconomicDevConnector:
             "url": "https://www.georgia.org/industries/automotive"
         }]
 
-class MichiganEconomicDevConnector:
+class MichiganEconomicDevConnector(LocalConnector):
     """
     Mock connector for Michigan Economic Development Corp.
     Target: Defense/Auto Supply Chain.
     """
-    def get_opportunities(self, keywords: list) -> ConnectorResponse:
+    def _fetch(self) -> ConnectorResponse:
         logger.info("Querying Michigan MEDC")
         return [{
             "source": "Michigan MEDC",
@@ -233,12 +247,12 @@ class MichiganEconomicDevConnector:
             "url": "https://www.michiganbusiness.org/"
         }]
 
-class IndianaEconomicDevConnector:
+class IndianaEconomicDevConnector(LocalConnector):
     """
     Mock connector for Indiana Economic Development Corp.
     Target: Micro-electronics.
     """
-    def get_opportunities(self, keywords: list) -> ConnectorResponse:
+    def _fetch(self) -> ConnectorResponse:
         logger.info("Querying Indiana IEDC")
         return [{
             "source": "Indiana IEDC",
@@ -247,12 +261,12 @@ class IndianaEconomicDevConnector:
             "url": "https://iedc.in.gov/"
         }]
 
-class PennCommunityDevConnector:
+class PennCommunityDevConnector(LocalConnector):
     """
     Mock connector for Pennsylvania DCED.
     Target: Robotics & AI.
     """
-    def get_opportunities(self, keywords: list) -> ConnectorResponse:
+    def _fetch(self) -> ConnectorResponse:
         logger.info("Querying PA DCED")
         return [{
             "source": "PA DCED",
@@ -261,12 +275,12 @@ class PennCommunityDevConnector:
             "url": "https://dced.pa.gov/"
         }]
 
-class NationalGovernorsAssocConnector:
+class NationalGovernorsAssocConnector(LocalConnector):
     """
     Mock connector for National Governors Association.
     Target: Policy Signals.
     """
-    def get_opportunities(self, keywords: list) -> ConnectorResponse:
+    def _fetch(self) -> ConnectorResponse:
         logger.info("Querying NGA")
         return [{
             "source": "NGA",
@@ -275,12 +289,12 @@ class NationalGovernorsAssocConnector:
             "url": "https://www.nga.org/"
         }]
 
-class CouncilStateGovernmentsConnector:
+class CouncilStateGovernmentsConnector(LocalConnector):
     """
     Mock connector for Council of State Governments.
     Target: Interstate Compacts.
     """
-    def get_opportunities(self, keywords: list) -> ConnectorResponse:
+    def _fetch(self) -> ConnectorResponse:
         logger.info("Querying CSG")
         return [{
             "source": "CSG",
@@ -0,0 +1,230 @@
+"""
+GovSignal Matcher Module
+Multi-keyword substring matcher (Aho-Corasick) used by the scout's scoring stream.
+
+A single pass over a document finds every configured keyword it contains, so scoring
+cost no longer grows with (number of targets x number of keywords). Matching is
+equivalent to `keyword in text` on lowercased text, including overlapping matches.
+
+Compiled matchers can be saved as a versioned binary artifact and loaded memory-mapped,
+so short-lived scout runs skip the build step entirely (see load_or_compile).
+"""
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# Artifact layout: MAGIC | version (u32) | header length (u32) | JSON header | padding | arrays
+ARTIFACT_MAGIC = b"GSMATCH\0"
+ARTIFACT_VERSION = 1
+ARRAY_NAMES = ("edge_start", "edge_char", "edge_next", "fail", "out_start", "out_ids")
+
+
+class KeywordMatcher:
+    """
+    Compiled keyword automaton stored as flat integer arrays:
+      edge_start[s]..edge_start[s+1]  sorted outgoing edges of state s
+      edge_char / edge_next           edge label (code point) and target state
+      fail[s]                         failure link of state s
+      out_start[s]..out_start[s+1]    pattern ids recognized on entering state s
+      out_ids                         pattern ids
+    Flat arrays keep the automaton compact and independent of Python object layout.
+    """
+
+    def __init__(self, patterns: list, edge_start, edge_char, edge_next, fail, out_start, out_ids):
+        self.patterns = patterns
+        self.edge_start = edge_start
+        self.edge_char = edge_char
+        self.edge_next = edge_next
+        self.fail = fail
+        self.out_start = out_start
+        self.out_ids = out_ids
+
+    @classmethod
+    def compile(cls, patterns: list) -> "KeywordMatcher":
+        """Builds the automaton. Patterns are lowercased; pattern id = position in the list."""
+        patterns = [p.lower() for p in patterns]
+        goto = [{}]
+        outputs = [[]]
+        for pattern_id, pattern in enumerate(patterns):
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].append(pattern_id)
+
+        # Breadth-first failure links; each state inherits its fallback's outputs
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                outputs[nxt].extend(outputs[fail[nxt]])
+
+        edge_start, edge_char, edge_next = array('I'), array('I'), array('I')
+        out_start, out_ids = array('I'), array('I')
+        for state, edges in enumerate(goto):
+            edge_start.append(len(edge_char))
+            for ch in sorted(edges):
+                edge_char.append(ord(ch))
+                edge_next.append(edges[ch])
+            out_start.append(len(out_ids))
+            out_ids.extend(outputs[state])
+        edge_start.append(len(edge_char))
+        out_start.append(len(out_ids))
+        return cls(patterns, edge_start, edge_char, edge_next, array('I', fail), out_start, out_ids)
+
+    def _step(self, state: int, code: int) -> int:
+        edge_char = self.edge_char
+        while True:
+            lo, hi = self.edge_start[state], self.edge_start[state + 1]
+            i = bisect_left(edge_char, code, lo, hi)
+            if i < hi and edge_char[i] == code:
+                return self.edge_next[i]
+            if state == 0:
+                return 0
+            state = self.fail[state]
+
+    def scan(self, text: str) -> set:
+        """Returns the ids of all patterns occurring in text (case-insensitive)."""
+        out_start, out_ids = self.out_start, self.out_ids
+        # Empty patterns live on the root state and match any text
+        found = set(out_ids[out_start[0]:out_start[1]])
+        state = 0
+        for ch in text.lower():
+            state = self._step(state, ord(ch))
+            lo, hi = out_start[state], out_start[state + 1]
+            if lo != hi:
+                found.update(out_ids[lo:hi])
+        return found
+
+    def save(self, path: str, metadata: dict = None):
+        """Writes the automaton as a versioned binary artifact (atomic replace)."""
+        header = {
+            "byteorder": sys.byteorder,
+            "itemsize": self.edge_start.itemsize,
+            "patterns": self.patterns,
+            "metadata": metadata or {},
+            "arrays": {},
+        }
+        offset = 0
+        for name in ARRAY_NAMES:
+            count = len(getattr(self, name))
+            header["arrays"][name] = [offset, count]
+            offset += count * header["itemsize"]
+
+        header_bytes = json.dumps(header).encode("utf-8")
+        prefix_len = len(ARTIFACT_MAGIC) + 8 + len(header_bytes)
+        padding = (-prefix_len) % 8  # align array data for zero-copy casts
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(ARTIFACT_MAGIC)
+            f.write(struct.pack("<II", ARTIFACT_VERSION, len(header_bytes)))
+            f.write(header_bytes)
+            f.write(b"\0" * padding)
+            for name in ARRAY_NAMES:
+                f.write(getattr(self, name).tobytes())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str):
+        """
+        Memory-maps an artifact written by save(). The arrays are zero-copy views over the
+        mapping, so load time does not depend on automaton size.
+        Returns (matcher, metadata), or None if the file is not a compatible artifact.
+        """
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        prefix = len(ARTIFACT_MAGIC) + 8
+        if len(mm) < prefix or mm[:len(ARTIFACT_MAGIC)] != ARTIFACT_MAGIC:
+            mm.close()
+            return None
+        version, header_len = struct.unpack("<II", mm[len(ARTIFACT_MAGIC):prefix])
+        header = json.loads(mm[prefix:prefix + header_len].decode("utf-8")) if version == ARTIFACT_VERSION else None
+        if header is None or header["byteorder"] != sys.byteorder or header["itemsize"] != array('I').itemsize:
+            mm.close()
+            return None
+
+        data_start = prefix + header_len + (-(prefix + header_len)) % 8
+        view = memoryview(mm)
+        arrays = {}
+        for name in ARRAY_NAMES:
+            offset, count = header["arrays"][name]
+            start = data_start + offset
+            arrays[name] = view[start:start + count * header["itemsize"]].cast('I')
+        matcher = cls(header["patterns"], **arrays)
+        matcher._mmap = mm  # keep the mapping alive as long as the matcher
+        return matcher, header["metadata"]
+
+
+def compile_groups(groups: dict):
+    """
+    Compiles named keyword groups into one matcher.
+    Returns (matcher, {group: [pattern ids]}); duplicate keywords share one pattern id.
+    """
+    patterns = []
+    pattern_ids = {}
+    group_ids = {}
+    for group, keywords in groups.items():
+        ids = []
+        for keyword in keywords:
+            key = keyword.lower()
+            if key not in pattern_ids:
+                pattern_ids[key] = len(patterns)
+                patterns.append(key)
+            ids.append(pattern_ids[key])
+        group_ids[group] = ids
+    return KeywordMatcher.compile(patterns), group_ids
+
+
+def groups_hash(groups: dict) -> str:
+    """Stable hash of the keyword groups (and artifact format) used to key cached artifacts."""
+    canonical = json.dumps({"version": ARTIFACT_VERSION, "groups": groups}, sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def load_or_compile(groups: dict, cache_dir: str = None):
+    """
+    Returns (matcher, {group: [pattern ids]}) for the keyword groups.
+    With a cache_dir, a previously saved artifact for the same groups hash is loaded
+    memory-mapped; otherwise the matcher is compiled and saved for the next run.
+    """
+    if not cache_dir:
+        return compile_groups(groups)
+
+    digest = groups_hash(groups)
+    path = os.path.join(cache_dir, f"matcher-{digest[:16]}.bin")
+    if os.path.exists(path):
+        try:
+            loaded = KeywordMatcher.load(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable matcher artifact {path}: {e}")
+            loaded = None
+        if loaded and loaded[1].get("hash") == digest:
+            logger.debug(f"Loaded matcher artifact {path}")
+            return loaded[0], loaded[1]["group_ids"]
+
+    matcher, group_ids = compile_groups(groups)
+    os.makedirs(cache_dir, exist_ok=True)
+    matcher.save(path, {"hash": digest, "group_ids": group_ids})
+    logger.info(f"Compiled matcher artifact {path} ({len(matcher.patterns)} patterns)")
+    return matcher, group_ids
@@ -0,0 +1,34 @@
+"""
+GovSignal Ontology Module
+Loads the critical asset ontology (data/critical_asset_ontology.yaml) used for
+asset-level pattern matching.
+"""
+import logging
+import os
+import yaml
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ONTOLOGY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data",
+                                     "critical_asset_ontology.yaml")
+
+
+def load_ontology(path: str = DEFAULT_ONTOLOGY_PATH) -> list:
+    """
+    Returns the ontology as a flat list of asset dicts, each tagged with the
+    ontology section it came from (e.g. 'defense_assets').
+    A missing ontology file yields an empty list.
+    """
+    if not os.path.exists(path):
+        logger.warning(f"Asset ontology not found: {path}")
+        return []
+    with open(path, 'r') as f:
+        data = yaml.safe_load(f) or {}
+
+    assets = []
+    for section, entries in data.items():
+        for entry in entries or []:
+            asset = dict(entry)
+            asset['section'] = section
+            assets.append(asset)
+    return assets
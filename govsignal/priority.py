@@ -0,0 +1,143 @@
+"""
+GovSignal Priority Module
+Bounded top-K emission: keeps review queues manageable during high-volume events.
+
+For each group (by default category and asset) only the K highest-probability signals
+are emitted in full, in descending priority order. The rest of each group is collapsed
+into one bulk summary signal. Memory per group is a size-K heap plus a constant-size
+summary, however many signals a cycle produces. Actions outside `actions` bypass the
+budget entirely.
+
+The budget spans a whole period, not a single emit() call: batched streams (bulk scans,
+backfills, push ingestion) accumulate into the same heaps. A period ends when a polled
+cycle or stream completes, when period_seconds have passed since its first signal, or
+at shutdown.
+
+    top_k:
+      enabled: true
+      k: 20
+      group_by: ["target_category", "asset_implication"]
+      actions: ["flag_for_review"]
+      period_seconds: 3600   # resident service / push ingestion
+"""
+import hashlib
+import heapq
+import time
+from datetime import datetime
+
+DEFAULT_GROUP_BY = ("target_category", "asset_implication")
+
+
+class _TailSummary:
+    """Constant-size running summary of the signals that did not make a group's top K."""
+    __slots__ = ("count", "total", "maximum", "actions")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.actions = {}
+
+    def add(self, signal: dict):
+        probability = signal.get("demand_probability", 0.0)
+        action = signal.get("erp_action_recommendation")
+        self.count += 1
+        self.total += probability
+        self.maximum = max(self.maximum, probability)
+        self.actions[action] = self.actions.get(action, 0) + 1
+
+
+class TopKSelector:
+    """
+    Selects the K highest demand_probability signals per group. add() streams signals in;
+    drain() returns the kept signals in priority order, then signals that bypass the
+    budget, then one summary per group with a tail, and resets for the next period;
+    peek() returns the same without resetting.
+    """
+
+    def __init__(self, k: int = 20, group_by: tuple = DEFAULT_GROUP_BY, actions: list = None,
+                 period_seconds: float = None, clock=time.monotonic):
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        self.k = k
+        self.group_by = tuple(group_by)
+        self.actions = set(actions) if actions else None
+        self.period_seconds = period_seconds
+        self.clock = clock
+        self._reset()
+
+    def _reset(self):
+        self.heaps = {}      # group -> min-heap of (probability, seq, signal)
+        self.tails = {}      # group -> _TailSummary
+        self.passthrough = []
+        self._seq = 0
+        self.opened_at = None  # clock() at the period's first signal
+
+    @property
+    def pending(self) -> bool:
+        return bool(self.heaps or self.passthrough)
+
+    def due(self) -> bool:
+        """True when the period has signals and lasted period_seconds (never without a period)."""
+        return (self.period_seconds is not None and self.opened_at is not None
+                and self.clock() - self.opened_at >= self.period_seconds)
+
+    def add(self, signal: dict):
+        if self.opened_at is None:
+            self.opened_at = self.clock()
+        if self.actions is not None and signal.get("erp_action_recommendation") not in self.actions:
+            self.passthrough.append(signal)
+            return
+        group = tuple(signal.get(field) for field in self.group_by)
+        heap = self.heaps.setdefault(group, [])
+        self._seq += 1
+        # Among equal probabilities the earlier signal ranks higher
+        entry = (signal.get("demand_probability", 0.0), -self._seq, signal)
+        if len(heap) < self.k:
+            heapq.heappush(heap, entry)
+            return
+        if entry[:2] > heap[0][:2]:
+            entry = heapq.heapreplace(heap, entry)
+        self.tails.setdefault(group, _TailSummary()).add(entry[2])
+
+    def peek(self) -> list:
+        """Kept signals (highest probability first), then bypassed signals, then tail summaries."""
+        kept = [entry for heap in self.heaps.values() for entry in heap]
+        kept.sort(key=lambda entry: entry[:2], reverse=True)
+        ranked = [entry[2] for entry in kept]
+        summaries = [self._summary(group, tail) for group, tail in self.tails.items()]
+        return ranked + list(self.passthrough) + summaries
+
+    def drain(self) -> list:
+        """peek(), then resets for the next period."""
+        selected = self.peek()
+        self._reset()
+        return selected
+
+    def select(self, signals: list) -> list:
+        """One-shot selection: adds signals and drains."""
+        for signal in signals:
+            self.add(signal)
+        return self.drain()
+
+    def _summary(self, group: tuple, tail: _TailSummary) -> dict:
+        fields = dict(zip(self.group_by, group))
+        label = " / ".join(str(value) for value in group)
+        now = datetime.now()
+        summary = {
+            "signal_id": f"SUM-{int(now.timestamp())}-{hashlib.sha1(label.encode('utf-8')).hexdigest()[:8]}",
+            "timestamp": now.isoformat(),
+            "source": "Top-K overflow",
+            "detected_event": f"{tail.count} lower-priority signals beyond top {self.k} ({label})",
+            "demand_probability": tail.maximum,
+            "target_category": fields.get("target_category"),
+            "asset_implication": fields.get("asset_implication"),
+            "erp_action_recommendation": "monitor",
+            "raw_snippet": "...",
+            "summary": True,
+            "signal_count": tail.count,
+            "avg_probability": round(tail.total / tail.count, 4),
+            "action_counts": tail.actions,
+        }
+        summary.update(fields)
+        return summary
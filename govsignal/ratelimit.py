@@ -0,0 +1,35 @@
+"""
+GovSignal Rate Limiting Module
+Per-host request throttling shared by parallel fetchers (see OPEN_ISSUES #4).
+"""
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket: allows `rate` acquisitions per second with bursts of
+    up to `burst`. Callers reserve a token under the lock and sleep outside it, so
+    waiting threads never block each other's bookkeeping.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Blocks until a request may be sent; returns the time spent waiting."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
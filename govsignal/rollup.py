@@ -0,0 +1,174 @@
+"""
+GovSignal Rollup Module
+Aggregates signals about the same asset and category over time windows, so many weak
+signals become one ERP action that carries its evidence.
+
+Windows are aligned to multiples of slide_seconds. Tumbling windows are the default
+(slide == window). Sliding windows are assembled from window/slide panes. Each
+(asset, category) key keeps a fixed ring of pane aggregates:
+- count
+- sum of log(1 - p)
+- max probability
+- up to max_evidence strongest signals
+Per-key state is therefore constant whatever the signal volume. Keys are expired in one
+pass when time crosses a pane boundary.
+
+The combined probability is a noisy-OR over the window, 1 - prod(1 - p), capped at
+max_probability. Repeats of an unchanged signal would inflate it. Enable delta_sync so
+that only new and changed signals are rolled up.
+
+    rollup:
+      enabled: true
+      window_seconds: 3600
+      slide_seconds: 900
+      max_evidence: 10
+"""
+import hashlib
+import heapq
+import math
+import time
+from datetime import datetime
+
+# Keeps log(1 - p) finite for p == 1.0
+MIN_COMPLEMENT = 1e-9
+
+
+def _epoch(signal: dict) -> float:
+    try:
+        return datetime.fromisoformat(signal["timestamp"]).timestamp()
+    except (KeyError, TypeError, ValueError):
+        return time.time()
+
+
+class _KeyWindow:
+    """Ring of pane aggregates for one (asset, category) key."""
+    __slots__ = ("last_pane", "counts", "log_complements", "maxima", "evidence")
+
+    def __init__(self, panes: int):
+        self.last_pane = None
+        self.counts = [0] * panes
+        self.log_complements = [0.0] * panes
+        self.maxima = [0.0] * panes
+        self.evidence = [[] for _ in range(panes)]  # min-heaps of (probability, seq, summary)
+
+    def add(self, pane: int, probability: float, summary: dict, seq: int, max_evidence: int):
+        panes = len(self.counts)
+        if self.last_pane is None or pane > self.last_pane:
+            # Reset ring slots for the panes entered since the last signal
+            first = pane - panes + 1 if self.last_pane is None else max(self.last_pane + 1, pane - panes + 1)
+            for p in range(first, pane + 1):
+                slot = p % panes
+                self.counts[slot] = 0
+                self.log_complements[slot] = 0.0
+                self.maxima[slot] = 0.0
+                self.evidence[slot] = []
+            self.last_pane = pane
+
+        slot = pane % panes
+        self.counts[slot] += 1
+        self.log_complements[slot] += math.log(max(1.0 - probability, MIN_COMPLEMENT))
+        self.maxima[slot] = max(self.maxima[slot], probability)
+        heap = self.evidence[slot]
+        if len(heap) < max_evidence:
+            heapq.heappush(heap, (probability, seq, summary))
+        elif probability > heap[0][0]:
+            heapq.heapreplace(heap, (probability, seq, summary))
+
+
+class WindowedRollup:
+    """
+    Incremental per-(asset, category) rollup. add() and advance() return the aggregated
+    signals of windows that closed; each key emits once per closed pane in which it
+    received signals. action_for maps the combined probability to an ERP action.
+    """
+
+    def __init__(self, action_for, window_seconds: int = 3600, slide_seconds: int = None,
+                 max_evidence: int = 10, max_probability: float = 0.95):
+        self.slide_seconds = slide_seconds or window_seconds
+        if window_seconds % self.slide_seconds:
+            raise ValueError("window_seconds must be a multiple of slide_seconds")
+        self.window_seconds = window_seconds
+        self.panes = window_seconds // self.slide_seconds
+        self.action_for = action_for
+        self.max_evidence = max_evidence
+        self.max_probability = max_probability
+        self.current = None  # index of the open pane
+        self.keys = {}
+        self._seq = 0
+
+    def add(self, signal: dict) -> list:
+        closed = self.advance(_epoch(signal))
+        # Late signals are folded into the open pane
+        pane = self.current
+        key = (signal.get("asset_implication"), signal.get("target_category"))
+        state = self.keys.get(key)
+        if state is None:
+            state = self.keys[key] = _KeyWindow(self.panes)
+        self._seq += 1
+        summary = {
+            "signal_id": signal.get("signal_id"),
+            "source": signal.get("source"),
+            "detected_event": signal.get("detected_event"),
+            "demand_probability": signal.get("demand_probability", 0.0),
+        }
+        state.add(pane, signal.get("demand_probability", 0.0), summary, self._seq, self.max_evidence)
+        return closed
+
+    def add_many(self, signals: list, now: float = None) -> list:
+        """Adds signals in order, then advances to `now`; returns every window closed on the way."""
+        closed = []
+        for signal in signals:
+            closed.extend(self.add(signal))
+        closed.extend(self.advance(time.time() if now is None else now))
+        return closed
+
+    def advance(self, now: float) -> list:
+        """Moves the clock to `now`, emitting windows that end at crossed pane boundaries and expiring idle keys."""
+        pane = int(now // self.slide_seconds)
+        if self.current is None:
+            self.current = pane
+            return []
+        if pane <= self.current:
+            return []
+        closed = [self._aggregate(key, state) for key, state in self.keys.items() if state.last_pane == self.current]
+        self.current = pane
+        self.keys = {key: state for key, state in self.keys.items() if state.last_pane > pane - self.panes}
+        return closed
+
+    def flush(self) -> list:
+        """Emits the open windows of keys with unemitted signals (e.g. at shutdown) and clears all state."""
+        closed = [self._aggregate(key, state) for key, state in self.keys.items() if state.last_pane == self.current]
+        self.keys = {}
+        return closed
+
+    def _aggregate(self, key: tuple, state: _KeyWindow) -> dict:
+        asset, category = key
+        end_pane = state.last_pane
+        window_end = (end_pane + 1) * self.slide_seconds
+        window_start = window_end - self.window_seconds
+        count = sum(state.counts)
+        probability = min(self.max_probability, 1.0 - math.exp(sum(state.log_complements)))
+        evidence = heapq.nlargest(self.max_evidence, (entry for heap in state.evidence for entry in heap))
+        fingerprint = hashlib.sha1(f"{asset}|{category}".encode("utf-8")).hexdigest()[:16]
+        # The aggregate keeps the dominant evidence source (ties go to the strongest signal),
+        # so ERP mappers keyed on the source (e.g. SAP federal_source) accept it
+        sources = [e[2]["source"] for e in evidence if e[2]["source"]]
+        source = max(sources, key=sources.count) if sources else "Rollup"
+
+        return {
+            "signal_id": f"AGG-{int(window_end)}-{(category or '')[:3].upper()}-{fingerprint[:8]}",
+            "timestamp": datetime.fromtimestamp(window_end).isoformat(),
+            "source": source,
+            "detected_event": f"{count} signals on {asset} ({category})",
+            "demand_probability": round(probability, 2),
+            "target_category": category,
+            "asset_implication": asset,
+            "erp_action_recommendation": self.action_for(probability),
+            "raw_snippet": "; ".join(e[2]["detected_event"] or "" for e in evidence)[:200] + "...",
+            "fingerprint": fingerprint,
+            "window_start": datetime.fromtimestamp(window_start).isoformat(),
+            "window_end": datetime.fromtimestamp(window_end).isoformat(),
+            "signal_count": count,
+            "max_probability": max(state.maxima),
+            "evidence": [e[2] for e in evidence],
+        }
@@ -0,0 +1,127 @@
+"""
+GovSignal Routing Module
+Maps surveillance target categories to the sources that can plausibly produce
+relevant documents, so the scout's cycle planner can skip source x category
+pairs that never yield a signal.
+"""
+import json
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+# Words too generic to indicate a domain ("Defense manufacturing" vs "Bio-Pharma manufacturing")
+DOMAIN_STOPWORDS = frozenset({
+    "and", "the", "for", "of", "grants", "grant", "manufacturing", "supply", "chain",
+    "services", "signals", "space", "high", "tech", "lab",
+})
+MIN_STEM_LENGTH = 4
+
+
+def connector_domain(connector):
+    """
+    Returns the domain a connector declares, from a TARGET_DOMAIN attribute or the
+    'Target:' line of its class docstring. None means a broad source (e.g. SAM.gov).
+    """
+    domain = getattr(connector, "TARGET_DOMAIN", None)
+    if domain:
+        return domain
+    for line in (type(connector).__doc__ or "").splitlines():
+        line = line.strip()
+        if line.startswith("Target:"):
+            return line[len("Target:"):].strip().rstrip(".")
+    return None
+
+
+def _stems(text: str) -> set:
+    """Lowercase word stems used for fuzzy domain overlap ('Semiconductors' ~ 'semiconductor')."""
+    stems = set()
+    for word in re.split(r"[^a-z]+", text.lower()):
+        if len(word) < MIN_STEM_LENGTH or word in DOMAIN_STOPWORDS:
+            continue
+        stems.add(word[:-1] if word.endswith("s") else word)
+    return stems
+
+
+def _overlaps(a: set, b: set) -> bool:
+    return any(x.startswith(y) or y.startswith(x) for x in a for y in b)
+
+
+class SourceRoutingIndex:
+    """
+    Category -> source routing index.
+    A pair is routed when connector metadata says it is plausible, until enough cycles
+    have been observed; from then on historical hit rates decide. Pairs that are not
+    routed are still re-probed every explore_every cycles so a source whose content
+    drifts can earn its way back in.
+    State (cycle counter and per-pair observations/hits) persists to state_path as JSON.
+    """
+
+    def __init__(self, targets: dict, sources: dict, min_observations: int = 5,
+                 explore_every: int = 10, min_hit_rate: float = 0.0, state_path: str = None):
+        self.min_observations = min_observations
+        self.explore_every = explore_every
+        self.min_hit_rate = min_hit_rate
+        self.state_path = state_path
+        self.cycle = 0
+        self.stats = {}  # "source|category" -> [observations, hits]
+
+        # Static prior from metadata: {category: {source: plausible}}
+        self.index = {}
+        for category, criteria in targets.items():
+            vocabulary = _stems(" ".join([category.replace("_", " "), criteria.get('related_asset', '')]
+                                         + list(criteria.get('keywords', []))))
+            self.index[category] = {
+                source: domain is None or _overlaps(_stems(domain), vocabulary)
+                for source, domain in sources.items()
+            }
+
+        if state_path and os.path.exists(state_path):
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.state_path, 'r') as f:
+                state = json.load(f)
+            self.cycle = state.get('cycle', 0)
+            self.stats = state.get('stats', {})
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable routing state {self.state_path}: {e}")
+
+    def save(self):
+        """Atomically persists learned hit rates."""
+        if not self.state_path:
+            return
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({"cycle": self.cycle, "stats": self.stats}, f)
+        os.replace(tmp_path, self.state_path)
+
+    def routes(self, source: str, category: str) -> bool:
+        """Whether the current cycle should evaluate this source x category pair."""
+        if self.explore_every and self.cycle % self.explore_every == 0:
+            return True
+        observations, hits = self.stats.get(f"{source}|{category}", (0, 0))
+        if observations >= self.min_observations:
+            return hits > 0 and hits / observations > self.min_hit_rate
+        return self.index.get(category, {}).get(source, True)
+
+    def plan(self) -> dict:
+        """Starts a new cycle and returns {source: [categories to evaluate]}; sources with none are omitted."""
+        self.cycle += 1
+        plan = {}
+        for category, sources in self.index.items():
+            for source in sources:
+                if self.routes(source, category):
+                    plan.setdefault(source, []).append(category)
+        skipped = sum(len(s) for s in self.index.values()) - sum(len(c) for c in plan.values())
+        logger.info(f"Routing cycle {self.cycle}: skipping {skipped} source x category pairs")
+        return plan
+
+    def record(self, source: str, category: str, hit: bool):
+        """Records the outcome of evaluating a pair in the current cycle."""
+        entry = self.stats.setdefault(f"{source}|{category}", [0, 0])
+        entry[0] += 1
+        if hit:
+            entry[1] += 1
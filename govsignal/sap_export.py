@@ -0,0 +1,273 @@
+"""
+GovSignal SAP Export Module
+Maps scout signals to the procurement-trigger payload defined in
+integration/sap_payload_schema.json and writes them as batched IDoc-style flat files.
+
+Everything that does not depend on the individual signal is prepared once: enum lookup
+tables, schema constants and a compiled validator. Per-payload work is a handful of dict
+lookups, so throughput holds at thousands of payloads per minute. Usable as a sink:
+
+    sinks:
+      - type: sap_idoc
+        directory: "output/idoc"
+        max_records: 1000
+        max_age_seconds: 60
+"""
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCHEMA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "integration",
+                                   "sap_payload_schema.json")
+
+# Scout action -> custom Z-transaction code
+ACTION_TO_TCODE = {
+    "release_capital_hold": "RELEASE_BLOCK_Z1",
+    "flag_for_review": "BLOCK_REVIEW_Z3",
+    "monitor": "UPDATE_SS_Z2",
+}
+# Scout source name -> federal_source enum
+SOURCE_TO_FEDERAL = {
+    "SAM.gov": "SAM_GOV",
+    "Federal Register": "FEDERAL_REGISTER",
+}
+# Lowercase fragments of free-text asset names -> detected_asset enum (first match wins)
+ASSET_RULES = (
+    (("twt", "traveling wave"), "TWT_Amplifier"),
+    (("vacuum",), "Vacuum_Chamber_UHV"),
+    (("ingaas",), "InGaAs_Sensor"),
+)
+
+# IDoc flat-file layout: segment name + fixed-width fields in payload order
+IDOC_MESSAGE_TYPE = "ZGOVSIG"
+IDOC_BASIC_TYPE = "ZGOVSIG01"
+IDOC_SEGMENT = "Z1GOVSIG"
+IDOC_FIELDS = (
+    ("signal_id", 40),
+    ("sap_bapi_transaction_code", 20),
+    ("sap_doc_type", 4),
+    ("sap_purch_org", 4),
+    ("sap_company_code", 4),
+    ("detected_asset", 20),
+    ("federal_source", 20),
+    ("confidence_score", 6),
+)
+
+
+def load_schema(path: str = DEFAULT_SCHEMA_PATH) -> dict:
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def compile_validator(schema: dict):
+    """
+    Compiles the schema's property rules (type, const, enum, minimum, maximum) into a
+    list of checks once; the returned function validates a payload and returns a list of
+    error strings (empty when valid).
+    """
+    type_checks = {
+        "string": lambda v: isinstance(v, str),
+        "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    }
+    checks = []
+    for name, rules in schema.get("properties", {}).items():
+        if "type" in rules:
+            checks.append((name, type_checks[rules["type"]], f"must be of type {rules['type']}"))
+        if "const" in rules:
+            checks.append((name, lambda v, c=rules["const"]: v == c, f"must equal {rules['const']!r}"))
+        if "enum" in rules:
+            checks.append((name, lambda v, e=frozenset(rules["enum"]): v in e, f"must be one of {rules['enum']}"))
+        if "minimum" in rules:
+            checks.append((name, lambda v, m=rules["minimum"]: v >= m, f"must be >= {rules['minimum']}"))
+        if "maximum" in rules:
+            checks.append((name, lambda v, m=rules["maximum"]: v <= m, f"must be <= {rules['maximum']}"))
+    required = tuple(schema.get("required", ()))
+
+    def validate(payload: dict) -> list:
+        errors = [f"{name} is required" for name in required if name not in payload]
+        failed = None
+        for name, check, message in checks:
+            # Absent optional properties are valid; after one failure a property's other rules are skipped
+            if name == failed or name not in payload:
+                continue
+            if not check(payload[name]):
+                errors.append(f"{name} {message}")
+                failed = name
+        return errors
+
+    return validate
+
+
+class SapPayloadMapper:
+    """Maps signals to schema payloads using lookup tables prepared from the schema once."""
+
+    def __init__(self, schema: dict):
+        properties = schema["properties"]
+        # Schema constants (document type, purchasing org, company code) are stamped on every payload
+        self.constants = {name: rules["const"] for name, rules in properties.items()
+                          if "const" in rules and not name.startswith("_")}
+        for table, prop in ((ACTION_TO_TCODE, "sap_bapi_transaction_code"), (SOURCE_TO_FEDERAL, "federal_source")):
+            unknown = set(table.values()) - set(properties[prop]["enum"])
+            if unknown:
+                raise ValueError(f"Mapping uses values not allowed by schema {prop}: {unknown}")
+        self._asset_cache = {}
+
+    def _asset_code(self, asset_name: str):
+        # Free-text asset names repeat across signals: resolve each distinct name once
+        if asset_name not in self._asset_cache:
+            lowered = str(asset_name or "").lower()
+            self._asset_cache[asset_name] = next(
+                (code for fragments, code in ASSET_RULES if any(f in lowered for f in fragments)), None)
+        return self._asset_cache[asset_name]
+
+    def map(self, signal: dict) -> dict:
+        source = SOURCE_TO_FEDERAL.get(signal.get("source"))
+        if source == "FEDERAL_REGISTER" and "chips act" in str(signal.get("detected_event") or "").lower():
+            source = "CHIPS_ACT"
+        payload = {
+            "signal_id": signal.get("signal_id"),
+            "sap_bapi_transaction_code": ACTION_TO_TCODE.get(signal.get("erp_action_recommendation")),
+            "detected_asset": self._asset_code(signal.get("asset_implication")),
+            "federal_source": source,
+            "confidence_score": signal.get("demand_probability"),
+        }
+        payload.update(self.constants)
+        return payload
+
+
+class IDocFileWriter:
+    """
+    Buffers IDoc records and flushes them to one flat file per batch when the batch
+    reaches max_records or max_bytes, or when it is older than max_age_seconds. The age
+    limit is enforced by a timer, so a partial batch is written even when no more
+    payloads arrive (resident service, push ingestion). Files are written under a
+    temporary name and renamed, so middleware polling the directory never sees a
+    partial batch.
+    """
+
+    def __init__(self, directory: str, max_records: int = 1000, max_bytes: int = 4 * 1024 * 1024,
+                 max_age_seconds: float = 60.0):
+        self.directory = directory
+        self.max_records = max_records
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        os.makedirs(directory, exist_ok=True)
+        self._lines = []
+        self._bytes = 0
+        self._opened_at = None
+        self._sequence = 0
+        self._lock = threading.RLock()
+        self._timer = None
+
+    @staticmethod
+    def format_record(payload: dict) -> str:
+        values = []
+        for name, width in IDOC_FIELDS:
+            value = payload.get(name, "")
+            if isinstance(value, float):
+                value = f"{value:.4f}"
+            values.append(str(value)[:width].ljust(width))
+        return IDOC_SEGMENT.ljust(30) + "".join(values)
+
+    def write(self, payloads: list):
+        with self._lock:
+            for payload in payloads:
+                line = self.format_record(payload)
+                if self._opened_at is None:
+                    self._opened_at = time.monotonic()
+                self._lines.append(line)
+                self._bytes += len(line) + 1
+                if len(self._lines) >= self.max_records or self._bytes >= self.max_bytes:
+                    self.flush()
+            if self._opened_at is not None and time.monotonic() - self._opened_at >= self.max_age_seconds:
+                self.flush()
+            if self._opened_at is not None and self._timer is None:
+                self._arm_timer(self.max_age_seconds - (time.monotonic() - self._opened_at))
+
+    def _arm_timer(self, delay: float):
+        self._timer = threading.Timer(max(delay, 0.0), self._flush_if_due)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _flush_if_due(self):
+        with self._lock:
+            self._timer = None
+            if self._opened_at is None:
+                return
+            remaining = self.max_age_seconds - (time.monotonic() - self._opened_at)
+            if remaining > 0:
+                # A newer batch opened after this timer was armed
+                self._arm_timer(remaining)
+                return
+            try:
+                self.flush()
+            except OSError as e:
+                logger.error(f"IDoc age flush failed, retrying in {self.max_age_seconds}s: {e}")
+                self._arm_timer(self.max_age_seconds)
+
+    def flush(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            return self._write_batch()
+
+    def _write_batch(self):
+        if not self._lines:
+            return None
+        self._sequence += 1
+        stamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        docnum = f"{stamp}{self._sequence:06d}"
+        control = ("EDI_DC40".ljust(10) + docnum.ljust(20) + IDOC_MESSAGE_TYPE.ljust(30)
+                   + IDOC_BASIC_TYPE.ljust(30) + str(len(self._lines)).rjust(8, "0"))
+        path = os.path.join(self.directory, f"GOVSIG_{docnum}.idoc")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(control + "\n")
+            f.write("\n".join(self._lines) + "\n")
+        os.replace(tmp_path, path)
+        logger.info(f"Wrote IDoc batch {path} ({len(self._lines)} records)")
+
+        self._lines = []
+        self._bytes = 0
+        self._opened_at = None
+        return path
+
+
+class SapIDocSink:
+    """Sink: maps, validates and writes signals as batched IDoc flat files."""
+
+    def __init__(self, directory: str, schema_path: str = DEFAULT_SCHEMA_PATH, max_records: int = 1000,
+                 max_bytes: int = 4 * 1024 * 1024, max_age_seconds: float = 60.0):
+        schema = load_schema(schema_path)
+        self.mapper = SapPayloadMapper(schema)
+        self.validate = compile_validator(schema)
+        self.writer = IDocFileWriter(directory, max_records, max_bytes, max_age_seconds)
+        self.rejected = 0
+
+    def to_payloads(self, signals: list) -> list:
+        """Maps signals to payloads, dropping (and counting) those that fail validation."""
+        payloads = []
+        for signal in signals:
+            payload = self.mapper.map(signal)
+            errors = self.validate(payload)
+            if errors:
+                self.rejected += 1
+                logger.debug(f"Rejected signal {signal.get('signal_id')} for SAP export: {errors}")
+                continue
+            payloads.append(payload)
+        return payloads
+
+    def emit(self, signals: list):
+        payloads = self.to_payloads(signals)
+        self.writer.write(payloads)
+        if len(payloads) < len(signals):
+            logger.info(f"SAP export: {len(signals) - len(payloads)} signals not mappable to the payload schema")
+
+    def close(self):
+        self.writer.flush()
@@ -1,8 +1,21 @@
-import json
+import hashlib
 import logging
+import threading
 import yaml
 from datetime import datetime
-from .connectors import SamGovConnector, FederalRegisterConnector, ConnectorResponse
+from .codes import CodeIndex, asset_categories, extract_codes
+from .connectors import (
+    SamGovConnector, FederalRegisterConnector, ConnectorResponse,
+    FILTER_KEYWORD, FILTER_NAICS, FILTER_AGENCY, FILTER_DATE_RANGE, apply_filters, matches_filters
+)
+from .delta import DeltaTracker
+from .matcher import load_or_compile
+from .priority import TopKSelector
+from .rollup import WindowedRollup
+from .ontology import load_ontology, DEFAULT_ONTOLOGY_PATH
+from .routing import SourceRoutingIndex, connector_domain
+from .trending import TrendingTerms
+from .sinks import StdoutSink, build_sinks
 from .local_connectors import (
     CaliforniaGoBizConnector, TexasEnterpriseFundConnector, NewYorkEmpireStateConnector,
     ArizonaCommerceConnector, OhioDevelopmentConnector, MassLifeSciencesConnector,
@@ -17,6 +30,9 @@ from .local_connectors import (
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Guards the one-time SemanticMatcher construction (scouts may skip __init__ in tests)
+_SEMANTIC_BUILD_LOCK = threading.Lock()
+
 class ProcurementScout:
     """
     Strategic Procurement Agent (The Scout).
@@ -29,6 +45,11 @@ class ProcurementScout:
     MAX_PROBABILITY = 0.95
     BASE_SCORE = 0.4
 
+    # Action thresholds; overridable per config under `thresholds:`
+    RELEASE_THRESHOLD = 0.8       # >= -> release_capital_hold
+    REVIEW_THRESHOLD = 0.5        # >  -> flag_for_review
+    MIN_SIGNAL_PROBABILITY = 0.1  # >  -> emit a signal at all
+
     def __init__(self, config_path: str):
         self.config = self._load_config(config_path)
         self.sam_connector = SamGovConnector()
@@ -59,11 +80,13 @@ class ProcurementScout:
         }
         
         self.active_local_connectors = []
+        self.active_local_keys = []
         enabled_sources = self.config.get('enabled_local_sources', [])
         for source_key in enabled_sources:
             if source_key in self.local_connector_map:
                 logger.info(f"Activating local source: {source_key}")
                 self.active_local_connectors.append(self.local_connector_map[source_key]())
+                self.active_local_keys.append(source_key)
             else:
                 logger.warning(f"Unknown local source key: {source_key}")
         
@@ -71,6 +94,81 @@ class ProcurementScout:
         self.targets = self.config.get('surveillance_targets', {})
         logger.info(f"Scout initialized with targets: {list(self.targets.keys())}")
 
+        thresholds = self.config.get('thresholds') or {}
+        self.RELEASE_THRESHOLD = thresholds.get('release_capital_hold', self.RELEASE_THRESHOLD)
+        self.REVIEW_THRESHOLD = thresholds.get('flag_for_review', self.REVIEW_THRESHOLD)
+        self.MIN_SIGNAL_PROBABILITY = thresholds.get('min_probability', self.MIN_SIGNAL_PROBABILITY)
+        self.sinks = build_sinks(self.config.get('sinks'))
+
+        # Optional category -> source routing index used by the cycle planner
+        self.router = self._build_router(self.config.get('routing') or {})
+
+        # Optional delta sync: only changed signals reach the sinks
+        delta_config = self.config.get('delta_sync') or {}
+        self.delta = DeltaTracker(
+            epsilon=delta_config.get('epsilon', 0.05),
+            state_path=delta_config.get('state_path'),
+            changelog_path=delta_config.get('changelog_path'),
+            retention_days=delta_config.get('retention_days', 90),
+        ) if delta_config.get('enabled', False) else None
+
+        # Optional per-asset windowed rollup: sinks receive one aggregated signal per window
+        rollup_config = self.config.get('rollup') or {}
+        self.rollup = WindowedRollup(
+            self._action_for,
+            window_seconds=rollup_config.get('window_seconds', 3600),
+            slide_seconds=rollup_config.get('slide_seconds'),
+            max_evidence=rollup_config.get('max_evidence', 10),
+            max_probability=self.MAX_PROBABILITY,
+        ) if rollup_config.get('enabled', False) else None
+
+        # Optional review budget: top K signals per group in priority order, the tail summarized.
+        # The budget spans a cycle or stream (see flush_budget), or period_seconds when resident.
+        top_k_config = self.config.get('top_k') or {}
+        self.top_k = TopKSelector(
+            k=top_k_config.get('k', 20),
+            group_by=top_k_config.get('group_by', ("target_category", "asset_implication")),
+            actions=top_k_config.get('actions'),
+            period_seconds=top_k_config.get('period_seconds'),
+        ) if top_k_config.get('enabled', False) else None
+
+        # Optional trending-term detector over every scored document
+        trending_config = self.config.get('trending') or {}
+        self.trending = TrendingTerms(
+            window_seconds=trending_config.get('window_seconds', 86400),
+            width=trending_config.get('width', 2048),
+            depth=trending_config.get('depth', 4),
+            top_terms=trending_config.get('top_terms', 200),
+            history=trending_config.get('history', 3),
+            min_count=trending_config.get('min_count', 5),
+            min_growth=trending_config.get('min_growth', 3.0),
+            known_terms=[k for criteria in self.targets.values() for k in criteria.get('keywords', [])],
+            state_path=trending_config.get('state_path'),
+        ) if trending_config.get('enabled', False) else None
+
+    def _sources(self) -> list:
+        """Every active source: (source key, connector, fetch method, display name, scored text fields)."""
+        sources = [
+            ("SAM_GOV", self.sam_connector, self.sam_connector.get_opportunities, "SAM.gov", ("description",)),
+            ("FEDERAL_REGISTER", self.fr_connector, self.fr_connector.get_documents, "Federal Register", ("abstract",)),
+        ]
+        for source_key, connector in zip(self.active_local_keys, self.active_local_connectors):
+            # Local records carry their own display name in 'source'
+            sources.append((source_key, connector, connector.get_opportunities, None, ("title", "description")))
+        return sources
+
+    def _build_router(self, routing_config: dict):
+        if not routing_config.get('enabled', False):
+            return None
+        domains = {source_key: connector_domain(connector) for source_key, connector, *_ in self._sources()}
+        return SourceRoutingIndex(
+            self.targets, domains,
+            min_observations=routing_config.get('min_observations', 5),
+            explore_every=routing_config.get('explore_every', 10),
+            min_hit_rate=routing_config.get('min_hit_rate', 0.0),
+            state_path=routing_config.get('state_path'),
+        )
+
     def _load_config(self, path: str) -> dict:
         try:
             with open(path, 'r') as f:
@@ -92,7 +190,9 @@ class ProcurementScout:
                 match_count += 1
         
         logger.debug(f"Found {match_count} keyword matches.")
-        
+        return self._probability_from_matches(match_count)
+
+    def _probability_from_matches(self, match_count: int) -> float:
         # Simple heuristic: more matches = higher probability
         # Base score BASE_SCORE, +0.2 per keyword match, capped at MAX_PROBABILITY
         if match_count == 0:
@@ -102,6 +202,41 @@ class ProcurementScout:
         final_score = min(score, self.MAX_PROBABILITY)
         return min(final_score, 1.0) # Safety check
 
+    def _compiled_targets(self):
+        """
+        Returns (matcher, {category: keyword ids}) for the current targets.
+        The automaton also covers the asset ontology. With `matcher_cache_dir` configured it
+        is loaded memory-mapped from an artifact keyed by the keyword-set hash, so it is only
+        rebuilt when the targets or the ontology change.
+        """
+        signature = tuple((category, tuple(criteria.get('keywords', []))) for category, criteria in self.targets.items())
+        cached = getattr(self, '_target_matcher', None)
+        if cached is None or cached[0] != signature:
+            groups = {f"target:{category}": list(keywords) for category, keywords in signature}
+            for asset in load_ontology(self.config.get('ontology_path', DEFAULT_ONTOLOGY_PATH)):
+                groups[f"asset:{asset['name']}"] = list(asset.get('keywords', []))
+            matcher, group_ids = load_or_compile(groups, self.config.get('matcher_cache_dir'))
+
+            category_ids = {category: group_ids[f"target:{category}"] for category, _ in signature}
+            asset_ids = {group[len("asset:"):]: ids for group, ids in group_ids.items() if group.startswith("asset:")}
+            cached = (signature, matcher, category_ids, asset_ids)
+            self._target_matcher = cached
+        return cached[1], cached[2]
+
+    def detect_assets(self, text: str) -> list:
+        """Names of ontology assets whose keywords occur in the text."""
+        matcher, _ = self._compiled_targets()
+        matched = matcher.scan(text)
+        return [name for name, ids in self._target_matcher[3].items() if any(i in matched for i in ids)]
+
+    def _action_for(self, probability: float) -> str:
+        """Maps a probability to the recommended ERP action."""
+        if probability >= self.RELEASE_THRESHOLD:
+            return "release_capital_hold"
+        elif probability > self.REVIEW_THRESHOLD:
+            return "flag_for_review"
+        return "monitor"
+
     def _generate_signal(self, source_data: dict, target_category: str, probability: float) -> dict:
         """
         Generates the standardized JSON signal for ERP ingestion.
@@ -112,27 +247,294 @@ class ProcurementScout:
         target_info = self.targets.get(target_category, {})
         asset_name = target_info.get('related_asset', 'Unknown Asset')
         
-        # Logic to determine action based on probability
-        if probability >= 0.8:
-            action = "release_capital_hold"
-        elif probability > 0.5:
-            action = "flag_for_review"
-        else:
-            action = "monitor"
+        action = self._action_for(probability)
+
+        # Stable (document, category) fingerprint: keeps ids distinct for different documents
+        # scored in the same second (ERP idempotency keys) and identifies repeats across cycles
+        document_key = "|".join(str(source_data.get(field) or "") for field in
+                                ('source_name', 'noticeId', 'document_number', 'solicitationNumber', 'title'))
+        fingerprint = hashlib.sha1(f"{document_key}|{target_category}".encode("utf-8")).hexdigest()[:16]
 
         signal = {
-            "signal_id": f"SIG-{int(datetime.now().timestamp())}-{target_category[:3].upper()}",
+            "signal_id": f"SIG-{int(datetime.now().timestamp())}-{target_category[:3].upper()}-{fingerprint[:8]}",
             "timestamp": datetime.now().isoformat(),
             "source": source_data.get('source_name', 'Government Feed'),
             "detected_event": source_data.get('title', 'Unknown Event'),
             "demand_probability": round(probability, 2),
+            "target_category": target_category,
             "asset_implication": asset_name,
             "erp_action_recommendation": action,
-            "raw_snippet": source_data.get('description', source_data.get('abstract', ''))[:200] + "..."
+            "raw_snippet": str(source_data.get('description') or source_data.get('abstract') or "")[:200] + "...",
+            "fingerprint": fingerprint,
         }
         return signal
 
-    def run(self):
+    def _category_filters(self, criteria: dict) -> dict:
+        """Structured (non-keyword) filters a surveillance target declares in config."""
+        filters = {}
+        if criteria.get('naics_codes'):
+            filters[FILTER_NAICS] = [str(code) for code in criteria['naics_codes']]
+        if criteria.get('agencies'):
+            filters[FILTER_AGENCY] = list(criteria['agencies'])
+        return filters
+
+    def _build_query(self, posted_from: str = None, posted_to: str = None, categories: list = None):
+        """
+        Builds the single query sent to each source: the union of all targets' criteria
+        (restricted to `categories` when given).
+        Keywords are OR-ed across targets. A structured filter is only included when every
+        target constrains it, otherwise it would drop records another target still needs.
+        Returns (keywords, filters).
+        """
+        targets = [self.targets[c] for c in categories] if categories is not None else list(self.targets.values())
+        keywords = []
+        seen = set()
+        for criteria in targets:
+            for keyword in criteria.get('keywords', []):
+                if keyword.lower() not in seen:
+                    seen.add(keyword.lower())
+                    keywords.append(keyword)
+
+        filters = {}
+        per_target = [self._category_filters(c) for c in targets]
+        for name in (FILTER_NAICS, FILTER_AGENCY):
+            if per_target and all(name in f for f in per_target):
+                filters[name] = sorted({value for f in per_target for value in f[name]})
+        if posted_from or posted_to:
+            filters[FILTER_DATE_RANGE] = (posted_from, posted_to)
+        return keywords, filters
+
+    def _keyword_pushdown(self) -> bool:
+        """
+        Whether target keywords may be pushed to the sources. Code routing and semantic
+        matching score documents that contain no keyword, so with either enabled sources
+        must return them unfiltered.
+        """
+        return not any((self.config.get(feature) or {}).get('enabled', False)
+                       for feature in ('code_routing', 'semantic_matching'))
+
+    def _query_source(self, connector, fetch, keywords: list, filters: dict) -> ConnectorResponse:
+        """
+        Sends one query to a source, pushing down the filters the connector declares in
+        SUPPORTED_FILTERS and applying the rest client-side.
+        """
+        supported = getattr(connector, 'SUPPORTED_FILTERS', frozenset())
+        pushed_keywords = keywords if FILTER_KEYWORD in supported else []
+        pushed = {name: value for name, value in filters.items() if name in supported}
+        residual = {name: value for name, value in filters.items() if name not in supported}
+
+        records = fetch(pushed_keywords, pushed)
+        if residual:
+            records = apply_filters(records, [], residual, (), getattr(connector, 'FILTER_FIELDS', {}))
+        return records
+
+    def _code_routes(self):
+        """
+        (CodeIndex, {asset: [categories]}) when `code_routing` is enabled, else None.
+        Built once from the asset ontology and cached.
+        """
+        if not (self.config.get('code_routing') or {}).get('enabled', False):
+            return None
+        cached = getattr(self, '_code_router', None)
+        if cached is None:
+            assets = load_ontology(self.config.get('ontology_path', DEFAULT_ONTOLOGY_PATH))
+            cached = (CodeIndex(assets), asset_categories(self.targets, assets))
+            self._code_router = cached
+            logger.info(f"Code routing: {len(cached[0])} NAICS/PSC codes indexed")
+        return cached
+
+    def _semantic_matcher(self):
+        """
+        SemanticMatcher when `semantic_matching` is enabled, else None. Built once (loading
+        the persisted index) and re-synced with the current targets on every call, which only
+        re-embeds targets that changed. Safe to call from concurrent service threads.
+        """
+        cached = getattr(self, '_semantic', None)
+        if cached is None:
+            semantic_config = self.config.get('semantic_matching') or {}
+            if not semantic_config.get('enabled', False):
+                return None
+            with _SEMANTIC_BUILD_LOCK:
+                cached = getattr(self, '_semantic', None)
+                if cached is None:
+                    from .semantic import SemanticMatcher, shared_embedder
+                    embedder = shared_embedder(semantic_config['model_dir'], semantic_config.get('batch_size', 64))
+                    cached = SemanticMatcher(
+                        embedder,
+                        load_ontology(self.config.get('ontology_path', DEFAULT_ONTOLOGY_PATH)),
+                        index_dir=semantic_config.get('index_dir'),
+                        threshold=semantic_config.get('threshold', 0.55),
+                        weight=semantic_config.get('weight', 0.5),
+                        top_k=semantic_config.get('top_k', 5),
+                        batch_size=semantic_config.get('batch_size', 64),
+                    )
+                    self._semantic = cached
+        # No-op unless the targets changed; serialized inside the matcher
+        cached.sync(self.targets)
+        return cached
+
+    @staticmethod
+    def _document_text(item: dict, text_fields: tuple) -> str:
+        """Scored text of a document; missing, null and non-string fields are tolerated."""
+        return " ".join(str(item.get(field) or "") for field in text_fields)
+
+    def _semantic_stream(self, documents, text_fields: tuple, semantic=None):
+        """
+        Yields (document, text, {category: similarity}). With a SemanticMatcher, documents
+        are embedded in batches of batch_size; otherwise similarities are empty.
+        """
+        if semantic is None:
+            for item in documents:
+                yield item, self._document_text(item, text_fields), {}
+            return
+        batch = []
+        for item in documents:
+            batch.append(item)
+            if len(batch) >= semantic.batch_size:
+                yield from self._semantic_batch(semantic, batch, text_fields)
+                batch = []
+        yield from self._semantic_batch(semantic, batch, text_fields)
+
+    def _semantic_batch(self, semantic, batch: list, text_fields: tuple):
+        texts = [self._document_text(item, text_fields) for item in batch]
+        return zip(batch, texts, semantic.similarities(texts))
+
+    @staticmethod
+    def _category_evidence(matched: set, category_ids: dict, categories: list,
+                           asset_codes: dict = None, asset_links: dict = None) -> tuple:
+        """
+        ({category: match count}, {category: matched codes}) for one document, from the
+        keyword ids one automaton scan matched and, with code routing, the NAICS/PSC codes
+        CodeIndex.lookup() resolved to assets. Each distinct matching code counts as one
+        match; code evidence only adds categories or raises a count, it never replaces a
+        stronger keyword count.
+        """
+        scores = {category: sum(1 for i in category_ids[category] if i in matched) for category in categories}
+        codes = {}
+        for asset, matched_codes in (asset_codes or {}).items():
+            for category in asset_links.get(asset, ()):
+                if category in scores:
+                    codes.setdefault(category, set()).update(matched_codes)
+        for category, category_codes in codes.items():
+            scores[category] = max(scores[category], len(category_codes))
+        return scores, codes
+
+    def _document_signals(self, item: dict, scores: dict, codes: dict, similar: dict, semantic,
+                          source_name: str, filter_fields: dict, category_filters: dict):
+        """Yields (category, signal) for one document's evidence, applying this scout's filters and thresholds."""
+        for category, match_count in scores.items():
+            if filter_fields and not matches_filters(item, [], category_filters[category], (), filter_fields):
+                continue
+            prob = self._probability_from_matches(match_count)
+            if category in similar:
+                prob = semantic.blend(prob, similar[category], self.MAX_PROBABILITY)
+            # Only generate signal if probability is relevant (e.g. > 0.1)
+            if prob > self.MIN_SIGNAL_PROBABILITY:
+                # Ensure source_name is set
+                if source_name:
+                    item['source_name'] = source_name
+                elif 'source' in item and 'source_name' not in item:
+                    item['source_name'] = item['source']
+                signal = self._generate_signal(item, category, prob)
+                if category in codes:
+                    signal["matched_codes"] = sorted(codes[category])
+                if category in similar:
+                    signal["semantic_similarity"] = round(similar[category], 3)
+                yield category, signal
+
+    def _score_stream(self, documents, source_name: str = None, text_fields: tuple = ("title", "description"),
+                      filter_fields: dict = None, categories: list = None, observe_trending: bool = True):
+        """Yields (category, signal) pairs; see score_documents()."""
+        if categories is None:
+            categories = list(self.targets)
+        category_filters = {category: self._category_filters(self.targets[category]) for category in categories}
+        matcher, category_ids = self._compiled_targets()
+        trending = getattr(self, 'trending', None) if observe_trending else None
+        code_routes = self._code_routes()
+        semantic = self._semantic_matcher()
+        for item, text_content, similar in self._semantic_stream(documents, text_fields, semantic):
+            if trending:
+                trending.observe(text_content)
+            # One automaton pass finds every target keyword in the document
+            matched = matcher.scan(text_content)
+            asset_codes, asset_links = None, None
+            if code_routes:
+                index, asset_links = code_routes
+                asset_codes = index.lookup(*extract_codes(item, text_fields))
+            scores, codes = self._category_evidence(matched, category_ids, categories, asset_codes, asset_links)
+            yield from self._document_signals(item, scores, codes, similar, semantic, source_name,
+                                              filter_fields, category_filters)
+
+    def score_documents(self, documents, source_name: str = None, text_fields: tuple = ("title", "description"),
+                        filter_fields: dict = None, categories: list = None, observe_trending: bool = True):
+        """
+        Scoring stream: scores each document against every surveillance target (or only
+        `categories`) and yields signals as they are produced, so arbitrarily large inputs
+        are processed one document at a time.
+        Targets that declare structured filters (naics_codes, agencies) only score
+        documents passing them; filter_fields maps those filters to document fields.
+        observe_trending=False keeps the documents out of the trending-term detector.
+        """
+        for _, signal in self._score_stream(documents, source_name, text_fields, filter_fields, categories,
+                                            observe_trending):
+            yield signal
+
+    def scan_federal_register_bulk(self, path: str):
+        """
+        Bulk mode for the Federal Register: streams a daily bulk file from local disk
+        through the scoring stream instead of querying per category.
+        """
+        documents = self.fr_connector.iter_bulk_documents(path)
+        return self.score_documents(documents, "Federal Register", text_fields=("abstract",),
+                                    filter_fields=FederalRegisterConnector.FILTER_FIELDS)
+
+    def scan_sam_bulk(self, path: str, chunk_size: int = 1000, use_mmap: bool = False):
+        """
+        Bulk mode for SAM.gov: streams a Contract Opportunities CSV extract from local
+        disk through the scoring stream, bypassing the search API.
+        """
+        opportunities = self.sam_connector.iter_bulk_opportunities(path, chunk_size=chunk_size, use_mmap=use_mmap)
+        return self.score_documents(opportunities, "SAM.gov", text_fields=("description",),
+                                    filter_fields=SamGovConnector.FILTER_FIELDS)
+
+    def collect_signals(self, posted_from: str = None, posted_to: str = None) -> list:
+        """
+        One surveillance cycle: queries every source once with the union of its routed
+        targets' criteria, then scores the returned documents against those targets.
+        posted_from / posted_to (ISO dates) restrict the cycle to a publication window.
+        """
+        # Cycle planner: without a routing index every source is checked for every target
+        plan = self.router.plan() if self.router else None
+        all_signals = []
+
+        for source_key, connector, fetch, source_name, text_fields in self._sources():
+            categories = list(self.targets) if plan is None else plan.get(source_key, [])
+            if not categories:
+                logger.debug(f"Routing: skipping source {source_key}")
+                continue
+
+            keywords, filters = self._build_query(posted_from, posted_to, categories)
+            if not self._keyword_pushdown():
+                keywords = []
+            try:
+                records = self._query_source(connector, fetch, keywords, filters)
+                scored = list(self._score_stream(records, source_name, text_fields,
+                                                 connector.FILTER_FIELDS, categories))
+            except Exception as e:
+                logger.error(f"Error querying source {source_key}: {e}")
+                continue
+
+            all_signals.extend(signal for _, signal in scored)
+            if self.router:
+                hit_categories = {category for category, _ in scored}
+                for category in categories:
+                    self.router.record(source_key, category, category in hit_categories)
+
+        if self.router:
+            self.router.save()
+        return all_signals
+
+    def run(self) -> list:
         """
         Main execution loop.
         1. Fetch data from connectors.
@@ -140,68 +542,144 @@ class ProcurementScout:
         3. Emit signals.
         """
         logger.info("Starting Scout surveillance cycle...")
-        all_signals = []
+        all_signals = self.collect_signals()
+        emitted = self.emit(all_signals) + self.flush_budget()
+        self.report_trending()
+        logger.info(f"Surveillance cycle complete. Generated {len(all_signals)} signals, emitted {len(emitted)}.")
+        return all_signals
 
-        # 1. Process SAM.gov Data (Defense Use Case)
-        # We look for "Defense" related keywords defined in config logic, 
-        # but for this prototype we iterate our known targets.
-        
-        for category, criteria in self.targets.items():
-            keywords = criteria.get('keywords', [])
-            
-            # Query Connectors (In a real app, we'd optimize these calls)
-            sam_opportunities = self.sam_connector.get_opportunities(keywords)
-            fr_documents = self.fr_connector.get_documents(keywords)
-
-            # Analyze SAM data
-            for item in sam_opportunities:
-                # Mocking a match check - normally we'd check if the item ACTUALLY matches the category
-                # For the prototype, we assume the connector returned relevant data for the "Defense" case
-                description_lower = item.get('description', '').lower()
-                if category == "Defense_Systems" and "jamming" in description_lower:
-                    item['source_name'] = "SAM.gov"
-                    prob = self._calculate_probability(item['description'], keywords)
-                    signal = self._generate_signal(item, category, prob)
-                    all_signals.append(signal)
-
-            # Analyze Federal Register data
-            for item in fr_documents:
-                abstract_lower = item.get('abstract', '').lower()
-                # Basic domain filter for prototype
-                if category == "Semiconductors" and "nanofabrication" in abstract_lower:
-                    item['source_name'] = "Federal Register"
-                    prob = self._calculate_probability(item['abstract'], keywords)
-                    signal = self._generate_signal(item, category, prob)
-                    all_signals.append(signal)
-
-            # Analyze Local Sources
-            for connector in self.active_local_connectors:
-                try:
-                    # Mock connectors take keywords and return relevant mocks
-                    local_opps = connector.get_opportunities(keywords)
-                    for item in local_opps:
-                        # Normalize text for scoring
-                        text_content = f"{item.get('title', '')} {item.get('description', '')}"
-                        prob = self._calculate_probability(text_content, keywords)
-                        
-                        # Only generate signal if probability is relevant (e.g. > 0.1)
-                        if prob > 0.1:
-                            # Ensure source_name is set
-                            if 'source' in item and 'source_name' not in item:
-                                item['source_name'] = item['source']
-                            
-                            signal = self._generate_signal(item, category, prob)
-                            all_signals.append(signal)
-                except Exception as e:
-                    logger.error(f"Error querying local source {connector}: {e}")
-
-        # Output results
-        print(json.dumps(all_signals, indent=2))
-        logger.info(f"Surveillance cycle complete. Generated {len(all_signals)} signals.")
+    def emit_stream(self, signals, batch_size: int = 500) -> int:
+        """
+        Delivers a signal stream through emit() in batches of batch_size; the whole stream
+        is one top-K budget period. Returns the number emitted.
+        """
+        batch, emitted = [], 0
+        for signal in signals:
+            batch.append(signal)
+            if len(batch) >= batch_size:
+                emitted += len(self.emit(batch))
+                batch = []
+        if batch:
+            emitted += len(self.emit(batch))
+        return emitted + len(self.flush_budget())
+
+    def report_trending(self):
+        """Writes the trending-term candidates and persists the detector state, when enabled."""
+        if getattr(self, 'trending', None):
+            self.trending.report((self.config.get('trending') or {}).get('candidates_path'))
+            self.trending.save()
+
+    def emit(self, signals: list) -> list:
+        """
+        Delivers signals to every sink; returns those sent. With delta sync only changed
+        signals pass, and with rollups enabled the sinks receive the windows that closed.
+        With a top-K budget, signals are held until the budget period ends (flush_budget(),
+        or period_seconds elapsed); the sinks then receive the top signals per group plus
+        tail summaries.
+        """
+        delta = getattr(self, 'delta', None)
+        if delta:
+            # Changes are recorded as sent only once the sinks accepted them
+            signals = delta.filter(signals, commit=False)
+        try:
+            rollup = getattr(self, 'rollup', None)
+            if rollup:
+                signals = rollup.add_many(signals)
+            top_k = getattr(self, 'top_k', None)
+            if top_k:
+                for signal in signals:
+                    top_k.add(signal)
+                signals = self.flush_budget(due_only=True)
+            else:
+                self._deliver(signals)
+        except Exception:
+            if delta:
+                delta.discard()
+            raise
+        if delta:
+            delta.commit()
+            delta.save()
+        return signals
+
+    def flush_budget(self, due_only: bool = False) -> list:
+        """
+        Ends the top-K budget period: delivers the kept signals and tail summaries to the
+        sinks and returns them. With due_only, only once period_seconds have elapsed. If a
+        sink fails, the period stays open and is delivered by the next flush.
+        """
+        top_k = getattr(self, 'top_k', None)
+        if not top_k or not top_k.pending or (due_only and not top_k.due()):
+            return []
+        signals = top_k.peek()
+        self._deliver(signals)
+        top_k.drain()
+        return signals
+
+    def _deliver(self, signals: list):
+        for sink in self.sinks:
+            sink.emit(signals)
+
+    def close(self):
+        """
+        Flushes open rollup windows and the top-K budget, then flushes and closes the
+        configured sinks (e.g. partially filled IDoc batches).
+        """
+        rollup = getattr(self, 'rollup', None)
+        pending = rollup.flush() if rollup else []
+        top_k = getattr(self, 'top_k', None)
+        if top_k:
+            for signal in pending:
+                top_k.add(signal)
+        elif pending:
+            self._deliver(pending)
+        self.flush_budget()
+        for sink in self.sinks:
+            sink.close()
 
 if __name__ == "__main__":
     # If run directly
-    import sys
-    config_file = sys.argv[1] if len(sys.argv) > 1 else "examples/config.yaml"
-    scout = ProcurementScout(config_file)
-    scout.run()
+    import argparse
+    parser = argparse.ArgumentParser(description="GovSignal Procurement Scout")
+    parser.add_argument("config", nargs="?", default="examples/config.yaml")
+    parser.add_argument("--fr-bulk", metavar="PATH",
+                        help="Score a Federal Register bulk file (XML/JSON) instead of querying connectors")
+    parser.add_argument("--sam-bulk", metavar="PATH",
+                        help="Score a SAM.gov Contract Opportunities CSV extract instead of querying connectors")
+    parser.add_argument("--mmap", action="store_true", help="Memory-map the SAM.gov extract")
+    parser.add_argument("--backfill", nargs=2, metavar=("START", "END"),
+                        help="Backfill signals for an ISO date range (e.g. 2024-01-01 2025-12-31)")
+    parser.add_argument("--checkpoint", metavar="PATH", help="Backfill checkpoint file for resuming")
+    parser.add_argument("--partition-days", type=int, help="Backfill partition size in days")
+    parser.add_argument("--workers", type=int, help="Parallel backfill partitions")
+    parser.add_argument("--batch-size", type=int, default=500, help="Signals per emit() batch in streaming modes")
+    args = parser.parse_args()
+
+    scout = ProcurementScout(args.config)
+    if args.fr_bulk or args.sam_bulk or args.backfill:
+        if args.fr_bulk:
+            signals = scout.scan_federal_register_bulk(args.fr_bulk)
+        elif args.sam_bulk:
+            signals = scout.scan_sam_bulk(args.sam_bulk, use_mmap=args.mmap)
+        else:
+            from .backfill import BackfillRunner, DEFAULT_PARTITION_DAYS, DEFAULT_MAX_WORKERS, DEFAULT_REQUESTS_PER_SECOND
+            backfill_config = scout.config.get('backfill') or {}
+            runner = BackfillRunner(
+                scout,
+                checkpoint_path=args.checkpoint or backfill_config.get('checkpoint_path'),
+                partition_days=args.partition_days or backfill_config.get('partition_days', DEFAULT_PARTITION_DAYS),
+                max_workers=args.workers or backfill_config.get('max_workers', DEFAULT_MAX_WORKERS),
+                requests_per_second=backfill_config.get('requests_per_second', DEFAULT_REQUESTS_PER_SECOND),
+            )
+        # Streams go through emit() in batches, so delta sync, rollups and every configured
+        # sink apply as in a polled cycle. Without configured sinks, print NDJSON.
+        if not scout.config.get('sinks'):
+            scout.sinks = [StdoutSink(ndjson=True)]
+        if args.backfill:
+            emitted = runner.deliver(*args.backfill, batch_size=args.batch_size)
+        else:
+            emitted = scout.emit_stream(signals, args.batch_size)
+        scout.report_trending()
+        logger.info(f"Streaming scan complete. Emitted {emitted} signals.")
+    else:
+        scout.run()
+    scout.close()
@@ -0,0 +1,247 @@
+"""
+GovSignal Semantic Matching Module
+Embedding-based matching that catches paraphrases the keyword scan misses
+("directed energy countermeasure pods" for a "Jamming Pods" target).
+
+Each surveillance target and ontology asset is described in text, embedded once and
+stored in a local FAISS inner-product index over L2-normalized vectors (cosine similarity).
+The index is persisted with a manifest of content hashes. On startup, and whenever the
+targets change, only the added or edited entries are re-embedded. Documents are embedded
+in batches. Each document gets its nearest targets and their similarities, which the scout
+blends into demand_probability.
+
+    semantic_matching:
+      enabled: true
+      model_dir: models/all-MiniLM-L6-v2   # local sentence-embedding checkpoint, loaded offline
+      index_dir: .cache/semantic
+      threshold: 0.55
+      weight: 0.5
+      top_k: 5
+      batch_size: 64
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+
+import numpy as np
+
+from .codes import asset_categories
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "semantic.faiss"
+MANIFEST_FILE = "semantic.json"
+
+
+def target_description(category: str, criteria: dict) -> str:
+    """Text embedded for a surveillance target: its name, asset, description and keywords."""
+    parts = [category.replace("_", " "), criteria.get('related_asset', ''), criteria.get('description', '')]
+    return ". ".join(p for p in parts + [", ".join(criteria.get('keywords', []))] if p)
+
+
+def asset_description(asset: dict) -> str:
+    """Text embedded for an ontology asset."""
+    parts = [asset['name'], asset.get('description', ''), ", ".join(asset.get('keywords', []))]
+    return ". ".join(p for p in parts if p)
+
+
+class TransformerEmbedder:
+    """
+    Sentence embeddings from a local transformer checkpoint (mean pooling, L2-normalized).
+    Runs offline: files are read from model_dir only.
+    """
+
+    def __init__(self, model_dir: str, batch_size: int = 64, max_length: int = 128):
+        os.environ.setdefault("HF_HUB_OFFLINE", "1")
+        os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+        import torch
+        from transformers import AutoModel, AutoTokenizer
+
+        if not os.path.isdir(model_dir):
+            raise FileNotFoundError(f"Embedding model directory not found: {model_dir}")
+        self.torch = torch
+        self.name = os.path.basename(os.path.normpath(model_dir))
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir, local_files_only=True)
+        self.model = AutoModel.from_pretrained(model_dir, local_files_only=True)
+        self.model.eval()
+        self.dim = self.model.config.hidden_size
+
+    def embed(self, texts: list) -> np.ndarray:
+        vectors = []
+        for start in range(0, len(texts), self.batch_size):
+            encoded = self.tokenizer(texts[start:start + self.batch_size], padding=True, truncation=True,
+                                     max_length=self.max_length, return_tensors="pt")
+            with self.torch.inference_mode():
+                hidden = self.model(**encoded).last_hidden_state
+            mask = encoded["attention_mask"].unsqueeze(-1).to(hidden.dtype)
+            pooled = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+            vectors.append(self.torch.nn.functional.normalize(pooled, dim=-1).numpy())
+        if not vectors:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return np.ascontiguousarray(np.concatenate(vectors), dtype=np.float32)
+
+
+_EMBEDDERS = {}
+_EMBEDDERS_LOCK = threading.Lock()
+
+
+def shared_embedder(model_dir: str, batch_size: int = 64) -> TransformerEmbedder:
+    """One TransformerEmbedder per checkpoint and batch size, shared by every scout in the process."""
+    key = (os.path.abspath(model_dir), batch_size)
+    with _EMBEDDERS_LOCK:
+        if key not in _EMBEDDERS:
+            _EMBEDDERS[key] = TransformerEmbedder(model_dir, batch_size=batch_size)
+        return _EMBEDDERS[key]
+
+
+class SemanticIndex:
+    """
+    FAISS inner-product index of keyed texts, persisted in index_dir and kept in sync
+    incrementally: sync() embeds only new or changed texts and removes stale ones.
+    """
+
+    def __init__(self, embedder, index_dir: str = None):
+        import faiss
+        self.faiss = faiss
+        self.embedder = embedder
+        self.index_dir = index_dir
+        self.entries = {}  # key -> {"id": int, "hash": str}
+        self.next_id = 0
+        self.index = faiss.IndexIDMap2(faiss.IndexFlatIP(embedder.dim))
+        if index_dir:
+            self._load()
+        self.keys_by_id = {entry["id"]: key for key, entry in self.entries.items()}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _load(self):
+        manifest_path = os.path.join(self.index_dir, MANIFEST_FILE)
+        index_path = os.path.join(self.index_dir, INDEX_FILE)
+        if not (os.path.exists(manifest_path) and os.path.exists(index_path)):
+            return
+        try:
+            with open(manifest_path, 'r') as f:
+                manifest = json.load(f)
+            if manifest.get("model") != self.embedder.name or manifest.get("dim") != self.embedder.dim:
+                logger.info("Semantic index built with a different embedding model; rebuilding")
+                return
+            index = self.faiss.read_index(index_path)
+        except Exception as e:
+            logger.warning(f"Could not load semantic index from {self.index_dir}: {e}")
+            return
+        self.index = index
+        self.entries = manifest["entries"]
+        self.next_id = manifest["next_id"]
+
+    def _save(self):
+        os.makedirs(self.index_dir, exist_ok=True)
+        index_path = os.path.join(self.index_dir, INDEX_FILE)
+        self.faiss.write_index(self.index, index_path + ".tmp")
+        os.replace(index_path + ".tmp", index_path)
+        manifest_path = os.path.join(self.index_dir, MANIFEST_FILE)
+        manifest = {"model": self.embedder.name, "dim": self.embedder.dim, "next_id": self.next_id,
+                    "entries": self.entries}
+        with open(manifest_path + ".tmp", 'w') as f:
+            json.dump(manifest, f)
+        os.replace(manifest_path + ".tmp", manifest_path)
+
+    def sync(self, texts: dict) -> tuple:
+        """Makes the index hold exactly {key: text}; returns (embedded, removed) counts."""
+        hashes = {key: hashlib.sha1(text.encode("utf-8")).hexdigest() for key, text in texts.items()}
+        stale = [key for key, entry in self.entries.items() if hashes.get(key) != entry["hash"]]
+        fresh = [key for key in texts if key not in self.entries or key in stale]
+        if stale:
+            self.index.remove_ids(np.asarray([self.entries[key]["id"] for key in stale], dtype=np.int64))
+            for key in stale:
+                del self.keys_by_id[self.entries.pop(key)["id"]]
+        if fresh:
+            ids = np.arange(self.next_id, self.next_id + len(fresh), dtype=np.int64)
+            self.next_id += len(fresh)
+            self.index.add_with_ids(self.embedder.embed([texts[key] for key in fresh]), ids)
+            for key, i in zip(fresh, ids.tolist()):
+                self.entries[key] = {"id": i, "hash": hashes[key]}
+                self.keys_by_id[i] = key
+        if (stale or fresh) and self.index_dir:
+            self._save()
+        return len(fresh), len(stale) - len([key for key in stale if key in texts])
+
+    def search(self, vectors: np.ndarray, k: int) -> list:
+        """Per query vector: [(key, similarity)], most similar first."""
+        if not self.entries or len(vectors) == 0:
+            return [[] for _ in range(len(vectors))]
+        similarities, ids = self.index.search(vectors, min(k, len(self.entries)))
+        return [[(self.keys_by_id[i], float(s)) for s, i in zip(row_s, row_i) if i != -1]
+                for row_s, row_i in zip(similarities, ids)]
+
+
+class SemanticMatcher:
+    """
+    Nearest surveillance targets for a batch of documents. Asset hits count for the
+    targets the asset is linked to (codes.asset_categories); each target keeps its best
+    similarity, and only similarities at or above threshold are reported.
+    Thread-safe: sync() and index searches are serialized, while embedding documents runs
+    concurrently.
+    """
+
+    def __init__(self, embedder, assets: list, index_dir: str = None, threshold: float = 0.55,
+                 weight: float = 0.5, top_k: int = 5, batch_size: int = 64):
+        self.embedder = embedder
+        self.assets = assets
+        self.index = SemanticIndex(embedder, index_dir)
+        self.threshold = threshold
+        self.weight = weight
+        self.top_k = top_k
+        self.batch_size = batch_size
+        self._signature = None
+        self._asset_links = {}
+        self._lock = threading.Lock()
+
+    def sync(self, targets: dict):
+        """Re-indexes the targets (and the ontology) when they changed since the last call."""
+        signature = json.dumps(targets, sort_keys=True, default=str)
+        with self._lock:
+            if signature != self._signature:
+                self._sync(targets, signature)
+
+    def _sync(self, targets: dict, signature: str):
+        texts = {f"target:{category}": target_description(category, criteria) for category, criteria in targets.items()}
+        for asset in self.assets:
+            texts[f"asset:{asset['name']}"] = asset_description(asset)
+        embedded, removed = self.index.sync(texts)
+        if embedded or removed:
+            logger.info(f"Semantic index: {embedded} entries embedded, {removed} removed, {len(self.index)} total")
+        self._asset_links = asset_categories(targets, self.assets)
+        self._signature = signature
+
+    def similarities(self, texts: list) -> list:
+        """Per text: {category: cosine similarity} for targets at or above the threshold."""
+        if not texts:
+            return []
+        return self.match(self.embedder.embed(texts))
+
+    def match(self, vectors: np.ndarray) -> list:
+        """similarities() for documents already embedded by this matcher's embedder."""
+        with self._lock:
+            found = self.index.search(vectors, self.top_k)
+            asset_links = self._asset_links
+        results = []
+        for hits in found:
+            best = {}
+            for key, similarity in hits:
+                if similarity < self.threshold:
+                    continue
+                kind, name = key.split(":", 1)
+                for category in ([name] if kind == "target" else asset_links.get(name, ())):
+                    best[category] = max(best.get(category, 0.0), similarity)
+            results.append(best)
+        return results
+
+    def blend(self, probability: float, similarity: float, max_probability: float) -> float:
+        """Weighted blend of the keyword probability and the similarity; never lowers a keyword score."""
+        blended = (1.0 - self.weight) * probability + self.weight * similarity
+        return max(probability, min(blended, max_probability))
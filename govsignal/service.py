@@ -0,0 +1,275 @@
+"""
+GovSignal Scoring Service
+Resident local HTTP service for on-demand document checks.
+
+The scout, its compiled keyword matcher and the ontology code index are loaded once at
+startup and stay warm, so a request only pays for scoring. Listens on TCP or a Unix
+socket:
+
+    python -m govsignal.service examples/config.yaml --port 8765
+    python -m govsignal.service examples/config.yaml --unix /tmp/govsignal.sock
+
+    POST /score   {"title": ..., "description": ...}            -> signals for one document
+                  [{...}, {...}]                                 -> signals for a batch
+                  {"documents": [...], "source_name": "Analyst"} -> batch with options
+    POST /ingest  same bodies, or NDJSON (application/x-ndjson) -> 202, scored asynchronously
+                  ?source=TX_TEF names the pushing partner
+    GET  /stats   concurrency, queue depth and latency percentiles
+
+At most max_concurrency requests score at once; up to max_queue more wait for a slot.
+Beyond that the service answers 503 with Retry-After. Every response reports the queue
+depth in X-Queue-Depth.
+
+/ingest is served when `push_ingestion` is enabled in the config (see govsignal.ingest):
+pushed documents go through the same scoring stream and sinks as polled ones. A push
+that does not fit the bounded queue is rejected with 429 and Retry-After.
+"""
+import json
+import logging
+import os
+import socketserver
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from .ingest import PushIngestor
+from .scout import ProcurementScout
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TEXT_FIELDS = ("title", "description", "abstract")
+LATENCY_SAMPLES = 1024
+
+
+class ServiceBusy(Exception):
+    """Raised when the wait queue is full."""
+
+
+class ScoringService:
+    """Warm scoring core shared by all request threads, with admission control."""
+
+    def __init__(self, scout: ProcurementScout, max_concurrency: int = 4, max_queue: int = 64,
+                 retry_after_seconds: int = 1):
+        self.scout = scout
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.retry_after_seconds = retry_after_seconds
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.queued = 0
+        self.served = 0
+        self.rejected = 0
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+
+        # Build the lazily compiled state now, not on the first request
+        scout._compiled_targets()
+        scout._code_routes()
+        scout._semantic_matcher()
+
+    def score(self, documents: list, source_name: str = "Analyst Submission",
+              text_fields: tuple = DEFAULT_TEXT_FIELDS) -> list:
+        """Scores documents against every target; returns signals in the _generate_signal shape."""
+        with self._lock:
+            if self.queued >= self.max_queue:
+                self.rejected += 1
+                raise ServiceBusy()
+            self.queued += 1
+        self._slots.acquire()
+        with self._lock:
+            self.queued -= 1
+            self.in_flight += 1
+        started = time.perf_counter()
+        try:
+            # Analyst probes are not feed traffic: keep them out of the trending counts
+            return list(self.scout.score_documents(documents, source_name, tuple(text_fields),
+                                                   observe_trending=False))
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.in_flight -= 1
+                self.served += 1
+                self._latencies.append(elapsed)
+            self._slots.release()
+
+    def stats(self) -> dict:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            stats = {
+                "in_flight": self.in_flight,
+                "queue_depth": self.queued,
+                "max_concurrency": self.max_concurrency,
+                "max_queue": self.max_queue,
+                "served": self.served,
+                "rejected": self.rejected,
+            }
+        if latencies:
+            stats["latency_ms"] = {
+                "p50": round(latencies[len(latencies) // 2] * 1000, 3),
+                "p99": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000, 3),
+            }
+        return stats
+
+
+class ScoringRequestHandler(BaseHTTPRequestHandler):
+    """HTTP front end for a ScoringService (set as server.service)."""
+    protocol_version = "HTTP/1.1"
+
+    def _send_json(self, status: int, body, headers: dict = None):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("X-Queue-Depth", str(self.server.service.queued))
+        for name, value in (headers or {}).items():
+            self.send_header(name, str(value))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def do_GET(self):
+        if self.path == "/stats":
+            stats = self.server.service.stats()
+            if self.server.ingestor:
+                stats["ingestion"] = self.server.ingestor.stats()
+            self._send_json(200, stats)
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def _read_documents(self):
+        """Parses a JSON document, array or {'documents': [...]} body, or NDJSON; returns (documents, options)."""
+        raw = self._read_body()
+        content_type = self.headers.get("Content-Type", "")
+        if "ndjson" in content_type or "jsonl" in content_type:
+            return [json.loads(line) for line in raw.splitlines() if line.strip()], {}
+        body = json.loads(raw or b"null")
+        if isinstance(body, dict) and "documents" in body:
+            return body["documents"], {k: body[k] for k in ("source_name", "text_fields") if k in body}
+        if isinstance(body, dict):
+            return [body], {}
+        return body, {}
+
+    def do_POST(self):
+        route = urlsplit(self.path)
+        if route.path == "/ingest" and self.server.ingestor:
+            handler = self._ingest
+        elif route.path == "/score":
+            handler = self._score
+        else:
+            self._send_json(404, {"error": "not found"})
+            return
+        try:
+            documents, options = self._read_documents()
+        except ValueError as e:
+            self._send_json(400, {"error": f"invalid JSON: {e}"})
+            return
+        if not isinstance(documents, list) or not all(isinstance(d, dict) for d in documents):
+            self._send_json(400, {"error": "expected a document object, an array of documents or {'documents': [...]}"})
+            return
+        try:
+            handler(documents, options, parse_qs(route.query))
+        except Exception as e:
+            logger.error(f"Scoring service: {route.path} failed: {e}")
+            self._send_json(500, {"error": f"scoring failed: {e}"})
+
+    def _ingest(self, documents: list, options: dict, query: dict):
+        ingestor = self.server.ingestor
+        source_name = options.get("source_name") or (query.get("source") or [None])[0]
+        if not ingestor.offer(documents, source_name):
+            self._send_json(429, {"error": "ingestion queue full", "queue_depth": ingestor.depth},
+                            {"Retry-After": ingestor.retry_after_seconds})
+            return
+        self._send_json(202, {"accepted": len(documents), "queue_depth": ingestor.depth})
+
+    def _score(self, documents: list, options: dict, query: dict):
+        service = self.server.service
+        started = time.perf_counter()
+        try:
+            signals = service.score(documents, **options)
+        except ServiceBusy:
+            self._send_json(503, {"error": "service busy"}, {"Retry-After": service.retry_after_seconds})
+            return
+        self._send_json(200, {
+            "signals": signals,
+            "scored": len(documents),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+        })
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded HTTP server on a Unix domain socket."""
+    daemon_threads = True
+
+    def server_bind(self):
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+        super().server_bind()
+
+
+class _UnixAddressMixin:
+    # Unix socket peers have no (host, port) address
+    def address_string(self):
+        return "unix"
+
+
+def build_ingestor(scout: ProcurementScout):
+    """PushIngestor from the scout's `push_ingestion` config section, or None when disabled."""
+    push_config = scout.config.get('push_ingestion') or {}
+    if not push_config.get('enabled', False):
+        return None
+    return PushIngestor(
+        scout,
+        max_queue=push_config.get('max_queue', 10000),
+        batch_size=push_config.get('batch_size', 100),
+        max_wait_seconds=push_config.get('max_wait_seconds', 0.5),
+        retry_after_seconds=push_config.get('retry_after_seconds', 5),
+    )
+
+
+def make_server(service: ScoringService, host: str = "127.0.0.1", port: int = 8765, unix_socket: str = None,
+                handler=ScoringRequestHandler, ingestor: PushIngestor = None):
+    """Creates (but does not start) the HTTP server for a service; /ingest is served when an ingestor is given."""
+    if unix_socket:
+        server = UnixHTTPServer(unix_socket, type("Unix" + handler.__name__, (_UnixAddressMixin, handler), {}))
+    else:
+        server = ThreadingHTTPServer((host, port), handler)
+        server.daemon_threads = True
+    server.service = service
+    server.ingestor = ingestor
+    return server
+
+
+if __name__ == "__main__":
+    import argparse
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description="GovSignal resident scoring service")
+    parser.add_argument("config")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="Listen on this Unix socket path instead of TCP")
+    parser.add_argument("--max-concurrency", type=int, default=4)
+    parser.add_argument("--max-queue", type=int, default=64)
+    args = parser.parse_args()
+
+    scout = ProcurementScout(args.config)
+    ingestor = build_ingestor(scout)
+    server = make_server(ScoringService(scout, args.max_concurrency, args.max_queue),
+                         args.host, args.port, args.unix, ingestor=ingestor)
+    logger.info(f"Scoring service listening on {args.unix or f'{args.host}:{args.port}'}"
+                f"{' (push ingestion enabled)' if ingestor else ''}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if ingestor:
+            ingestor.close()
+        scout.close()
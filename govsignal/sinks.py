@@ -0,0 +1,86 @@
+"""
+GovSignal Sinks Module
+Destinations for the signals a scout cycle produces, configured per scout under `sinks:`.
+
+    sinks:
+      - type: stdout
+      - type: jsonl
+        path: "output/signals.jsonl"
+      - type: sqlite
+        path: "output/signals.db"
+      - type: sap_idoc
+        directory: "output/idoc"
+      - type: erp_http
+        url: "https://erp.example.com/govsignal/triggers"
+        outbox_path: "output/erp_outbox.db"
+
+Every sink implements emit(signals) and close().
+"""
+import json
+import logging
+import os
+
+from .erp_delivery import ErpHttpSink
+from .sap_export import SapIDocSink
+from .store import SignalStore
+
+logger = logging.getLogger(__name__)
+
+
+class StdoutSink:
+    """Prints each batch as an indented JSON array (the scout's original output), or as NDJSON."""
+
+    def __init__(self, ndjson: bool = False):
+        self.ndjson = ndjson
+
+    def emit(self, signals: list):
+        if self.ndjson:
+            for signal in signals:
+                print(json.dumps(signal))
+        else:
+            print(json.dumps(signals, indent=2))
+
+    def close(self):
+        pass
+
+
+class JsonLinesSink:
+    """Appends signals to a newline-delimited JSON file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def emit(self, signals: list):
+        with open(self.path, 'a') as f:
+            for signal in signals:
+                f.write(json.dumps(signal) + "\n")
+        logger.info(f"Wrote {len(signals)} signals to {self.path}")
+
+    def close(self):
+        pass
+
+
+SINK_TYPES = {
+    "stdout": StdoutSink,
+    "jsonl": JsonLinesSink,
+    "sqlite": SignalStore,
+    "sap_idoc": SapIDocSink,
+    "erp_http": ErpHttpSink,
+}
+
+
+def build_sinks(sink_configs: list) -> list:
+    """Instantiates the configured sinks; defaults to stdout when none are configured."""
+    if not sink_configs:
+        return [StdoutSink()]
+    sinks = []
+    for sink_config in sink_configs:
+        options = dict(sink_config)
+        sink_type = options.pop('type', None)
+        if sink_type not in SINK_TYPES:
+            raise ValueError(f"Unknown sink type: {sink_type}")
+        sinks.append(SINK_TYPES[sink_type](**options))
+    return sinks
@@ -0,0 +1,166 @@
+"""
+GovSignal Signal Store Module
+Persistent, indexed local store (SQLite) for emitted signals.
+
+The scout appends each cycle's signals in batched transactions; analysts query by time
+range, category, asset and action, or roll signals up, without re-running the scout.
+Usable as a sink:
+
+    sinks:
+      - type: sqlite
+        path: "output/signals.db"
+"""
+import json
+import logging
+import os
+import sqlite3
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS signals (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    signal_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    source TEXT,
+    target_category TEXT,
+    asset_implication TEXT,
+    erp_action_recommendation TEXT,
+    demand_probability REAL,
+    detected_event TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_signals_timestamp ON signals (timestamp);
+CREATE INDEX IF NOT EXISTS idx_signals_category ON signals (target_category, timestamp);
+CREATE INDEX IF NOT EXISTS idx_signals_asset_action ON signals (asset_implication, erp_action_recommendation, timestamp);
+CREATE INDEX IF NOT EXISTS idx_signals_action ON signals (erp_action_recommendation, timestamp);
+CREATE INDEX IF NOT EXISTS idx_signals_signal_id ON signals (signal_id);
+"""
+
+# Columns analysts may filter and group by
+INDEXED_COLUMNS = ("source", "target_category", "asset_implication", "erp_action_recommendation")
+DEFAULT_BATCH_SIZE = 500
+
+
+class SignalStore:
+    """
+    SQLite-backed signal store. Full signals are kept as JSON payloads next to the
+    indexed columns, so queries return exactly what the scout emitted.
+    """
+
+    def __init__(self, path: str, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.path = path
+        self.batch_size = batch_size
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        # WAL lets the dashboard read while the scout writes
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def append(self, signals: list) -> int:
+        """Appends signals in transactions of up to batch_size rows; returns the number written."""
+        rows = [
+            (s.get("signal_id", ""), s.get("timestamp", datetime.now().isoformat()), s.get("source"),
+             s.get("target_category"), s.get("asset_implication"), s.get("erp_action_recommendation"),
+             s.get("demand_probability"), s.get("detected_event"), json.dumps(s))
+            for s in signals
+        ]
+        for i in range(0, len(rows), self.batch_size):
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT INTO signals (signal_id, timestamp, source, target_category, asset_implication, "
+                    "erp_action_recommendation, demand_probability, detected_event, payload) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows[i:i + self.batch_size],
+                )
+        return len(rows)
+
+    def _where(self, start: str = None, end: str = None, **filters):
+        clauses, params = [], []
+        for column, value in filters.items():
+            if column not in INDEXED_COLUMNS:
+                raise ValueError(f"Cannot filter on column: {column}")
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if start:
+            clauses.append("timestamp >= ?")
+            params.append(start)
+        if end:
+            clauses.append("timestamp < ?")
+            params.append(end)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(self, start: str = None, end: str = None, limit: int = None, **filters) -> list:
+        """
+        Returns stored signals (newest first) in [start, end) matching the column filters,
+        e.g. query(start="2025-01-01", asset_implication="TWT Amplifiers",
+                   erp_action_recommendation="release_capital_hold").
+        """
+        where, params = self._where(start, end, **filters)
+        sql = f"SELECT payload FROM signals{where} ORDER BY timestamp DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [json.loads(row[0]) for row in self.conn.execute(sql, params)]
+
+    def recent(self, days: int = 30, **filters) -> list:
+        """Signals from the last `days` days."""
+        start = (datetime.now() - timedelta(days=days)).isoformat()
+        return self.query(start=start, **filters)
+
+    def rollup(self, by: tuple = ("asset_implication", "erp_action_recommendation"),
+               start: str = None, end: str = None, **filters) -> list:
+        """Counts and probability stats grouped by the given indexed columns."""
+        for column in by:
+            if column not in INDEXED_COLUMNS:
+                raise ValueError(f"Cannot group by column: {column}")
+        where, params = self._where(start, end, **filters)
+        columns = ", ".join(by)
+        sql = (f"SELECT {columns}, COUNT(*), AVG(demand_probability), MAX(demand_probability), MAX(timestamp) "
+               f"FROM signals{where} GROUP BY {columns} ORDER BY COUNT(*) DESC")
+        results = []
+        for row in self.conn.execute(sql, params):
+            entry = dict(zip(by, row[:len(by)]))
+            entry.update({
+                "count": row[len(by)],
+                "avg_probability": round(row[len(by) + 1], 4),
+                "max_probability": row[len(by) + 2],
+                "last_seen": row[len(by) + 3],
+            })
+            results.append(entry)
+        return results
+
+    # Sink interface
+    def emit(self, signals: list):
+        written = self.append(signals)
+        logger.info(f"Stored {written} signals in {self.path}")
+
+    def close(self):
+        self.conn.close()
+
+
+if __name__ == "__main__":
+    # python -m govsignal.store output/signals.db --asset "TWT Amplifiers" --action release_capital_hold --days 30
+    import argparse
+    parser = argparse.ArgumentParser(description="Query the GovSignal signal store")
+    parser.add_argument("path")
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--category")
+    parser.add_argument("--asset")
+    parser.add_argument("--action")
+    parser.add_argument("--rollup", action="store_true", help="Aggregate by asset and action")
+    args = parser.parse_args()
+
+    store = SignalStore(args.path)
+    filters = dict(target_category=args.category, asset_implication=args.asset, erp_action_recommendation=args.action)
+    if args.rollup:
+        start = (datetime.now() - timedelta(days=args.days)).isoformat()
+        print(json.dumps(store.rollup(start=start, **filters), indent=2))
+    else:
+        print(json.dumps(store.recent(args.days, **filters), indent=2))
+    store.close()
@@ -0,0 +1,180 @@
+"""
+GovSignal Multi-Tenant Module
+Runs several business units' scout configs over one fetched corpus.
+
+Each source is queried once with the union of every tenant's criteria, and each document
+goes through one combined scoring pass: a single keyword scan over every tenant's
+targets, one NAICS/PSC code extraction (looked up once per ontology) and, per batch, one
+embedding per semantic model. The evidence is then split per tenant and scored with
+that tenant's own filters, thresholds and semantic index, so upstream calls and scoring
+passes stay constant as tenants are added. Each tenant's signals reach its own delta
+sync, rollups and sinks.
+"""
+import logging
+
+from .codes import extract_codes
+from .connectors import FILTER_NAICS, FILTER_AGENCY, FILTER_DATE_RANGE
+from .matcher import compile_groups
+from .ontology import DEFAULT_ONTOLOGY_PATH
+from .scout import ProcurementScout
+
+logger = logging.getLogger(__name__)
+
+
+class MultiTenantScout:
+    """
+    Multi-tenant scout over {tenant name: config path}.
+    Tenants keep their own targets, enabled local sources, thresholds and sinks; a
+    tenant only receives signals from sources it enabled.
+    """
+
+    def __init__(self, tenant_configs: dict):
+        self.tenants = {name: ProcurementScout(path) for name, path in tenant_configs.items()}
+
+        # Shared sources: each is instantiated once, tagged with the tenants that enabled it
+        self.sources = {}
+        self.source_tenants = {}
+        for name, tenant in self.tenants.items():
+            for source_key, connector, fetch, source_name, text_fields in tenant._sources():
+                self.sources.setdefault(source_key, (connector, fetch, source_name, text_fields))
+                self.source_tenants.setdefault(source_key, []).append(name)
+
+        # Combined matcher over every tenant's keywords
+        groups = {
+            f"{name}:{category}": list(criteria.get('keywords', []))
+            for name, tenant in self.tenants.items() for category, criteria in tenant.targets.items()
+        }
+        self.matcher, group_ids = compile_groups(groups)
+        self.category_ids = {
+            name: {category: group_ids[f"{name}:{category}"] for category in tenant.targets}
+            for name, tenant in self.tenants.items()
+        }
+        logger.info(f"Multi-tenant scout: {len(self.tenants)} tenants, {len(self.sources)} sources, "
+                    f"{len(self.matcher.patterns)} distinct keywords")
+
+    def _build_query(self, tenant_names: list, posted_from: str = None, posted_to: str = None):
+        """Union of the tenants' queries; structured filters only when every tenant constrains them."""
+        queries = [self.tenants[name]._build_query() for name in tenant_names]
+        keywords = []
+        seen = set()
+        for tenant_keywords, _ in queries:
+            for keyword in tenant_keywords:
+                if keyword.lower() not in seen:
+                    seen.add(keyword.lower())
+                    keywords.append(keyword)
+
+        filters = {}
+        for filter_name in (FILTER_NAICS, FILTER_AGENCY):
+            if queries and all(filter_name in f for _, f in queries):
+                filters[filter_name] = sorted({value for _, f in queries for value in f[filter_name]})
+        if posted_from or posted_to:
+            filters[FILTER_DATE_RANGE] = (posted_from, posted_to)
+        # A tenant that scores documents without keywords (code routing, semantic matching)
+        # needs them unfiltered
+        if not all(self.tenants[name]._keyword_pushdown() for name in tenant_names):
+            keywords = []
+        return keywords, filters
+
+    def collect_signals(self, posted_from: str = None, posted_to: str = None) -> dict:
+        """One cycle across all tenants; returns {tenant name: [signals]}."""
+        results = {name: [] for name in self.tenants}
+
+        for source_key, (connector, fetch, source_name, text_fields) in self.sources.items():
+            tenant_names = self.source_tenants[source_key]
+            keywords, filters = self._build_query(tenant_names, posted_from, posted_to)
+            try:
+                # Any tenant scout can issue the query; pushdown logic is shared
+                records = list(self.tenants[tenant_names[0]]._query_source(connector, fetch, keywords, filters))
+            except Exception as e:
+                logger.error(f"Error querying source {source_key}: {e}")
+                continue
+
+            try:
+                for name, signal in self._score_records(records, tenant_names, source_name, text_fields,
+                                                        connector.FILTER_FIELDS):
+                    results[name].append(signal)
+            except Exception as e:
+                logger.error(f"Error scoring source {source_key}: {e}")
+
+        return results
+
+    def _score_records(self, records: list, tenant_names: list, source_name: str, text_fields: tuple,
+                       filter_fields: dict):
+        """
+        Yields (tenant name, signal) for one source's records. Documents are scored in
+        batches of the smallest semantic batch_size (64 without semantic matching).
+        """
+        tenants = {name: self.tenants[name] for name in tenant_names}
+        category_filters = {
+            name: {category: tenant._category_filters(criteria) for category, criteria in tenant.targets.items()}
+            for name, tenant in tenants.items()
+        }
+        code_routes = {name: tenant._code_routes() for name, tenant in tenants.items()}
+        semantic = {name: tenant._semantic_matcher() for name, tenant in tenants.items()}
+        batch_size = min((matcher.batch_size for matcher in semantic.values() if matcher), default=64)
+        for start in range(0, len(records), batch_size):
+            yield from self._score_batch(records[start:start + batch_size], tenants, source_name, text_fields,
+                                         filter_fields, category_filters, code_routes, semantic)
+
+    def _score_batch(self, batch: list, tenants: dict, source_name: str, text_fields: tuple, filter_fields: dict,
+                     category_filters: dict, code_routes: dict, semantic: dict):
+        texts = [ProcurementScout._document_text(item, text_fields) for item in batch]
+        # Embed once per model (tenants share embedders per checkpoint), search each tenant's own index
+        vectors = {}
+        similar = {}
+        for name, matcher in semantic.items():
+            if matcher is None:
+                similar[name] = [{}] * len(batch)
+                continue
+            if id(matcher.embedder) not in vectors:
+                vectors[id(matcher.embedder)] = matcher.embedder.embed(texts)
+            similar[name] = matcher.match(vectors[id(matcher.embedder)])
+
+        for row, (item, text_content) in enumerate(zip(batch, texts)):
+            # One automaton pass finds every tenant's keywords in the document
+            matched = self.matcher.scan(text_content)
+            codes = extract_codes(item, text_fields) if any(code_routes.values()) else None
+            lookups = {}
+            for name, tenant in tenants.items():
+                trending = getattr(tenant, 'trending', None)
+                if trending:
+                    trending.observe(text_content)
+                asset_codes, asset_links = None, None
+                if code_routes[name]:
+                    index, asset_links = code_routes[name]
+                    # Tenants on the same ontology resolve the document's codes once
+                    ontology = tenant.config.get('ontology_path', DEFAULT_ONTOLOGY_PATH)
+                    if ontology not in lookups:
+                        lookups[ontology] = index.lookup(*codes)
+                    asset_codes = lookups[ontology]
+                scores, matched_codes = tenant._category_evidence(
+                    matched, self.category_ids[name], list(tenant.targets), asset_codes, asset_links)
+                for _, signal in tenant._document_signals(item, scores, matched_codes, similar[name][row],
+                                                          semantic[name], source_name, filter_fields,
+                                                          category_filters[name]):
+                    yield name, signal
+
+    def run(self) -> dict:
+        """Runs one cycle and delivers each tenant's signals to that tenant's sinks."""
+        logger.info("Starting multi-tenant surveillance cycle...")
+        results = self.collect_signals()
+        for name, signals in results.items():
+            emitted = self.tenants[name].emit(signals)
+            self.tenants[name].report_trending()
+            logger.info(f"Tenant {name}: generated {len(signals)} signals, emitted {len(emitted)}.")
+        return results
+
+    def close(self):
+        for tenant in self.tenants.values():
+            tenant.close()
+
+
+if __name__ == "__main__":
+    # python -m govsignal.tenancy unit_a=configs/a.yaml unit_b=configs/b.yaml
+    import argparse
+    parser = argparse.ArgumentParser(description="GovSignal Multi-Tenant Scout")
+    parser.add_argument("tenants", nargs="+", metavar="NAME=CONFIG")
+    args = parser.parse_args()
+    multi = MultiTenantScout(dict(t.split("=", 1) for t in args.tenants))
+    multi.run()
+    multi.close()
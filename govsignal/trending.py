@@ -0,0 +1,242 @@
+"""
+GovSignal Trending Module
+Streaming detection of accelerating terms across every ingested document, to surface
+candidate surveillance keywords nobody has configured yet (e.g. a new program acronym
+appearing across state feeds).
+
+Term and bigram frequencies are counted per time window:
+- a count-min sketch estimates the frequency of any term;
+- a Space-Saving heavy-hitters table tracks the window's most frequent terms.
+Sketches of the last `history` closed windows give each heavy hitter a baseline. Terms
+well above their baseline are reported. Memory is fixed by width x depth x (history + 1)
+counters plus `top_terms` table entries, whatever the vocabulary size.
+
+    trending:
+      enabled: true
+      window_seconds: 86400
+      state_path: "output/trending_state.json"
+      candidates_path: "output/trending_candidates.json"
+"""
+import base64
+import hashlib
+import heapq
+import json
+import logging
+import os
+import re
+import threading
+import time
+from array import array
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+TERM_STOPWORDS = frozenset("""
+a an and are as at be by for from has have in into is it its of on or that the their this to was were
+will with not no all any can may must shall should such than then there these those which who
+""".split())
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9\-]*[a-z0-9]|[a-z0-9]")
+
+
+def extract_terms(text: str) -> list:
+    """Lowercased words and adjacent-word bigrams, stopwords and pure numbers dropped."""
+    words = [w for w in TOKEN_PATTERN.findall(text.lower()) if w not in TERM_STOPWORDS and not w.isdigit()]
+    terms = [w for w in words if len(w) >= 3]
+    terms.extend(f"{a} {b}" for a, b in zip(words, words[1:]))
+    return terms
+
+
+class CountMinSketch:
+    """depth x width counters; estimates never undercount, overcount is bounded by width."""
+
+    def __init__(self, width: int = 2048, depth: int = 4, counters: array = None):
+        self.width = width
+        self.depth = depth
+        self.counters = counters if counters is not None else array('I', [0]) * (width * depth)
+
+    def _cells(self, term: str):
+        digest = hashlib.blake2b(term.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        # Double hashing: row i uses h1 + i * h2
+        return [row * self.width + (h1 + row * h2) % self.width for row in range(self.depth)]
+
+    def add(self, term: str, count: int = 1) -> int:
+        """Conservative update; returns the new estimate."""
+        cells = self._cells(term)
+        estimate = min(self.counters[c] for c in cells) + count
+        for c in cells:
+            if self.counters[c] < estimate:
+                self.counters[c] = estimate
+        return estimate
+
+    def estimate(self, term: str) -> int:
+        return min(self.counters[c] for c in self._cells(term))
+
+
+class HeavyHitters:
+    """
+    Space-Saving top-k: at most `capacity` entries of term -> [count, overestimate].
+    The minimum is found through a lazy min-heap of (count, term): increments push a
+    fresh pair and stale ones are skipped on eviction, so each update is O(log capacity).
+    """
+
+    def __init__(self, capacity: int = 200):
+        self.capacity = capacity
+        self.entries = {}
+
+    @property
+    def entries(self) -> dict:
+        return self._entries
+
+    @entries.setter
+    def entries(self, entries: dict):
+        self._entries = entries
+        self._rebuild_heap()
+
+    def _rebuild_heap(self):
+        self._heap = [(entry[0], term) for term, entry in self._entries.items()]
+        heapq.heapify(self._heap)
+
+    def add(self, term: str, count: int = 1):
+        entry = self._entries.get(term)
+        if entry is not None:
+            entry[0] += count
+        elif len(self._entries) < self.capacity:
+            entry = self._entries[term] = [count, 0]
+        else:
+            # Replace the minimum; the newcomer inherits its count as possible overestimate.
+            # Counts only grow, so a heap pair is current only if it matches its entry.
+            while True:
+                floor, victim = heapq.heappop(self._heap)
+                current = self._entries.get(victim)
+                if current is not None and current[0] == floor:
+                    break
+            del self._entries[victim]
+            entry = self._entries[term] = [floor + count, floor]
+        heapq.heappush(self._heap, (entry[0], term))
+        if len(self._heap) > 4 * self.capacity:
+            self._rebuild_heap()
+
+    def top(self, limit: int = None) -> list:
+        ranked = sorted(self.entries.items(), key=lambda item: item[1][0], reverse=True)
+        return ranked[:limit] if limit else ranked
+
+
+class TrendingTerms:
+    """
+    Windowed trending-term detector. observe() ingests document text; candidates()
+    reports heavy hitters of the current window whose count is at least min_count and
+    min_growth times their average count over the previous windows.
+    Terms in known_terms (already configured keywords) are never reported.
+    Thread-safe: concurrent scoring threads (e.g. push ingestion) may observe at once.
+    """
+
+    def __init__(self, window_seconds: int = 86400, width: int = 2048, depth: int = 4, top_terms: int = 200,
+                 history: int = 3, min_count: int = 5, min_growth: float = 3.0, known_terms=(),
+                 state_path: str = None):
+        self.window_seconds = window_seconds
+        self.width = width
+        self.depth = depth
+        self.top_terms = top_terms
+        self.min_count = min_count
+        self.min_growth = min_growth
+        self.known_terms = {t.lower() for t in known_terms}
+        self.state_path = state_path
+        self.window = None
+        self.current = CountMinSketch(width, depth)
+        self.hitters = HeavyHitters(top_terms)
+        self.history = deque(maxlen=history)
+        self._lock = threading.Lock()
+
+        if state_path and os.path.exists(state_path):
+            self._load()
+
+    def _rotate(self, window: int):
+        if self.window is not None:
+            # Windows without any documents still count as (empty) history
+            for _ in range(min(window - self.window, self.history.maxlen + 1)):
+                self.history.append(self.current)
+                self.current = CountMinSketch(self.width, self.depth)
+            self.hitters = HeavyHitters(self.top_terms)
+        self.window = window
+
+    def observe(self, text: str, now: float = None):
+        window = int((time.time() if now is None else now) // self.window_seconds)
+        terms = extract_terms(text)
+        with self._lock:
+            if self.window is None or window > self.window:
+                self._rotate(window)
+            for term in terms:
+                self.current.add(term)
+                self.hitters.add(term)
+
+    def candidates(self, limit: int = 20) -> list:
+        """Accelerating terms, fastest growth first: [{term, count, baseline, growth}]."""
+        results = []
+        with self._lock:
+            for term, (count, overestimate) in self.hitters.top():
+                # Space-Saving counts can be inflated; the sketch bounds them from the other side
+                count = min(count, self.current.estimate(term))
+                if count - overestimate < self.min_count or term in self.known_terms:
+                    continue
+                baseline = (sum(sketch.estimate(term) for sketch in self.history) / len(self.history)
+                            if self.history else 0.0)
+                growth = (count + 1) / (baseline + 1)
+                if growth >= self.min_growth:
+                    results.append({"term": term, "count": count, "baseline": round(baseline, 2),
+                                    "growth": round(growth, 2)})
+        results.sort(key=lambda r: (r["growth"], r["count"]), reverse=True)
+        return results[:limit]
+
+    def report(self, path: str = None, limit: int = 20) -> list:
+        """Logs the current candidates and optionally writes them to a JSON file."""
+        results = self.candidates(limit)
+        if results:
+            logger.info(f"Trending candidate keywords: {[r['term'] for r in results]}")
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump(results, f, indent=2)
+        return results
+
+    def save(self):
+        """Atomically persists the sketches and heavy hitters (fixed size) to state_path."""
+        if not self.state_path:
+            return
+        encode = lambda sketch: base64.b64encode(sketch.counters.tobytes()).decode("ascii")
+        with self._lock:
+            state = {
+                "window": self.window,
+                "width": self.width,
+                "depth": self.depth,
+                "current": encode(self.current),
+                "history": [encode(sketch) for sketch in self.history],
+                "hitters": {term: list(entry) for term, entry in self.hitters.entries.items()},
+            }
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_path)
+
+    def _load(self):
+        try:
+            with open(self.state_path, 'r') as f:
+                state = json.load(f)
+            if (state["width"], state["depth"]) != (self.width, self.depth):
+                logger.warning(f"Ignoring trending state {self.state_path}: sketch dimensions changed")
+                return
+
+            def decode(data):
+                counters = array('I')
+                counters.frombytes(base64.b64decode(data))
+                return CountMinSketch(self.width, self.depth, counters)
+
+            self.window = state["window"]
+            self.current = decode(state["current"])
+            self.history.extend(decode(data) for data in state["history"])
+            self.hitters.entries = {term: list(entry) for term, entry in state["hitters"].items()}
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable trending state {self.state_path}: {e}")
@@ -0,0 +1,140 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class MicroBatcher:
+    """
+    Dynamic micro-batcher for model inference.
+    Callers submit single items and get Futures back. A dispatcher thread groups pending
+    items until max_batch_size is reached or the oldest has waited max_wait_ms. It splits
+    the group into length buckets, so each batch pads to similar lengths, and runs the
+    buckets on a bounded thread pool. predict_fn maps a list of items to a same-length
+    sequence of results.
+    """
+    def __init__(self, predict_fn, max_batch_size=32, max_wait_ms=5.0, workers=2, max_pending=4096,
+                 length_fn=len, bucket_width=16):
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_pending = max_pending
+        self.length_fn = length_fn
+        self.bucket_width = bucket_width
+        self._pending = deque()  # (item, future, submitted_at)
+        self._cond = threading.Condition()
+        self._closed = False
+        # In-flight batches are bounded by the pool size: the dispatcher waits for a free worker
+        self._workers = threading.BoundedSemaphore(workers)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="microbatch")
+        self._metrics_lock = threading.Lock()
+        self._latencies = deque(maxlen=2048)
+        self.items = 0
+        self.batches = 0
+        self.padded_tokens = 0
+        self.real_tokens = 0
+        self.started_at = time.monotonic()
+        self._dispatcher = threading.Thread(target=self._dispatch, name="microbatch-dispatch", daemon=True)
+        self._dispatcher.start()
+
+    def submit(self, item):
+        """Queues one item; blocks while max_pending items are already waiting."""
+        future = Future()
+        with self._cond:
+            while len(self._pending) >= self.max_pending and not self._closed:
+                self._cond.wait()
+            if self._closed:
+                raise RuntimeError("MicroBatcher is closed")
+            self._pending.append((item, future, time.monotonic()))
+            self._cond.notify_all()
+        return future
+
+    def map(self, items):
+        """Submits items and waits for all results, in order."""
+        futures = [self.submit(item) for item in items]
+        return [future.result() for future in futures]
+
+    def _collect(self):
+        with self._cond:
+            while not self._pending and not self._closed:
+                self._cond.wait()
+            if not self._pending:
+                return None
+            deadline = self._pending[0][2] + self.max_wait
+            while len(self._pending) < self.max_batch_size and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            group = [self._pending.popleft() for _ in range(min(self.max_batch_size, len(self._pending)))]
+            self._cond.notify_all()
+            return group
+
+    def _buckets(self, group):
+        """Splits a group into batches of similar length to limit padding."""
+        buckets = {}
+        for entry in group:
+            buckets.setdefault(self.length_fn(entry[0]) // self.bucket_width, []).append(entry)
+        return [buckets[key] for key in sorted(buckets)]
+
+    def _dispatch(self):
+        while True:
+            group = self._collect()
+            if group is None:
+                return
+            for batch in self._buckets(group):
+                self._workers.acquire()
+                self._pool.submit(self._run, batch)
+
+    def _run(self, batch):
+        try:
+            items = [entry[0] for entry in batch]
+            try:
+                results = list(self.predict_fn(items))
+                if len(results) != len(items):
+                    # zip() would silently leave the unmatched futures pending forever
+                    raise ValueError(f"predict_fn returned {len(results)} results for {len(items)} inputs")
+            except Exception as e:
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                return
+            now = time.monotonic()
+            lengths = [self.length_fn(item) for item in items]
+            with self._metrics_lock:
+                self.items += len(batch)
+                self.batches += 1
+                self.real_tokens += sum(lengths)
+                self.padded_tokens += max(lengths) * len(lengths)
+                self._latencies.extend(now - submitted_at for _, _, submitted_at in batch)
+            for (_, future, _), result in zip(batch, results):
+                future.set_result(result)
+        finally:
+            self._workers.release()
+
+    def metrics(self):
+        """Throughput, batch size, padding efficiency and submit-to-result latency percentiles."""
+        with self._metrics_lock:
+            latencies = sorted(self._latencies)
+            elapsed = max(time.monotonic() - self.started_at, 1e-9)
+            metrics = {
+                "items": self.items,
+                "batches": self.batches,
+                "avg_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0,
+                "throughput_per_sec": round(self.items / elapsed, 2),
+                "padding_efficiency": round(self.real_tokens / self.padded_tokens, 4) if self.padded_tokens else 1.0,
+                "pending": len(self._pending),
+            }
+        if latencies:
+            metrics["latency_ms"] = {
+                "p50": round(latencies[len(latencies) // 2] * 1000, 3),
+                "p99": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000, 3),
+            }
+        return metrics
+
+    def close(self):
+        """Finishes queued work, then stops the dispatcher and the pool."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._dispatcher.join()
+        self._pool.shutdown(wait=True)
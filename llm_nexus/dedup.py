@@ -0,0 +1,72 @@
+import hashlib
+import threading
+import time
+from array import array
+
+try:
+    from llm_nexus.sentiment_engine import normalize_text
+except ImportError:
+    from sentiment_engine import normalize_text
+
+
+def content_fingerprint(text):
+    """64-bit fingerprint of the case-, whitespace- and punctuation-normalized text."""
+    return int.from_bytes(hashlib.blake2b(normalize_text(text).encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class DuplicateFilter:
+    """
+    Time-windowed set of content fingerprints with constant memory.
+    Fingerprints live in a fixed open-addressed table (capacity slots, probe slots per
+    lookup) along with the time each expires, window_seconds after it was first seen.
+    Expired slots are reused. When every probed slot is live, the one expiring soonest is
+    evicted, so memory never grows with the headline rate; under overload the effective
+    window shrinks instead.
+    """
+    def __init__(self, window_seconds=6 * 3600, capacity=65536, probe=8):
+        self.window_seconds = window_seconds
+        self.capacity = capacity
+        self.probe = min(probe, capacity)
+        self._fingerprints = array('Q', bytes(8 * capacity))
+        self._expires = array('d', bytes(8 * capacity))  # 0.0 marks an empty slot
+        self._lock = threading.Lock()
+        self.checked = 0
+        self.duplicates = 0
+        self.evictions = 0
+
+    def seen(self, text, now=None):
+        """True if the text was seen within the window; otherwise records it and returns False."""
+        fingerprint = content_fingerprint(text)
+        now = time.time() if now is None else now
+        start = fingerprint % self.capacity
+        with self._lock:
+            self.checked += 1
+            free = None
+            oldest = start
+            for offset in range(self.probe):
+                slot = (start + offset) % self.capacity
+                expires = self._expires[slot]
+                if expires > now:
+                    if self._fingerprints[slot] == fingerprint:
+                        self.duplicates += 1
+                        return True
+                    if expires < self._expires[oldest]:
+                        oldest = slot
+                elif free is None:
+                    free = slot
+            if free is None:
+                free = oldest
+                self.evictions += 1
+            self._fingerprints[free] = fingerprint
+            self._expires[free] = now + self.window_seconds
+            return False
+
+    def stats(self):
+        with self._lock:
+            return {
+                "checked": self.checked,
+                "duplicates": self.duplicates,
+                "evictions": self.evictions,
+                "capacity": self.capacity,
+                "window_seconds": self.window_seconds,
+            }
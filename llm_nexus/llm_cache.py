@@ -0,0 +1,198 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+import numpy as np
+
+try:
+    from llm_nexus.cache import LRUTTLCache
+except ImportError:
+    from cache import LRUTTLCache
+
+try:
+    import config
+    DEFAULT_MODEL = config.LLM_MODEL
+except (ImportError, AttributeError):
+    DEFAULT_MODEL = "llama-3-8b-quantized"
+
+WHITESPACE = re.compile(r"\s+")
+
+
+def prompt_key(prompt, llm_string):
+    """Exact-match key: hash of the model/parameter string and the whitespace-normalized prompt."""
+    normalized = WHITESPACE.sub(" ", prompt).strip()
+    return hashlib.sha256(f"{llm_string}\0{normalized}".encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Cache in front of LLM calls.
+    Exact lookups hash the prompt together with the model string (config.LLM_MODEL unless
+    a call passes its own llm_string, e.g. model plus sampling parameters). With an
+    embedder (any object with embed(texts) -> L2-normalized vectors), a miss falls back to
+    the most similar cached prompt for the same model when its cosine similarity is at
+    least similarity_threshold, so recurring boilerplate notices reuse the completion.
+    Entries are evicted by size (LRU) and age (ttl). save() persists them, with their
+    embeddings, so the cache survives restarts.
+    """
+    def __init__(self, model=DEFAULT_MODEL, path=None, maxsize=5000, ttl=7 * 86400, embedder=None,
+                 similarity_threshold=0.95, clock=time.time):
+        self.model = model
+        self.path = path
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+        self.clock = clock
+        # Wall-clock expiry, so remaining ages survive a restart
+        self.cache = LRUTTLCache(maxsize=maxsize, ttl=ttl, clock=clock)
+        self._vectors = {}  # key -> embedding; entries evicted from the cache are dropped lazily
+        self._matrix = None
+        self._matrix_keys = []
+        self._lock = threading.Lock()
+        self.exact_hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+        if path and os.path.exists(path):
+            self.load()
+
+    def get(self, prompt, llm_string=None):
+        """Cached completion for the prompt, or None."""
+        llm_string = llm_string or self.model
+        entry = self.cache.get(prompt_key(prompt, llm_string))
+        if entry is not None:
+            with self._lock:
+                self.exact_hits += 1
+            return entry["completion"]
+        if self.embedder is not None:
+            entry = self._similar(prompt, llm_string)
+            if entry is not None:
+                with self._lock:
+                    self.similar_hits += 1
+                return entry["completion"]
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, prompt, completion, llm_string=None):
+        llm_string = llm_string or self.model
+        key = prompt_key(prompt, llm_string)
+        self.cache.set(key, {"prompt": prompt, "completion": completion, "llm": llm_string})
+        if self.embedder is not None:
+            vector = np.asarray(self.embedder.embed([prompt])[0], dtype=np.float32)
+            with self._lock:
+                self._vectors[key] = vector
+                self._matrix = None
+                if len(self._vectors) > 2 * self.cache.maxsize:
+                    live = {k for k, _, _ in self.cache.items()}
+                    self._vectors = {k: v for k, v in self._vectors.items() if k in live}
+
+    def complete(self, prompt, generate, llm_string=None):
+        """Returns the cached completion, or calls generate(prompt) and caches its result."""
+        completion = self.get(prompt, llm_string)
+        if completion is None:
+            completion = generate(prompt)
+            self.put(prompt, completion, llm_string)
+        return completion
+
+    def _similar(self, prompt, llm_string):
+        query = np.asarray(self.embedder.embed([prompt])[0], dtype=np.float32)
+        with self._lock:
+            if self._matrix is None and self._vectors:
+                self._matrix_keys = list(self._vectors)
+                self._matrix = np.stack([self._vectors[k] for k in self._matrix_keys])
+            if self._matrix is None:
+                return None
+            matrix, keys = self._matrix, self._matrix_keys
+        similarities = matrix @ query
+        for row in np.argsort(-similarities):
+            if similarities[row] < self.similarity_threshold:
+                break
+            entry = self.cache.get(keys[row])
+            if entry is None:
+                with self._lock:
+                    if self._vectors.pop(keys[row], None) is not None:
+                        self._matrix = None
+                continue
+            if entry["llm"] == llm_string:
+                return entry
+        return None
+
+    def stats(self):
+        with self._lock:
+            lookups = self.exact_hits + self.similar_hits + self.misses
+            stats = {
+                "exact_hits": self.exact_hits,
+                "similar_hits": self.similar_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.exact_hits + self.similar_hits) / lookups, 4) if lookups else 0.0,
+            }
+        cache_stats = self.cache.stats()
+        stats.update({name: cache_stats[name] for name in ("size", "maxsize", "evictions", "expirations")})
+        return stats
+
+    def save(self, path=None):
+        """Writes live entries (and their embeddings) atomically; a no-op without a path."""
+        path = path or self.path
+        if not path:
+            return
+        entries = [{"key": key, "expires_at": expires_at, **value} for key, value, expires_at in self.cache.items()]
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path + ".tmp", 'w') as f:
+            json.dump({"model": self.model, "entries": entries}, f)
+        os.replace(path + ".tmp", path)
+        if self.embedder is not None:
+            with self._lock:
+                keys = [e["key"] for e in entries if e["key"] in self._vectors]
+                vectors = np.stack([self._vectors[k] for k in keys]) if keys else np.zeros((0, 0), dtype=np.float32)
+            with open(path + ".vectors.tmp", 'wb') as f:
+                np.savez(f, keys=np.asarray(keys), vectors=vectors)
+            os.replace(path + ".vectors.tmp", path + ".vectors.npz")
+
+    def load(self, path=None):
+        """Restores unexpired entries saved by save(); entries for another model are ignored."""
+        path = path or self.path
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if data.get("model") != self.model:
+            return
+        now = self.clock()
+        for entry in data.get("entries", []):
+            expires_at = entry.pop("expires_at")
+            if expires_at is not None and expires_at <= now:
+                continue
+            key = entry.pop("key")
+            self.cache.set(key, entry, ttl=None if expires_at is None else expires_at - now)
+        vectors_path = path + ".vectors.npz"
+        if self.embedder is not None and os.path.exists(vectors_path):
+            with np.load(vectors_path) as saved:
+                with self._lock:
+                    for key, vector in zip(saved["keys"].tolist(), saved["vectors"]):
+                        self._vectors[key] = vector.astype(np.float32)
+                    self._matrix = None
+
+    def as_langchain_cache(self):
+        """Adapter implementing LangChain's BaseCache (set it with langchain.globals.set_llm_cache)."""
+        from langchain_core.caches import BaseCache
+        from langchain_core.outputs import Generation
+
+        owner = self
+
+        class _LangChainCache(BaseCache):
+            def lookup(self, prompt, llm_string):
+                completion = owner.get(prompt, llm_string)
+                return None if completion is None else [Generation(text=completion)]
+
+            def update(self, prompt, llm_string, return_val):
+                owner.put(prompt, "".join(generation.text for generation in return_val), llm_string)
+
+            def clear(self, **kwargs):
+                owner.cache.clear()
+                with owner._lock:
+                    owner._vectors.clear()
+                    owner._matrix = None
+
+        return _LangChainCache()
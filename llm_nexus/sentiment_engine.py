@@ -1,46 +1,166 @@
-import random
+import hashlib
+import re
+
+import numpy as np
+
+try:
+    from llm_nexus.cache import LRUTTLCache
+except ImportError:
+    from cache import LRUTTLCache
+
+# Risk lexicon: term -> risk score a text containing it receives (highest matching term wins)
+RISK_LEXICON = {
+    # High Risk
+    "blockade": 0.8, "war": 0.8, "cyberattack": 0.8, "sanction": 0.8, "embargo": 0.8, "floods": 0.8, "strike": 0.8,
+    # Medium Risk
+    "delay": 0.5, "inflation": 0.5, "tariff": 0.5, "review": 0.5,
+}
+# Low Risk: texts without any lexicon term
+BASELINE_RISK = 0.1
+NOISE_AMPLITUDE = 0.05
+# Noise modes: "content" derives noise from the text (same text -> same score),
+# "rng" draws from the engine's seeded generator, "none" disables noise
+NOISE_MODES = ("content", "rng", "none")
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def normalize_text(text):
+    """Case-, whitespace- and punctuation-insensitive form used for memoization."""
+    return " ".join(WORD_PATTERN.findall(text.lower()))
+
+
+class CompiledLexicon:
+    """
+    Risk lexicon compiled once into a single regex alternation plus a weight table.
+    Scoring a batch joins the texts and runs one scan over the joined buffer; matches
+    are mapped back to their text by offset, and per-text maxima are taken with NumPy.
+    """
+    SEPARATOR = "\n"
+
+    def __init__(self, lexicon: dict, baseline: float = BASELINE_RISK):
+        terms = sorted(lexicon, key=len, reverse=True)
+        self.baseline = baseline
+        self.pattern = re.compile("|".join(re.escape(term.lower()) for term in terms))
+        self.weights = {term.lower(): weight for term, weight in lexicon.items()}
+
+    def score(self, texts: list) -> np.ndarray:
+        """Base risk per text (before noise), as a float array aligned with texts."""
+        scores = np.full(len(texts), self.baseline, dtype=np.float64)
+        if not texts:
+            return scores
+        # Lowercase before joining: lowercasing can change a text's length
+        lowered = [t.lower() for t in texts]
+        buffer = self.SEPARATOR.join(lowered)
+        # Start offset of each text in the joined buffer
+        lengths = np.fromiter((len(t) for t in lowered), dtype=np.int64, count=len(lowered))
+        starts = np.concatenate(([0], np.cumsum(lengths[:-1] + len(self.SEPARATOR))))
+
+        positions, weights = [], []
+        for match in self.pattern.finditer(buffer):
+            positions.append(match.start())
+            weights.append(self.weights[match.group()])
+        if positions:
+            owners = np.searchsorted(starts, np.asarray(positions), side="right") - 1
+            np.maximum.at(scores, owners, np.asarray(weights, dtype=np.float64))
+        return scores
+
 
 class SentimentEngine:
     """
     Analyzes unstructured text to produce a Risk Score (0.0 - 1.0).
-    In production, this would use a Transformer (BERT/RoBERTa).
+    By default scores with the risk lexicon plus simulated noise. In production, pass a
+    model backend (e.g. transformer_backend.TransformerRiskBackend); any object with
+    predict(texts) -> array of risk in [0, 1] works, and its scores are used without noise.
+
+    Scoring is reproducible: noise comes from the text itself or from a per-engine
+    generator seeded with `seed`. Scores are memoized in an LRU/TTL cache keyed by a hash
+    of the normalized text (of the raw text with a backend, which sees casing and
+    punctuation), so repeated headlines cost a dictionary lookup.
     """
-    def __init__(self, model_name="mock-transformer"):
+    def __init__(self, model_name="mock-transformer", lexicon=None, seed=0, noise="content",
+                 cache_size=10000, cache_ttl=None, backend=None):
+        if noise not in NOISE_MODES:
+            raise ValueError(f"noise must be one of {NOISE_MODES}")
         self.model_name = model_name
+        self.lexicon = CompiledLexicon(lexicon or RISK_LEXICON)
+        self.backend = backend
+        self.seed = seed
+        self.noise = noise
+        self.rng = np.random.default_rng(seed)
+        self._hash_key = str(seed).encode("utf-8")[:64]
+        self.cache = LRUTTLCache(maxsize=cache_size, ttl=cache_ttl) if cache_size else None
+
+    def _digest(self, normalized):
+        # Keyed by the seed, so differently seeded engines draw different content noise
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16, key=self._hash_key).digest()
+
+    def _noise(self, digests):
+        if self.noise == "none":
+            return np.zeros(len(digests))
+        if self.noise == "rng":
+            return self.rng.uniform(-NOISE_AMPLITUDE, NOISE_AMPLITUDE, size=len(digests))
+        # Content noise: the first 8 digest bytes as a uniform draw in [0, 1)
+        uniform = np.array([int.from_bytes(d[:8], "little") for d in digests], dtype=np.float64) / 2.0 ** 64
+        return (2.0 * uniform - 1.0) * NOISE_AMPLITUDE
 
     def analyze_risk(self, text):
         """
         Returns a float between 0.0 (Safe) and 1.0 (Critical Risk).
         """
-        # Mock Logic based on keywords
-        text_lower = text.lower()
-        
-        if any(w in text_lower for w in ["blockade", "war", "cyberattack", "sanction", "embargo", "floods", "strike"]):
-            # High Risk
-            base_score = 0.8
-        elif any(w in text_lower for w in ["delay", "inflation", "tariff", "review"]):
-            # Medium Risk
-            base_score = 0.5
-        else:
-            # Low Risk
-            base_score = 0.1
-            
-        # Add noise to simulate model uncertainty
-        noise = random.uniform(-0.05, 0.05)
-        final_score = max(0.0, min(1.0, base_score + noise))
-        
-        return final_score
+        return float(self.analyze_risk_batch([text])[0])
+
+    def analyze_risk_batch(self, texts):
+        """
+        Scores a list of texts in one pass; returns a NumPy array of risk scores in [0, 1].
+        Cached texts are looked up; only the misses are scored.
+        """
+        # The lexicon scores normalized text; a model backend scores the original text, so
+        # texts differing only in casing or punctuation must not share its cached score
+        normalized = [normalize_text(t) for t in texts] if self.backend is None else None
+        digests = [self._digest(t) for t in (texts if normalized is None else normalized)]
+        scores = np.empty(len(digests), dtype=np.float64)
+
+        missing = []
+        for i, digest in enumerate(digests):
+            cached = self.cache.get(digest) if self.cache is not None else None
+            if cached is None:
+                missing.append(i)
+            else:
+                scores[i] = cached
+
+        if missing:
+            if self.backend is not None:
+                fresh = np.clip(np.asarray(self.backend.predict([texts[i] for i in missing]), dtype=np.float64), 0.0, 1.0)
+            else:
+                base_scores = self.lexicon.score([normalized[i] for i in missing])
+                # Add noise to simulate model uncertainty
+                fresh = np.clip(base_scores + self._noise([digests[i] for i in missing]), 0.0, 1.0)
+            scores[missing] = fresh
+            if self.cache is not None:
+                for i, score in zip(missing, fresh.tolist()):
+                    self.cache.set(digests[i], score)
+        return scores
+
+    def cache_stats(self):
+        """Memo cache counters (hits, misses, hit_rate, ...); empty when caching is disabled."""
+        return self.cache.stats() if self.cache is not None else {}
+
+    def backend_metrics(self):
+        """Throughput and latency reported by the model backend; empty for the lexicon."""
+        metrics = getattr(self.backend, "metrics", None)
+        return metrics() if metrics else {}
 
     def update_volatility_index(self, signals, current_volatility):
         """
         Aggregates risk scores from multiple signals to update the global volatility index.
+        The step depends on how signals are batched; feed_volatility() does not.
         """
         if not signals:
             return current_volatility
-            
-        risk_scores = [self.analyze_risk(s['content']) for s in signals]
-        avg_risk = sum(risk_scores) / len(risk_scores)
-        
+
+        risk_scores = self.analyze_risk_batch([s['content'] for s in signals])
+        avg_risk = float(risk_scores.mean())
+
         # Logic: If avg_risk is high (>0.7), trigger a volatility spike
         if avg_risk > 0.7:
             # Significant spike
@@ -51,5 +171,15 @@ class SentimentEngine:
         else:
             # Calm period, decay volatility
             new_volatility = max(0.0, current_volatility * 0.9)
-            
+
         return new_volatility
+
+    def feed_volatility(self, signals, estimator):
+        """
+        Scores signals and adds each to a streaming volatility.VolatilityEstimator at its
+        own timestamp. Returns the index for every horizon ({"1h": ..., "24h": ..., "7d": ...}).
+        """
+        if signals:
+            risk_scores = self.analyze_risk_batch([s['content'] for s in signals])
+            estimator.update_many(risk_scores.tolist(), [s.get('timestamp') for s in signals])
+        return estimator.value()
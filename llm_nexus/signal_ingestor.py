@@ -1,13 +1,23 @@
+import asyncio
+import inspect
+import logging
 import random
 import time
 
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
 class SignalIngestor:
     """
     Ingests and parses geopolitical signals from External Feeds.
     Mocks a connection to Defense.gov RSS.
+    With a dedup filter (dedup.DuplicateFilter), headlines already seen within its window
+    are dropped before they reach the risk engine.
     """
-    def __init__(self, source="defense.gov"):
+    def __init__(self, source="defense.gov", dedup=None):
         self.source = source
+        self.dedup = dedup
         self.synthetic_headlines = [
             ("DoD announces blockade in Strait of Hormuz", "HIGH"),
             ("New trade deal signed with key semiconductor partner", "LOW"),
@@ -30,6 +40,8 @@ class SignalIngestor:
         
         signals = []
         for text, risk_label in selection:
+            if self.dedup is not None and self.dedup.seen(text):
+                continue
             signals.append({
                 "source": self.source,
                 "timestamp": time.time(),
@@ -39,6 +51,157 @@ class SignalIngestor:
             
         return signals
 
+class StreamingSignalIngestor:
+    """
+    Async streaming ingestion: one reader task per feed pushes signals into a bounded
+    asyncio queue, and a single consumer scores them in batches with the risk engine.
+
+    Feeds are SignalIngestor-like objects (a `source` name plus fetch_latest_signals(), or
+    an async fetch_async()). Blocking fetches and scoring run in worker threads, so a slow
+    feed never stalls the event loop or the other feeds. When the queue is full, readers
+    wait on put() (backpressure) and the wait is recorded per feed. stop() lets readers
+    finish their current fetch, then the consumer drains the queue before run() returns.
+    With a dedup filter (dedup.DuplicateFilter), repeats of a headline within its window,
+    across all feeds, are dropped before they are queued, so each counts once in scoring.
+    """
+    def __init__(self, feeds, engine, poll_interval=1.0, queue_size=1000, batch_size=32, max_wait=0.25,
+                 on_batch=None, dedup=None):
+        self.feeds = list(feeds)
+        self.engine = engine
+        self.poll_interval = poll_interval
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.on_batch = on_batch
+        self.dedup = dedup
+        self.scored = 0
+        self.batches = 0
+        self.callback_errors = 0
+        self.feed_stats = {
+            feed.source: {"fetches": 0, "errors": 0, "signals": 0, "duplicates": 0, "scored": 0, "backpressure_seconds": 0.0,
+                          "last_lag_seconds": None, "max_lag_seconds": 0.0}
+            for feed in self.feeds
+        }
+        self._loop = None
+        self._stop = None
+        self.queue = None
+
+    async def run(self):
+        """Runs readers and the consumer until stop() is called and the queue is drained."""
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        consumer = asyncio.create_task(self._consume())
+        await asyncio.gather(*(self._read(feed) for feed in self.feeds))
+        await self.queue.put(_STOP)
+        await consumer
+
+    def stop(self):
+        """Requests a graceful shutdown; safe to call from any thread."""
+        if self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(self._stop.set)
+
+    async def _fetch(self, feed):
+        fetch_async = getattr(feed, "fetch_async", None)
+        if fetch_async is not None and inspect.iscoroutinefunction(fetch_async):
+            return await fetch_async()
+        return await asyncio.to_thread(feed.fetch_latest_signals)
+
+    async def _read(self, feed):
+        stats = self.feed_stats[feed.source]
+        while not self._stop.is_set():
+            try:
+                signals = await self._fetch(feed)
+            except Exception as e:
+                stats["errors"] += 1
+                logger.error(f"Feed {feed.source}: fetch failed: {e}")
+                signals = []
+            stats["fetches"] += 1
+            for signal in signals:
+                if self.dedup is not None and self.dedup.seen(signal["content"], signal.get("timestamp")):
+                    stats["duplicates"] += 1
+                    continue
+                started = time.monotonic()
+                await self.queue.put((feed.source, signal))
+                stats["backpressure_seconds"] += time.monotonic() - started
+                stats["signals"] += 1
+            try:
+                await asyncio.wait_for(self._stop.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _next_batch(self):
+        """Up to batch_size items, waiting at most max_wait after the first; (batch, stopping)."""
+        item = await self.queue.get()
+        if item is _STOP:
+            return [], True
+        batch = [item]
+        deadline = self._loop.time() + self.max_wait
+        while len(batch) < self.batch_size:
+            remaining = deadline - self._loop.time()
+            if remaining <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self.queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    async def _consume(self):
+        while True:
+            batch, stopping = await self._next_batch()
+            if batch:
+                await self._score(batch)
+            if stopping:
+                return
+
+    async def _score(self, batch):
+        signals = [signal for _, signal in batch]
+        try:
+            scores = await asyncio.to_thread(self.engine.analyze_risk_batch, [s["content"] for s in signals])
+        except Exception as e:
+            logger.error(f"Risk scoring failed for a batch of {len(batch)} signals: {e}")
+            return
+        now = time.time()
+        scored = []
+        for (source, signal), score in zip(batch, scores):
+            scored.append(dict(signal, risk_score=float(score)))
+            stats = self.feed_stats[source]
+            lag = now - signal.get("timestamp", now)
+            stats["scored"] += 1
+            stats["last_lag_seconds"] = round(lag, 3)
+            stats["max_lag_seconds"] = max(stats["max_lag_seconds"], round(lag, 3))
+        self.scored += len(scored)
+        self.batches += 1
+        if self.on_batch is not None:
+            # A failing callback must not stop the consumer, or readers would block on a full queue
+            try:
+                result = self.on_batch(scored)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                self.callback_errors += 1
+                logger.error(f"on_batch callback failed for a batch of {len(scored)} signals: {e}")
+
+    def metrics(self):
+        """Queue depth, batch counts and per-feed fetch/backpressure/lag metrics."""
+        metrics = {
+            "queue_depth": self.queue.qsize() if self.queue is not None else 0,
+            "queue_size": self.queue_size,
+            "scored": self.scored,
+            "batches": self.batches,
+            "callback_errors": self.callback_errors,
+            "feeds": {source: dict(stats) for source, stats in self.feed_stats.items()},
+        }
+        if self.dedup is not None:
+            metrics["dedup"] = self.dedup.stats()
+        return metrics
+
+
 if __name__ == "__main__":
     ingestor = SignalIngestor()
     print(ingestor.fetch_latest_signals())
@@ -0,0 +1,81 @@
+import os
+
+import numpy as np
+
+try:
+    from llm_nexus.batching import MicroBatcher
+except ImportError:
+    from batching import MicroBatcher
+
+try:
+    import config
+    DEFAULT_MODEL_DIR = config.RISK_MODEL_DIR
+except (ImportError, AttributeError):
+    DEFAULT_MODEL_DIR = "models/risk-classifier"
+
+# Labels whose probability is read as risk, checked in order against the model's id2label
+RISK_LABELS = ("risk", "negative", "neg", "label_1")
+
+
+class TransformerRiskBackend:
+    """
+    CPU sequence-classification model (BERT/RoBERTa) loaded from a local directory, behind
+    the SentimentEngine backend interface: predict(texts) -> np.ndarray of risk in [0, 1].
+
+    Runs fully offline: the Hugging Face hub is disabled and files are read from model_dir
+    only (config.RISK_MODEL_DIR unless one is passed).
+    Each text goes through a MicroBatcher, so concurrent analyze_risk() calls made one
+    headline at a time are grouped into padded batches of similar length. The risk score is
+    the probability of the risk label (RISK_LABELS, or risk_label when given).
+    """
+    def __init__(self, model_dir=None, max_length=128, max_batch_size=32, max_wait_ms=5.0, workers=2,
+                 torch_threads=None, risk_label=None):
+        # Never reach for the network, even if a model name is passed by mistake
+        os.environ.setdefault("HF_HUB_OFFLINE", "1")
+        os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+        import torch
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+        model_dir = model_dir or DEFAULT_MODEL_DIR
+        if not os.path.isdir(model_dir):
+            raise FileNotFoundError(f"Risk model directory not found: {model_dir}")
+        self.torch = torch
+        if torch_threads:
+            torch.set_num_threads(torch_threads)
+        self.model_dir = model_dir
+        self.max_length = max_length
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir, local_files_only=True)
+        self.model = AutoModelForSequenceClassification.from_pretrained(model_dir, local_files_only=True)
+        self.model.eval()
+        self.risk_index = self._risk_index(risk_label)
+        # Bucket by whitespace token count; cheap, and close enough to subword length for padding
+        self.batcher = MicroBatcher(self._predict_batch, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms,
+                                    workers=workers, length_fn=lambda text: len(text.split()), bucket_width=8)
+
+    def _risk_index(self, risk_label):
+        labels = {str(label).lower(): int(index) for index, label in self.model.config.id2label.items()}
+        candidates = (risk_label.lower(),) if risk_label else RISK_LABELS
+        for label in candidates:
+            if label in labels:
+                return labels[label]
+        if risk_label:
+            raise ValueError(f"Label '{risk_label}' not in model labels {sorted(labels)}")
+        # Binary heads without meaningful names: the last class is the positive (risk) one
+        return max(labels.values())
+
+    def _predict_batch(self, texts):
+        encoded = self.tokenizer(texts, padding="longest", truncation=True, max_length=self.max_length,
+                                 return_tensors="pt")
+        with self.torch.inference_mode():
+            logits = self.model(**encoded).logits
+        return self.torch.softmax(logits, dim=-1)[:, self.risk_index].tolist()
+
+    def predict(self, texts):
+        return np.asarray(self.batcher.map(texts), dtype=np.float64)
+
+    def metrics(self):
+        """Throughput (texts/sec), batch sizes, padding efficiency and latency percentiles."""
+        return self.batcher.metrics()
+
+    def close(self):
+        self.batcher.close()
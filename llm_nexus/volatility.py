@@ -0,0 +1,145 @@
+import itertools
+import json
+import math
+import os
+import threading
+import time
+
+DEFAULT_HORIZONS = {"1h": 3600.0, "24h": 86400.0, "7d": 604800.0}
+
+
+class _Shard:
+    """Decayed sums for every horizon, referenced to the shard's latest timestamp."""
+    __slots__ = ("lock", "reference", "weighted", "weights")
+
+    def __init__(self, horizons):
+        self.lock = threading.Lock()
+        self.reference = None
+        self.weighted = [0.0] * horizons  # sum of w_i * risk_i
+        self.weights = [0.0] * horizons   # sum of w_i
+
+    def decayed_to(self, now, taus):
+        """(weighted, weights) per horizon, decayed from the reference time to now."""
+        with self.lock:
+            if self.reference is None:
+                return [0.0] * len(taus), [0.0] * len(taus)
+            factors = [math.exp(-max(now - self.reference, 0.0) / tau) for tau in taus]
+            return ([s * f for s, f in zip(self.weighted, factors)],
+                    [w * f for w, f in zip(self.weights, factors)])
+
+
+class VolatilityEstimator:
+    """
+    Streaming volatility index: an exponentially time-decayed mean of risk scores, kept for
+    several horizons at once (time constants, default 1h / 24h / 7d).
+
+    Each update is O(1) per horizon and uses the signal's own timestamp, so results do not
+    depend on how signals are batched; late signals are weighted by their age. With no
+    recent evidence the index decays toward `baseline` (a prior of `prior_weight` signals).
+    Producers update one of `shards` independently locked accumulators, assigned per thread
+    round-robin, so concurrent writers rarely contend; reads merge the shards.
+    checkpoint()/restore() persist the state.
+    """
+    def __init__(self, horizons=None, baseline=0.0, prior_weight=1.0, shards=8, clock=time.time):
+        self.horizons = dict(horizons or DEFAULT_HORIZONS)
+        self.names = list(self.horizons)
+        self.taus = [float(self.horizons[name]) for name in self.names]
+        self.baseline = baseline
+        self.prior_weight = prior_weight
+        self.clock = clock
+        self._shards = [_Shard(len(self.taus)) for _ in range(max(1, shards))]
+        # Each producer thread is pinned to a shard on first use, round-robin. Thread idents
+        # are aligned addresses, so hashing them modulo the shard count would pick one shard.
+        self._local = threading.local()
+        self._next_shard = itertools.count()
+
+    def _shard(self):
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = self._shards[next(self._next_shard) % len(self._shards)]
+        return shard
+
+    def update(self, risk, timestamp=None):
+        """Adds one risk score observed at timestamp (epoch seconds; default now)."""
+        timestamp = self.clock() if timestamp is None else timestamp
+        shard = self._shard()
+        with shard.lock:
+            if shard.reference is None:
+                shard.reference = timestamp
+            if timestamp >= shard.reference:
+                # Move the reference forward: decay what is there, add the new score at full weight
+                for i, tau in enumerate(self.taus):
+                    factor = math.exp(-(timestamp - shard.reference) / tau)
+                    shard.weighted[i] = shard.weighted[i] * factor + risk
+                    shard.weights[i] = shard.weights[i] * factor + 1.0
+                shard.reference = timestamp
+            else:
+                # Late signal: add it already decayed by its age relative to the reference
+                for i, tau in enumerate(self.taus):
+                    weight = math.exp(-(shard.reference - timestamp) / tau)
+                    shard.weighted[i] += risk * weight
+                    shard.weights[i] += weight
+
+    def update_many(self, scores, timestamps=None):
+        """Adds a sequence of risk scores (with matching timestamps, or all at now)."""
+        if timestamps is None:
+            timestamps = [None] * len(scores)
+        for risk, timestamp in zip(scores, timestamps):
+            self.update(risk, timestamp)
+
+    def _totals(self, now):
+        weighted = [0.0] * len(self.taus)
+        weights = [0.0] * len(self.taus)
+        for shard in self._shards:
+            s, w = shard.decayed_to(now, self.taus)
+            weighted = [a + b for a, b in zip(weighted, s)]
+            weights = [a + b for a, b in zip(weights, w)]
+        return weighted, weights
+
+    def value(self, horizon=None, now=None):
+        """Index in [0, 1] for one horizon, or {horizon: index} for all of them."""
+        weighted, weights = self._totals(self.clock() if now is None else now)
+        values = {
+            name: (s + self.baseline * self.prior_weight) / (w + self.prior_weight) if w + self.prior_weight else self.baseline
+            for name, s, w in zip(self.names, weighted, weights)
+        }
+        return values if horizon is None else values[horizon]
+
+    def evidence(self, now=None):
+        """Effective (decayed) number of signals behind each horizon's index."""
+        _, weights = self._totals(self.clock() if now is None else now)
+        return dict(zip(self.names, weights))
+
+    def state(self, now=None):
+        """Serializable state: shards merged and decayed to `now`."""
+        now = self.clock() if now is None else now
+        weighted, weights = self._totals(now)
+        return {"reference": now, "horizons": self.horizons, "weighted": weighted, "weights": weights,
+                "baseline": self.baseline, "prior_weight": self.prior_weight}
+
+    def checkpoint(self, path):
+        """Writes the state atomically (tmp file + rename)."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path + ".tmp", 'w') as f:
+            json.dump(self.state(), f)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def from_state(cls, state, shards=8, clock=time.time):
+        estimator = cls(state["horizons"], state.get("baseline", 0.0), state.get("prior_weight", 1.0),
+                        shards=shards, clock=clock)
+        shard = estimator._shards[0]
+        shard.reference = state["reference"]
+        shard.weighted = list(state["weighted"])
+        shard.weights = list(state["weights"])
+        return estimator
+
+    @classmethod
+    def restore(cls, path, shards=8, clock=time.time, **defaults):
+        """Loads a checkpoint; a missing file yields a fresh estimator built from defaults."""
+        if not os.path.exists(path):
+            return cls(shards=shards, clock=clock, **defaults)
+        with open(path, 'r') as f:
+            return cls.from_state(json.load(f), shards=shards, clock=clock)
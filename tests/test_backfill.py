@@ -0,0 +1,150 @@
+import unittest
+import os
+import json
+import time
+import tempfile
+import logging
+from govsignal.backfill import BackfillRunner, partition_date_range
+from govsignal.ratelimit import RateLimiter
+from .mocks import MockScout
+
+logging.disable(logging.CRITICAL)
+
+
+class DatedConnector:
+    SUPPORTED_FILTERS = frozenset({"keyword", "date_range"})
+    FILTER_FIELDS = {"date_range": "postedDate"}
+
+    def __init__(self):
+        self.windows = []
+
+    def get_opportunities(self, keywords, filters=None):
+        self.windows.append(filters["date_range"])
+        start, _ = filters["date_range"]
+        return [{"title": f"Wafer fab notice {start}", "description": "wafer", "postedDate": start}]
+
+
+class UndatedConnector(DatedConnector):
+    SUPPORTED_FILTERS = frozenset({"keyword"})
+
+
+class BackfillScout(MockScout):
+    def __init__(self):
+        super().__init__()
+        self.targets = {"Semiconductors": {"related_asset": "Chamber", "keywords": ["wafer"]}}
+        self.dated = DatedConnector()
+        self.undated = UndatedConnector()
+
+    def _sources(self):
+        return [
+            ("DATED", self.dated, self.dated.get_opportunities, "Dated Feed", ("title", "description")),
+            ("UNDATED", self.undated, self.undated.get_opportunities, "Undated Feed", ("title", "description")),
+        ]
+
+
+class TestBackfill(unittest.TestCase):
+    def test_partitioning(self):
+        parts = partition_date_range("2024-01-01", "2024-03-05", 31)
+        self.assertEqual(parts, [("2024-01-01", "2024-01-31"), ("2024-02-01", "2024-03-02"),
+                                 ("2024-03-03", "2024-03-05")])
+        with self.assertRaises(ValueError):
+            partition_date_range("2024-02-01", "2024-01-01")
+
+    def test_resume_from_checkpoint(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            checkpoint = os.path.join(tmp, "ckpt.json")
+            scout = BackfillScout()
+            runner = BackfillRunner(scout, checkpoint_path=checkpoint, partition_days=10,
+                                    max_workers=3, requests_per_second=1000)
+
+            # Simulate a crash while the second partition's signals are being consumed
+            stream = runner.run("2024-01-01", "2024-01-30")
+            next(stream)
+            next(stream)
+            stream.close()
+            with open(checkpoint) as f:
+                done = json.load(f)["completed"]
+            self.assertEqual(len(done), 1)
+
+            signals = list(BackfillRunner(scout, checkpoint_path=checkpoint, partition_days=10,
+                                          requests_per_second=1000).run("2024-01-01", "2024-01-30"))
+            self.assertEqual(len(signals), 2)
+            self.assertEqual(scout.undated.windows, [])
+            self.assertEqual(signals[0]["source"], "Dated Feed")
+
+            # Everything is checkpointed now: a rerun fetches nothing
+            fetched = len(scout.dated.windows)
+            rerun = list(BackfillRunner(scout, checkpoint_path=checkpoint, partition_days=10,
+                                        requests_per_second=1000).run("2024-01-01", "2024-01-30"))
+            self.assertEqual(rerun, [])
+            self.assertEqual(len(scout.dated.windows), fetched)
+
+    def test_closing_stream_stops_fetching(self):
+        scout = BackfillScout()
+        fetch = scout.dated.get_opportunities
+
+        def slow_fetch(keywords, filters=None):
+            time.sleep(0.05)
+            return fetch(keywords, filters)
+        scout._sources = lambda: [("DATED", scout.dated, slow_fetch, "Dated Feed", ("title", "description"))]
+
+        runner = BackfillRunner(scout, partition_days=1, max_workers=2, requests_per_second=1000)
+        stream = runner.run("2024-01-01", "2024-01-20")
+        next(stream)
+        started = time.monotonic()
+        stream.close()
+        self.assertLess(time.monotonic() - started, 0.5)
+        time.sleep(0.2)  # let in-flight fetches settle
+        # The consumed partition, its replacement and the other in-flight one at most
+        self.assertLessEqual(len(scout.dated.windows), 4)
+
+    def test_no_keyword_pushdown_with_code_routing(self):
+        scout = BackfillScout()
+        scout.config = {"code_routing": {"enabled": True}}
+        calls = []
+        scout._query_source = lambda connector, fetch, keywords, filters: calls.append(keywords) or []
+        list(BackfillRunner(scout, partition_days=10, requests_per_second=1000).run("2024-01-01", "2024-01-10"))
+        self.assertEqual(calls, [[]])
+
+    def test_deliver_emits_before_checkpoint(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            checkpoint = os.path.join(tmp, "ckpt.json")
+            scout = BackfillScout()
+            batches = []
+
+            class RecordingSink:
+                def emit(self, signals):
+                    done = 0
+                    if os.path.exists(checkpoint):
+                        with open(checkpoint) as f:
+                            done = len(json.load(f)["completed"])
+                    batches.append((len(signals), done))
+
+                def close(self):
+                    pass
+            scout.sinks = [RecordingSink()]
+
+            runner = BackfillRunner(scout, checkpoint_path=checkpoint, partition_days=10, max_workers=1,
+                                    requests_per_second=1000)
+            self.assertEqual(runner.deliver("2024-01-01", "2024-01-30", batch_size=100), 3)
+            # One flush per partition, each before that partition was checkpointed
+            self.assertEqual(batches, [(1, 0), (1, 1), (1, 2)])
+
+    def test_emit_stream_batches(self):
+        scout = BackfillScout()
+        batches = []
+        scout.emit = lambda signals: batches.append(len(signals)) or signals
+        self.assertEqual(scout.emit_stream(({"n": i} for i in range(7)), batch_size=3), 7)
+        self.assertEqual(batches, [3, 3, 1])
+
+    def test_rate_limiter(self):
+        limiter = RateLimiter(rate=100, burst=1)
+        start = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.045)
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Refined by GovSignal Automation
@@ -0,0 +1,134 @@
+import threading
+import time
+import unittest
+import logging
+from llm_nexus.batching import MicroBatcher
+
+try:
+    import numpy as np
+    from llm_nexus.sentiment_engine import SentimentEngine
+except ImportError:  # numpy is part of the full build environment
+    np = None
+
+logging.disable(logging.CRITICAL)
+
+
+class RecordingModel:
+    """Stands in for a transformer: records batch compositions, scores by text length."""
+    def __init__(self, delay=0.0):
+        self.batches = []
+        self.delay = delay
+        self.lock = threading.Lock()
+
+    def __call__(self, texts):
+        with self.lock:
+            self.batches.append(list(texts))
+        time.sleep(self.delay)
+        return [len(t) / 100.0 for t in texts]
+
+    def predict(self, texts):
+        return self(texts)
+
+
+class TestMicroBatcher(unittest.TestCase):
+    def test_map_preserves_order(self):
+        model = RecordingModel()
+        batcher = MicroBatcher(model, max_batch_size=8, max_wait_ms=20)
+        texts = [f"headline {'x' * i}" for i in range(20)]
+        self.assertEqual(batcher.map(texts), [len(t) / 100.0 for t in texts])
+        batcher.close()
+        self.assertTrue(all(len(b) <= 8 for b in model.batches))
+
+    def test_concurrent_single_calls_are_grouped(self):
+        model = RecordingModel()
+        batcher = MicroBatcher(model, max_batch_size=16, max_wait_ms=100, bucket_width=1000)
+        results = {}
+
+        def call(i):
+            results[i] = batcher.submit(f"text {i}").result()
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        batcher.close()
+        self.assertEqual(len(results), 16)
+        # 16 single-text callers should take far fewer than 16 model calls
+        self.assertLess(len(model.batches), 8)
+
+    def test_length_buckets_limit_padding(self):
+        model = RecordingModel()
+        batcher = MicroBatcher(model, max_batch_size=32, max_wait_ms=50, bucket_width=10)
+        short, long = ["a" * 5] * 4, ["b" * 95] * 4
+        batcher.map(short + long)
+        batcher.close()
+        for batch in model.batches:
+            self.assertEqual(len({len(t) // 10 for t in batch}), 1)
+        self.assertEqual(batcher.metrics()["padding_efficiency"], 1.0)
+
+    def test_max_wait_flushes_partial_batch(self):
+        batcher = MicroBatcher(RecordingModel(), max_batch_size=1000, max_wait_ms=10)
+        start = time.monotonic()
+        self.assertEqual(batcher.submit("abc").result(timeout=2), 0.03)
+        self.assertLess(time.monotonic() - start, 1.0)
+        batcher.close()
+
+    def test_errors_propagate_to_callers(self):
+        def broken(texts):
+            raise RuntimeError("model failed")
+        batcher = MicroBatcher(broken, max_wait_ms=1)
+        with self.assertRaises(RuntimeError):
+            batcher.submit("x").result(timeout=2)
+        batcher.close()
+
+    def test_result_count_mismatch_fails_every_caller(self):
+        batcher = MicroBatcher(lambda texts: [0.5], max_batch_size=4, max_wait_ms=50)
+        futures = [batcher.submit(text) for text in ("a", "b", "c")]
+        for future in futures:
+            with self.assertRaises(ValueError):
+                future.result(timeout=2)
+        batcher.close()
+
+    def test_metrics(self):
+        batcher = MicroBatcher(RecordingModel(), max_batch_size=4, max_wait_ms=1)
+        batcher.map(["a", "b", "c", "d", "e"])
+        batcher.close()
+        metrics = batcher.metrics()
+        self.assertEqual(metrics["items"], 5)
+        self.assertGreater(metrics["throughput_per_sec"], 0)
+        self.assertIn("p99", metrics["latency_ms"])
+
+    def test_closed_batcher_rejects(self):
+        batcher = MicroBatcher(RecordingModel())
+        batcher.close()
+        with self.assertRaises(RuntimeError):
+            batcher.submit("late")
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestEngineBackend(unittest.TestCase):
+    def test_backend_scores_replace_lexicon(self):
+        model = RecordingModel()
+        engine = SentimentEngine(backend=model)
+        self.assertAlmostEqual(engine.analyze_risk("Diplomatic talks"), 0.16)
+        # Memoized: a repeat does not reach the model
+        engine.analyze_risk("Diplomatic talks")
+        self.assertEqual(len(model.batches), 1)
+        self.assertEqual(engine.backend_metrics(), {})
+
+    def test_backend_cache_respects_raw_text(self):
+        class CaseSensitiveModel:
+            def predict(self, texts):
+                return [0.9 if t.isupper() else 0.2 for t in texts]
+        engine = SentimentEngine(backend=CaseSensitiveModel())
+        self.assertAlmostEqual(engine.analyze_risk("missile launch"), 0.2)
+        self.assertAlmostEqual(engine.analyze_risk("MISSILE LAUNCH"), 0.9)
+        self.assertAlmostEqual(engine.analyze_risk("missile launch"), 0.2)
+        self.assertEqual(engine.cache_stats()["hits"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Refined by GovSignal Automation
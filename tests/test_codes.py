@@ -0,0 +1,107 @@
+import unittest
+import logging
+from govsignal.codes import CodeIndex, asset_categories, extract_codes
+from govsignal.connectors import SamGovConnector, FederalRegisterConnector
+from .mocks import MockScout
+
+logging.disable(logging.CRITICAL)
+
+ASSETS = [
+    {"name": "Traveling Wave Tube (TWT)", "keywords": ["TWT Amplifier", "Electronic Warfare"],
+     "naics_codes": ["3345"], "psc_codes": ["5865"]},
+    {"name": "Ultra-High Vacuum Chamber", "keywords": ["UHV Chamber", "Lithography"],
+     "naics_codes": ["334413"], "psc_codes": []},
+]
+TARGETS = {
+    "Defense_Systems": {"related_asset": "TWT Amplifiers", "keywords": ["Jamming Pods"]},
+    "Semiconductors": {"related_asset": "High-Vacuum Chamber", "keywords": ["Wafer"]},
+}
+
+
+class TestCodes(unittest.TestCase):
+    def test_extract_codes_from_fields_and_text(self):
+        record = {"naicsCode": "334511", "description": "Set-aside under NAICS code 334220, PSC: 5865."}
+        naics, psc = extract_codes(record, ("description",))
+        self.assertEqual(naics, {"334511", "334220"})
+        self.assertEqual(psc, {"5865"})
+
+    def test_hierarchical_lookup(self):
+        index = CodeIndex(ASSETS)
+        self.assertEqual(index.assets_for_naics("334511"), ("Traveling Wave Tube (TWT)",))
+        self.assertEqual(index.assets_for_naics("334413"), ("Ultra-High Vacuum Chamber",))
+        self.assertEqual(index.assets_for_naics("541330"), ())
+        self.assertEqual(index.lookup({"334511"}, {"5865"}),
+                         {"Traveling Wave Tube (TWT)": ["NAICS:334511", "PSC:5865"]})
+
+    def test_asset_categories(self):
+        links = asset_categories(TARGETS, ASSETS)
+        self.assertEqual(links["Traveling Wave Tube (TWT)"], ["Defense_Systems"])
+        self.assertEqual(links["Ultra-High Vacuum Chamber"], ["Semiconductors"])
+
+    def test_coded_documents_route_without_keywords(self):
+        scout = MockScout()
+        scout.targets = TARGETS
+        scout.config = {"code_routing": {"enabled": True}}
+        scout._code_router = (CodeIndex(ASSETS), asset_categories(TARGETS, ASSETS))
+
+        documents = [
+            # Coded: routed to Defense_Systems although no keyword matches
+            {"title": "Depot support", "description": "Sustainment", "naicsCode": "334511", "classificationCode": "5865"},
+            # Uncoded: keyword scan fallback
+            {"title": "Fab", "description": "Wafer handling"},
+        ]
+        signals = list(scout.score_documents(documents, "SAM.gov", ("description",), SamGovConnector.FILTER_FIELDS))
+        self.assertEqual([s["target_category"] for s in signals], ["Defense_Systems", "Semiconductors"])
+        self.assertEqual(signals[0]["matched_codes"], ["NAICS:334511", "PSC:5865"])
+        self.assertEqual(signals[0]["demand_probability"], 0.8)
+        self.assertNotIn("matched_codes", signals[1])
+
+    def test_uncoded_categories_keep_keyword_scoring(self):
+        scout = MockScout()
+        scout.targets = TARGETS
+        scout.config = {"code_routing": {"enabled": True}}
+        scout._code_router = (CodeIndex(ASSETS), asset_categories(TARGETS, ASSETS))
+
+        # The code routes to Defense_Systems only; Semiconductors still scores by keyword
+        documents = [{"description": "Wafer handling for depot support", "naicsCode": "334511"}]
+        signals = list(scout.score_documents(documents, "SAM.gov", ("description",)))
+        by_category = {s["target_category"]: s for s in signals}
+        self.assertEqual(by_category["Defense_Systems"]["matched_codes"], ["NAICS:334511"])
+        self.assertEqual(by_category["Semiconductors"]["demand_probability"], 0.6)
+        self.assertNotIn("matched_codes", by_category["Semiconductors"])
+
+    def test_codes_never_lower_keyword_score(self):
+        scout = MockScout()
+        scout.targets = {"Defense_Systems": {"related_asset": "TWT Amplifiers",
+                                             "keywords": ["Electronic Warfare", "Jamming Pods"]}}
+        sam = SamGovConnector()
+        record = sam.get_opportunities([])[0]
+        baseline = list(scout.score_documents([dict(record)], "SAM.gov", ("description",)))
+        self.assertEqual(baseline[0]["demand_probability"], 0.8)
+
+        # Two keyword hits outweigh the record's single matching NAICS code
+        scout.config = {"code_routing": {"enabled": True}}
+        scout._code_router = (CodeIndex(ASSETS), asset_categories(scout.targets, ASSETS))
+        routed = list(scout.score_documents([dict(record)], "SAM.gov", ("description",)))
+        self.assertEqual(routed[0]["demand_probability"], 0.8)
+        self.assertEqual(routed[0]["erp_action_recommendation"], "release_capital_hold")
+        self.assertEqual(routed[0]["matched_codes"], ["NAICS:334511"])
+
+    def test_polled_cycle_routes_by_code(self):
+        scout = MockScout()
+        # No configured keyword occurs in the SAM.gov mock record; only its NAICS code links it
+        scout.targets = {"Defense_Systems": {"assets": ["Traveling Wave Tube (TWT)"], "keywords": ["Radome"]}}
+        scout.config = {"code_routing": {"enabled": True}}
+        scout._code_router = (CodeIndex(ASSETS), asset_categories(scout.targets, ASSETS))
+        scout.sam_connector, scout.fr_connector = SamGovConnector(), FederalRegisterConnector()
+        scout.active_local_keys, scout.active_local_connectors = [], []
+        scout.router = None
+
+        signals = scout.collect_signals()
+        self.assertEqual([s["matched_codes"] for s in signals], [["NAICS:334511"]])
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Refined by GovSignal Automation
@@ -0,0 +1,84 @@
+import asyncio
+import time
+import unittest
+import logging
+from llm_nexus.dedup import DuplicateFilter, content_fingerprint
+from llm_nexus.signal_ingestor import SignalIngestor, StreamingSignalIngestor
+
+logging.disable(logging.CRITICAL)
+
+
+class StubEngine:
+    def __init__(self):
+        self.texts = []
+
+    def analyze_risk_batch(self, texts):
+        self.texts.extend(texts)
+        return [0.8] * len(texts)
+
+
+class WireFeed:
+    """Replays the same headlines, with varying punctuation and case, on every fetch."""
+    def __init__(self, source):
+        self.source = source
+
+    def fetch_latest_signals(self):
+        now = time.time()
+        return [{"source": self.source, "timestamp": now, "content": "DoD announces blockade in Strait of Hormuz"},
+                {"source": self.source, "timestamp": now, "content": "DOD ANNOUNCES BLOCKADE  in Strait of Hormuz!"},
+                {"source": self.source, "timestamp": now, "content": "Flash floods in Taiwan impact wafer output"}]
+
+
+class TestDuplicateFilter(unittest.TestCase):
+    def test_normalized_fingerprint(self):
+        self.assertEqual(content_fingerprint("Cyberattack on  Colonial Pipeline."),
+                         content_fingerprint("cyberattack on colonial pipeline"))
+        self.assertNotEqual(content_fingerprint("Port delays"), content_fingerprint("Port strike"))
+
+    def test_window_expiry(self):
+        dedup = DuplicateFilter(window_seconds=3600)
+        self.assertFalse(dedup.seen("Blockade announced", now=0))
+        self.assertTrue(dedup.seen("blockade announced!", now=1800))
+        # Window counts from the first sighting
+        self.assertFalse(dedup.seen("Blockade announced", now=3601))
+        self.assertEqual(dedup.stats()["duplicates"], 1)
+
+    def test_memory_is_constant(self):
+        dedup = DuplicateFilter(window_seconds=3600, capacity=64, probe=4)
+        size = (len(dedup._fingerprints), len(dedup._expires))
+        for i in range(10000):
+            dedup.seen(f"headline {i}", now=i * 0.01)
+        self.assertEqual((len(dedup._fingerprints), len(dedup._expires)), size)
+        self.assertGreater(dedup.stats()["evictions"], 0)
+        # Recent headlines are still remembered
+        self.assertTrue(dedup.seen("headline 9999", now=100.0))
+
+    def test_sync_ingestor_drops_repeats(self):
+        ingestor = SignalIngestor(dedup=DuplicateFilter())
+        seen = [s["content"] for _ in range(50) for s in ingestor.fetch_latest_signals()]
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertLessEqual(len(seen), len(ingestor.synthetic_headlines))
+
+    def test_streaming_ingestor_scores_each_headline_once(self):
+        engine = StubEngine()
+        dedup = DuplicateFilter()
+        ingestor = StreamingSignalIngestor([WireFeed("ap"), WireFeed("reuters")], engine, poll_interval=0.01,
+                                           max_wait=0.01, dedup=dedup)
+
+        async def main():
+            task = asyncio.create_task(ingestor.run())
+            await asyncio.sleep(0.1)
+            ingestor.stop()
+            await task
+        asyncio.run(main())
+
+        self.assertEqual(len(engine.texts), 2)
+        metrics = ingestor.metrics()
+        self.assertGreater(metrics["feeds"]["ap"]["duplicates"] + metrics["feeds"]["reuters"]["duplicates"], 4)
+        self.assertEqual(metrics["dedup"]["duplicates"], dedup.stats()["duplicates"])
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Refined by GovSignal Automation
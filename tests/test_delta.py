@@ -0,0 +1,129 @@
+import unittest
+import json
+import os
+import tempfile
+import logging
+from govsignal.delta import DeltaTracker
+from govsignal.priority import TopKSelector
+from govsignal.sinks import JsonLinesSink
+from .mocks import MockScout
+
+logging.disable(logging.CRITICAL)
+
+
+def make_signal(fingerprint, probability, action="flag_for_review"):
+    return {"signal_id": f"SIG-{fingerprint}-{probability}", "fingerprint": fingerprint,
+            "demand_probability": probability, "erp_action_recommendation": action}
+
+
+class TestDelta(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.state_path = os.path.join(self.tmp.name, "delta.json")
+        self.changelog_path = os.path.join(self.tmp.name, "changes.jsonl")
+
+    def make_tracker(self):
+        return DeltaTracker(epsilon=0.05, state_path=self.state_path, changelog_path=self.changelog_path)
+
+    def test_only_changes_pass(self):
+        tracker = self.make_tracker()
+        self.assertEqual(len(tracker.filter([make_signal("a", 0.6), make_signal("b", 0.6)])), 2)
+
+        changed = tracker.filter([
+            make_signal("a", 0.62),                          # within epsilon
+            make_signal("b", 0.9, "release_capital_hold"),   # action transition
+            make_signal("c", 0.3, "monitor"),                # new
+        ])
+        self.assertEqual([s["fingerprint"] for s in changed], ["b", "c"])
+
+        # Drift is measured against the last emitted value, so small steps accumulate
+        self.assertEqual(tracker.filter([make_signal("a", 0.64)]), [])
+        self.assertEqual(len(tracker.filter([make_signal("a", 0.66)])), 1)
+
+    def test_state_persists_and_changelog(self):
+        tracker = self.make_tracker()
+        tracker.filter([make_signal("a", 0.6)])
+        tracker.save()
+
+        tracker = self.make_tracker()
+        self.assertEqual(tracker.filter([make_signal("a", 0.6)]), [])
+        tracker.filter([make_signal("a", 0.9, "release_capital_hold")])
+
+        with open(self.changelog_path) as f:
+            entries = [json.loads(line) for line in f]
+        self.assertEqual([e["change"] for e in entries], ["new", "action"])
+        self.assertEqual(entries[1]["from"], [0.6, "flag_for_review"])
+        self.assertEqual(entries[1]["to"], [0.9, "release_capital_hold"])
+
+    def test_scout_emits_only_changes(self):
+        scout = MockScout()
+        scout.targets = {"Defense_Systems": {"related_asset": "TWT Amplifiers"}}
+        sink_path = os.path.join(self.tmp.name, "signals.jsonl")
+        scout.sinks = [JsonLinesSink(sink_path)]
+        scout.delta = self.make_tracker()
+
+        document = {"source_name": "SAM.gov", "noticeId": "N-1", "title": "Radar"}
+        scout.emit([scout._generate_signal(document, "Defense_Systems", 0.6)])
+        scout.emit([scout._generate_signal(document, "Defense_Systems", 0.6)])
+        with open(sink_path) as f:
+            self.assertEqual(len(f.readlines()), 1)
+
+
+    def test_failed_sink_does_not_mark_signals_sent(self):
+        scout = MockScout()
+        scout.targets = {"Defense_Systems": {"related_asset": "TWT Amplifiers"}}
+        scout.delta = self.make_tracker()
+        delivered = []
+
+        class FlakySink:
+            failing = True
+
+            def emit(self, signals):
+                if self.failing:
+                    raise OSError("database is locked")
+                delivered.extend(signals)
+
+            def close(self):
+                pass
+        sink = FlakySink()
+        scout.sinks = [sink]
+
+        signal = scout._generate_signal({"source_name": "SAM.gov", "noticeId": "N-1", "title": "Radar"},
+                                        "Defense_Systems", 0.6)
+        with self.assertRaises(OSError):
+            scout.emit([dict(signal)])
+        self.assertFalse(os.path.exists(self.state_path))
+        self.assertFalse(os.path.exists(self.changelog_path))
+
+        sink.failing = False
+        self.assertEqual(len(scout.emit([dict(signal)])), 1)
+        self.assertEqual(scout.emit([dict(signal)]), [])
+        self.assertEqual(len(delivered), 1)
+        with open(self.state_path) as f:
+            self.assertIn(signal["fingerprint"], json.load(f))
+
+    def test_failed_budget_delivery_is_retried(self):
+        scout = MockScout()
+        scout.top_k = TopKSelector(k=1)
+        attempts = []
+
+        class FailingOnceSink:
+            def emit(self, signals):
+                attempts.append(len(signals))
+                if len(attempts) == 1:
+                    raise OSError("IDoc directory unavailable")
+
+            def close(self):
+                pass
+        scout.sinks = [FailingOnceSink()]
+        scout.emit([make_signal("a", 0.6), make_signal("b", 0.7)])
+        with self.assertRaises(OSError):
+            scout.flush_budget()
+        self.assertEqual(len(scout.flush_budget()), 2)
+        self.assertEqual(attempts, [2, 2])
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Refined by GovSignal Automation
@@ -0,0 +1,149 @@
+import unittest
+import json
+import os
+import tempfile
+import threading
+import time
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from govsignal.erp_delivery import ErpHttpSink, Outbox
+from .mocks import MockScout
+
+logging.disable(logging.CRITICAL)
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Local ERP stand-in: records posted batches and replays scripted status codes."""
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        server = self.server
+        server.release.wait()
+        with server.lock:
+            status = server.statuses.pop(0) if server.statuses else 200
+            server.connections.add(self.client_address)
+            if status == 200:
+                server.batches.append(json.loads(body))
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def make_signal(i):
+    return {"signal_id": f"SIG-{i}", "source": "SAM.gov", "detected_event": f"Event {i}",
+            "demand_probability": 0.9, "asset_implication": "TWT Amplifiers",
+            "erp_action_recommendation": "release_capital_hold"}
+
+
+class TestErpDelivery(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.outbox_path = os.path.join(self.tmp.name, "outbox.db")
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        self.server.lock = threading.Lock()
+        self.server.statuses = []
+        self.server.batches = []
+        self.server.connections = set()
+        self.server.release = threading.Event()
+        self.server.release.set()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/triggers"
+
+    def make_sink(self, **options):
+        options.setdefault("workers", 0)
+        return ErpHttpSink(self.url, self.outbox_path, base_backoff=0, **options)
+
+    def delivered_ids(self):
+        return [p["signal_id"] for batch in self.server.batches for p in batch]
+
+    def test_bulk_batches_over_pooled_connection(self):
+        sink = self.make_sink(batch_size=2, pool_size=1)
+        sink.emit([make_signal(i) for i in range(5)])
+        self.assertEqual(sink.deliver_pending(), 5)
+        self.assertEqual([len(b) for b in self.server.batches], [2, 2, 1])
+        # All three batches reused one keep-alive connection
+        self.assertEqual(len(self.server.connections), 1)
+        sink.close()
+
+    def test_dedup_by_signal_id(self):
+        sink = self.make_sink()
+        sink.emit([make_signal(1), make_signal(1), make_signal(2)])
+        sink.deliver_pending()
+        sink.emit([make_signal(1)])  # already delivered
+        sink.deliver_pending()
+        self.assertEqual(sorted(self.delivered_ids()), ["SIG-1", "SIG-2"])
+        sink.close()
+
+    def test_retry_then_dead_letter(self):
+        self.server.statuses = [503]
+        sink = self.make_sink()
+        sink.emit([make_signal(1)])
+        self.assertEqual(sink.deliver_pending(), 0)  # 503, rescheduled immediately (zero backoff)
+        self.assertEqual(sink.deliver_pending(), 1)
+        self.assertEqual(self.delivered_ids(), ["SIG-1"])
+
+        self.server.statuses = [400]
+        sink.emit([make_signal(2)])
+        sink.deliver_pending()
+        self.assertEqual(sink.outbox.counts()["dead"], 1)
+        sink.close()
+
+    def test_outbox_survives_restart(self):
+        # Port with nothing listening: delivery fails, payload stays queued
+        sink = ErpHttpSink("http://127.0.0.1:9/triggers", self.outbox_path, workers=0, base_backoff=0)
+        sink.emit([make_signal(1)])
+        sink.deliver_pending()
+        sink.close()
+
+        sink = self.make_sink()
+        self.assertEqual(sink.deliver_pending(), 1)
+        self.assertEqual(self.delivered_ids(), ["SIG-1"])
+        sink.close()
+
+    def test_expired_lease_is_redelivered(self):
+        outbox = Outbox(self.outbox_path)
+        outbox.enqueue([make_signal(1)])
+        self.assertEqual(len(outbox.claim(10, lease_seconds=3600)), 1)
+        self.assertEqual(outbox.claim(10, lease_seconds=3600), [])
+        outbox.close()
+
+        outbox = Outbox(self.outbox_path)
+        outbox.conn.execute("UPDATE outbox SET next_attempt = 0")  # lease expired (process crashed)
+        self.assertEqual(len(outbox.claim(10, lease_seconds=60)), 1)
+        outbox.close()
+
+    def test_background_worker_delivers(self):
+        sink = self.make_sink(workers=2, payload_format="sap")
+        sink.emit([make_signal(1)])
+        sink.close()
+        self.assertEqual(self.server.batches[0][0]["sap_bapi_transaction_code"], "RELEASE_BLOCK_Z1")
+
+    def test_close_honors_drain_timeout(self):
+        # ERP stand-in hangs on the request: close() must not wait for the HTTP timeout
+        self.server.release.clear()
+        self.addCleanup(self.server.release.set)
+        sink = self.make_sink(workers=1, timeout=30, drain_timeout=0.2)
+        sink.emit([make_signal(1)])
+        started = time.time()
+        sink.close()
+        self.assertLess(time.time() - started, 5)
+        self.assertTrue(sink._threads[0].is_alive())
+
+    def test_signal_ids_distinct_per_document(self):
+        scout = MockScout()
+        first = scout._generate_signal({"title": "A"}, "Defense_Systems", 0.9)
+        second = scout._generate_signal({"title": "B"}, "Defense_Systems", 0.9)
+        self.assertNotEqual(first["signal_id"], second["signal_id"])
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Refined by GovSignal Automation
@@ -0,0 +1,125 @@
+import unittest
+import os
+import json
+import tempfile
+import logging
+from unittest import mock
+from govsignal import bulk
+from govsignal.connectors import FederalRegisterConnector
+from .mocks import MockScout
+
+logging.disable(logging.CRITICAL)
+
+FR_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<FEDREG>
+<VOL>88</VOL>
+<NO>240</NO>
+<DATE>Friday, December 15, 2023</DATE>
+<CNTNTS>
+<AGCY><HD>Commerce Department</HD>
+<DOCENT><DOC>CHIPS Act Funding Opportunity, 84210</DOC></DOCENT>
+</AGCY>
+</CNTNTS>
+<NOTICES>
+<NOTICE>
+<PREAMB>
+<AGENCY TYPE="S">DEPARTMENT OF COMMERCE</AGENCY>
+<SUBJECT>CHIPS Act Funding Opportunity: Nanofabrication Facilities</SUBJECT>
+<SUM>
+<HD SOURCE="HED">SUMMARY:</HD>
+<P>The NIST is announcing a grant program for <E T="03">nanofabrication</E> facilities.</P>
+</SUM>
+</PREAMB>
+<FRDOC>[FR Doc. 2023-28912 Filed 12-14-23; 8:45 am]</FRDOC>
+</NOTICE>
+<NOTICE>
+<PREAMB>
+<AGENCY TYPE="S">DEPARTMENT OF AGRICULTURE</AGENCY>
+<SUBJECT>Meeting of the Fruit Advisory Committee</SUBJECT>
+</PREAMB>
+<FRDOC>[FR Doc. 2023-28913 Filed 12-14-23; 8:45 am]</FRDOC>
+</NOTICE>
+</NOTICES>
+</FEDREG>
+"""
+
+
+class TestFRBulk(unittest.TestCase):
+    def _write(self, suffix, content):
+        with tempfile.NamedTemporaryFile(mode='w', suffix=suffix, delete=False) as tmp:
+            tmp.write(content)
+        self.addCleanup(os.remove, tmp.name)
+        return tmp.name
+
+    def test_xml_bulk(self):
+        path = self._write('.xml', FR_XML)
+        docs = list(FederalRegisterConnector().iter_bulk_documents(path))
+
+        self.assertEqual(len(docs), 2)
+        self.assertEqual(docs[0]["document_number"], "2023-28912")
+        self.assertEqual(docs[0]["publication_date"], "2023-12-15")
+        self.assertEqual(docs[0]["type"], "Notice")
+        self.assertIn("nanofabrication facilities", docs[0]["abstract"])
+        self.assertNotIn("SUMMARY", docs[0]["abstract"])
+        self.assertEqual(docs[1]["abstract"], "")
+
+    def test_xml_bulk_detaches_finished_subtrees(self):
+        path = self._write('.xml', FR_XML)
+        roots = []
+        iterparse = bulk.ET.iterparse
+
+        def recording_iterparse(source, events):
+            for event, elem in iterparse(source, events):
+                if not roots:
+                    roots.append(elem)
+                yield event, elem
+
+        with mock.patch.object(bulk.ET, "iterparse", recording_iterparse):
+            docs = bulk.iter_federal_register_xml(path)
+            next(docs)
+            # Only the open NOTICES section is still attached while streaming
+            self.assertEqual([child.tag for child in roots[0]], ["NOTICES"])
+            self.assertEqual(len(list(docs)), 1)
+        self.assertEqual(len(roots[0]), 0)
+
+    def test_json_results_array(self):
+        payload = {
+            "count": 2,
+            "description": 'Documents matching "results"',
+            "results": [
+                {"document_number": "A", "title": "One", "abstract": None,
+                 "agencies": [{"name": "Commerce Department"}]},
+                {"document_number": "B", "title": "Two", "abstract": "Wafer [fab] {expansion}"}
+            ]
+        }
+        path = self._write('.json', json.dumps(payload))
+        # Force many small reads to exercise buffer refills across object boundaries
+        with open(path) as f:
+            docs = list(bulk._iter_json_array(f, read_size=7))
+
+        self.assertEqual([d["document_number"] for d in docs], ["A", "B"])
+        docs = list(FederalRegisterConnector().iter_bulk_documents(path))
+        self.assertEqual(docs[0]["agency"], "Commerce Department")
+        self.assertEqual(docs[0]["abstract"], "")
+
+    def test_ndjson(self):
+        lines = [json.dumps({"document_number": str(i), "abstract": "x"}) for i in range(3)]
+        path = self._write('.ndjson', "\n".join(lines) + "\n")
+        docs = list(FederalRegisterConnector().iter_bulk_documents(path))
+        self.assertEqual(len(docs), 3)
+
+    def test_bulk_scoring_stream(self):
+        path = self._write('.xml', FR_XML)
+        scout = MockScout()
+        scout.fr_connector = FederalRegisterConnector()
+        scout.targets = {"Semiconductors": {"related_asset": "Chamber", "keywords": ["Nanofabrication"]}}
+
+        signals = list(scout.scan_federal_register_bulk(path))
+        self.assertEqual(len(signals), 1)
+        self.assertEqual(signals[0]["source"], "Federal Register")
+        self.assertEqual(signals[0]["asset_implication"], "Chamber")
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Refined by GovSignal Automation
@@ -0,0 +1,118 @@
+import unittest
+import http.client
+import json
+import os
+import tempfile
+import threading
+import time
+import logging
+from unittest import mock
+from govsignal.ingest import PushIngestor
+from govsignal.priority import TopKSelector
+from govsignal.service import ScoringService, make_server
+from govsignal.sinks import JsonLinesSink
+from .mocks import MockScout
+
+logging.disable(logging.CRITICAL)
+
+
+class TestIngest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.sink_path = os.path.join(self.tmp.name, "signals.jsonl")
+        self.scout = MockScout()
+        self.scout.targets = {"Defense_Systems": {"related_asset": "TWT Amplifiers", "keywords": ["Radar"]}}
+        self.scout.sinks = [JsonLinesSink(self.sink_path)]
+
+    def emitted(self):
+        if not os.path.exists(self.sink_path):
+            return []
+        with open(self.sink_path) as f:
+            return [json.loads(line) for line in f]
+
+    def test_pushed_documents_reach_sinks(self):
+        ingestor = PushIngestor(self.scout, max_wait_seconds=0)
+        self.assertTrue(ingestor.offer([{"title": "Radar", "source": "TX Enterprise Fund"}, {"title": "Desks"}]))
+        self.assertTrue(ingestor.wait_idle(timeout=5))
+        ingestor.close()
+
+        signals = self.emitted()
+        self.assertEqual(len(signals), 1)
+        self.assertEqual(signals[0]["source"], "TX Enterprise Fund")
+        self.assertEqual(ingestor.stats()["scored"], 2)
+
+    def test_bad_document_does_not_drop_batch(self):
+        generate = self.scout._generate_signal
+
+        def fragile(data, category, probability):
+            if data.get("title") == "Radar poison":
+                raise ValueError("malformed record")
+            return generate(data, category, probability)
+        self.scout._generate_signal = fragile
+
+        ingestor = PushIngestor(self.scout, max_wait_seconds=0.2)
+        self.assertTrue(ingestor.offer([{"title": "Radar", "description": None}, {"title": "Radar poison"},
+                                        {"title": 7, "abstract": "Radar"}]))
+        self.assertTrue(ingestor.wait_idle(timeout=5))
+        ingestor.close()
+
+        stats = ingestor.stats()
+        self.assertEqual((stats["scored"], stats["failed"], stats["signals"]), (2, 1, 2))
+        self.assertEqual(len(self.emitted()), 2)
+
+    def test_budget_period_closes_while_idle(self):
+        self.scout.top_k = TopKSelector(k=1, period_seconds=0.1)
+        with mock.patch("govsignal.ingest.IDLE_TICK_SECONDS", 0.02):
+            ingestor = PushIngestor(self.scout, max_wait_seconds=0)
+            self.assertTrue(ingestor.offer([{"title": "Radar one"}]))
+            self.assertTrue(ingestor.offer([{"title": "Radar two"}]))
+            self.assertTrue(ingestor.wait_idle(timeout=5))
+            # No further pushes: the idle consumer still ends the period
+            deadline = time.monotonic() + 5
+            while not self.emitted() and time.monotonic() < deadline:
+                time.sleep(0.02)
+            ingestor.close()
+
+        signals = self.emitted()
+        self.assertEqual(len(signals), 2)
+        self.assertTrue(signals[1]["summary"])
+
+    def test_backpressure_is_all_or_nothing(self):
+        ingestor = PushIngestor(self.scout, max_queue=2, max_wait_seconds=0)
+        with ingestor._cond:  # hold the consumer so the queue fills up
+            self.assertTrue(ingestor.offer([{"title": "Radar"}, {"title": "Radar"}]))
+            self.assertFalse(ingestor.offer([{"title": "Radar"}]))
+        ingestor.close()
+        stats = ingestor.stats()
+        self.assertEqual((stats["accepted"], stats["rejected"], stats["scored"]), (2, 1, 2))
+
+    def test_ingest_endpoint(self):
+        ingestor = PushIngestor(self.scout, max_queue=3, max_wait_seconds=0)
+        server = make_server(ScoringService(self.scout), port=0, ingestor=ingestor)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+
+        body = "\n".join(json.dumps({"title": f"Radar {i}"}) for i in range(3))
+        conn.request("POST", "/ingest?source=TX_TEF", body=body, headers={"Content-Type": "application/x-ndjson"})
+        response = conn.getresponse()
+        self.assertEqual(response.status, 202)
+        self.assertEqual(json.loads(response.read())["accepted"], 3)
+        self.assertTrue(ingestor.wait_idle(timeout=5))
+
+        conn.request("POST", "/ingest", body=json.dumps([{"title": "Radar"}] * 4))
+        response = conn.getresponse()
+        response.read()
+        self.assertEqual(response.status, 429)
+        self.assertEqual(response.getheader("Retry-After"), "5")
+
+        ingestor.close()
+        self.assertEqual([s["source"] for s in self.emitted()], ["TX_TEF"] * 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Refined by GovSignal Automation
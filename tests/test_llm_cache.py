@@ -0,0 +1,114 @@
+import os
+import shutil
+import tempfile
+import unittest
+import logging
+
+try:
+    import numpy as np
+    from llm_nexus.llm_cache import LLMResponseCache, prompt_key
+except ImportError:  # numpy is part of the full build environment
+    np = None
+
+logging.disable(logging.CRITICAL)
+
+NOTICE = "Extract the NAICS code and agency from: Sources sought for {item}. Responses due in 30 days."
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class WordEmbedder:
+    """Normalized bag of words over a small vocabulary; near-identical notices embed alike."""
+    VOCABULARY = ["extract", "naics", "agency", "sources", "sought", "responses", "due", "days",
+                  "radar", "wafer", "pods", "weather"]
+
+    def embed(self, texts):
+        vectors = np.zeros((len(texts), len(self.VOCABULARY)), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in text.lower().replace(".", " ").replace(":", " ").split():
+                if word in self.VOCABULARY:
+                    vectors[row, self.VOCABULARY.index(word)] += 1.0
+        return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-9)
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestLLMResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "llm_cache.json")
+        self.calls = []
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def generate(self, prompt):
+        self.calls.append(prompt)
+        return f"completion {len(self.calls)}"
+
+    def test_exact_hits_ignore_whitespace_and_respect_model(self):
+        cache = LLMResponseCache(model="m1")
+        prompt = NOTICE.format(item="radar")
+        self.assertEqual(cache.complete(prompt, self.generate), "completion 1")
+        self.assertEqual(cache.complete("  " + prompt.replace(" ", "\n", 1), self.generate), "completion 1")
+        self.assertIsNone(cache.get(prompt, llm_string="m2"))
+        self.assertNotEqual(prompt_key(prompt, "m1"), prompt_key(prompt, "m2"))
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(cache.stats()["exact_hits"], 1)
+
+    def test_similar_prompt_reuses_completion(self):
+        cache = LLMResponseCache(embedder=WordEmbedder(), similarity_threshold=0.85)
+        cache.complete(NOTICE.format(item="radar"), self.generate)
+        # Same boilerplate, different item: cosine similarity 8/9 clears 0.85
+        self.assertEqual(cache.complete(NOTICE.format(item="wafer"), self.generate), "completion 1")
+        # Unrelated prompt: a real call
+        self.assertEqual(cache.complete("Summarize the weather", self.generate), "completion 2")
+        stats = cache.stats()
+        self.assertEqual((stats["similar_hits"], stats["misses"]), (1, 2))
+
+    def test_size_and_age_eviction(self):
+        clock = Clock()
+        cache = LLMResponseCache(maxsize=2, ttl=60, clock=clock)
+        for item in ("a", "b", "c"):
+            cache.put(f"prompt {item}", item)
+        self.assertIsNone(cache.get("prompt a"))
+        self.assertEqual(cache.get("prompt c"), "c")
+        clock.now += 61
+        self.assertIsNone(cache.get("prompt c"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_evicted_entries_are_not_similar_hits(self):
+        cache = LLMResponseCache(maxsize=1, embedder=WordEmbedder(), similarity_threshold=0.85)
+        cache.put(NOTICE.format(item="radar"), "old")
+        cache.put("Summarize the weather", "other")
+        self.assertIsNone(cache.get(NOTICE.format(item="wafer")))
+
+    def test_persists_across_restarts(self):
+        clock = Clock()
+        cache = LLMResponseCache(path=self.path, ttl=3600, embedder=WordEmbedder(), similarity_threshold=0.85,
+                                 clock=clock)
+        cache.put(NOTICE.format(item="radar"), "saved")
+        cache.save()
+
+        clock.now += 1800
+        restored = LLMResponseCache(path=self.path, ttl=3600, embedder=WordEmbedder(), similarity_threshold=0.85,
+                                    clock=clock)
+        self.assertEqual(restored.get(NOTICE.format(item="radar")), "saved")
+        self.assertEqual(restored.get(NOTICE.format(item="pods")), "saved")
+        # The restored entry keeps its original age
+        clock.now += 1801
+        self.assertIsNone(restored.get(NOTICE.format(item="radar")))
+
+        # A cache for another model ignores the file
+        self.assertEqual(len(LLMResponseCache(model="other", path=self.path, clock=clock).cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Refined by GovSignal Automation
@@ -0,0 +1,68 @@
+import unittest
+import os
+import glob
+import tempfile
+import logging
+from govsignal.matcher import KeywordMatcher, load_or_compile, compile_groups
+from .mocks import MockScout
+
+logging.disable(logging.CRITICAL)
+
+GROUPS = {
+    "target:Semiconductors": ["Nanofabrication", "CHIPS Act", "Wafer"],
+    "asset:TWT": ["TWT Amplifier", "Jamming Pod", "wafer"],
+}
+
+
+class TestMatcherArtifact(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_save_load_roundtrip(self):
+        matcher, _ = compile_groups(GROUPS)
+        path = os.path.join(self.tmp.name, "m.bin")
+        matcher.save(path, {"note": "x"})
+
+        loaded, metadata = KeywordMatcher.load(path)
+        self.assertEqual(metadata, {"note": "x"})
+        text = "New jamming pods and wafer nanofabrication under the chips act"
+        self.assertEqual(loaded.scan(text), matcher.scan(text))
+
+    def test_cache_keyed_by_keywords(self):
+        matcher, ids = load_or_compile(GROUPS, self.tmp.name)
+        self.assertEqual(ids["asset:TWT"][2], ids["target:Semiconductors"][2])
+        artifacts = glob.glob(os.path.join(self.tmp.name, "matcher-*.bin"))
+        self.assertEqual(len(artifacts), 1)
+
+        cached, cached_ids = load_or_compile(GROUPS, self.tmp.name)
+        self.assertEqual(cached_ids, ids)
+        self.assertIsInstance(cached.edge_char, memoryview)
+
+        changed = dict(GROUPS, **{"target:Semiconductors": ["Lithography"]})
+        load_or_compile(changed, self.tmp.name)
+        self.assertEqual(len(glob.glob(os.path.join(self.tmp.name, "matcher-*.bin"))), 2)
+
+    def test_corrupt_artifact_is_rebuilt(self):
+        load_or_compile(GROUPS, self.tmp.name)
+        path = glob.glob(os.path.join(self.tmp.name, "matcher-*.bin"))[0]
+        with open(path, "wb") as f:
+            f.write(b"garbage")
+        matcher, _ = load_or_compile(GROUPS, self.tmp.name)
+        self.assertEqual(len(matcher.scan("wafer")), 1)
+        self.assertIsNotNone(KeywordMatcher.load(path))
+
+    def test_scout_uses_artifact_and_ontology(self):
+        scout = MockScout()
+        scout.config = {"matcher_cache_dir": self.tmp.name}
+        scout.targets = {"Defense": {"related_asset": "TWT", "keywords": ["jamming"]}}
+
+        signals = list(scout.score_documents([{"title": "EW", "description": "Jamming pods"}]))
+        self.assertEqual(len(signals), 1)
+        self.assertEqual(scout.detect_assets("Spare TWT amplifier tubes"), ["Traveling Wave Tube (TWT)"])
+        self.assertEqual(len(glob.glob(os.path.join(self.tmp.name, "matcher-*.bin"))), 1)
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Refined by GovSignal Automation
@@ -0,0 +1,95 @@
+import unittest
+import logging
+from govsignal.priority import TopKSelector
+from .mocks import MockScout
+
+logging.disable(logging.CRITICAL)
+
+
+def make_signal(i, probability, action="flag_for_review", asset="TWT Amplifiers"):
+    return {"signal_id": f"SIG-{i}", "demand_probability": probability, "erp_action_recommendation": action,
+            "target_category": "Defense_Systems", "asset_implication": asset}
+
+
+class TestPriority(unittest.TestCase):
+    def test_top_k_in_priority_order(self):
+        selector = TopKSelector(k=3)
+        probabilities = [0.55, 0.7, 0.6, 0.65, 0.58, 0.75]
+        output = selector.select([make_signal(i, p) for i, p in enumerate(probabilities)])
+
+        ranked = [s for s in output if not s.get("summary")]
+        self.assertEqual([s["demand_probability"] for s in ranked], [0.75, 0.7, 0.65])
+
+        summary = output[-1]
+        self.assertTrue(summary["summary"])
+        self.assertEqual(summary["signal_count"], 3)
+        self.assertEqual(summary["demand_probability"], 0.6)
+        self.assertEqual(summary["asset_implication"], "TWT Amplifiers")
+        self.assertEqual(summary["action_counts"], {"flag_for_review": 3})
+
+    def test_groups_are_budgeted_separately(self):
+        selector = TopKSelector(k=1)
+        output = selector.select([make_signal(1, 0.6), make_signal(2, 0.7, asset="Vacuum Chambers")])
+        self.assertEqual([s["signal_id"] for s in output], ["SIG-2", "SIG-1"])
+
+    def test_unbudgeted_actions_pass_through(self):
+        selector = TopKSelector(k=1, actions=["flag_for_review"])
+        output = selector.select([make_signal(1, 0.9, "release_capital_hold"), make_signal(2, 0.9, "release_capital_hold"),
+                                  make_signal(3, 0.6), make_signal(4, 0.55)])
+        self.assertEqual([s["signal_id"] for s in output[:3]], ["SIG-3", "SIG-1", "SIG-2"])
+        self.assertEqual(output[3]["signal_count"], 1)
+
+    def test_drain_resets_between_cycles(self):
+        selector = TopKSelector(k=1)
+        selector.select([make_signal(1, 0.6), make_signal(2, 0.7)])
+        self.assertEqual(len(selector.select([make_signal(3, 0.6)])), 1)
+
+
+    def test_budget_spans_additions_until_period_ends(self):
+        now = [0.0]
+        selector = TopKSelector(k=2, period_seconds=60, clock=lambda: now[0])
+        for signal in (make_signal(1, 0.6), make_signal(2, 0.7)):
+            selector.add(signal)
+        now[0] = 30
+        for signal in (make_signal(3, 0.9), make_signal(4, 0.55)):
+            selector.add(signal)
+        self.assertFalse(selector.due())
+        now[0] = 61
+        selector.add(make_signal(5, 0.5))
+        self.assertTrue(selector.due())
+        output = selector.drain()
+        self.assertEqual([s["signal_id"] for s in output[:2]], ["SIG-3", "SIG-2"])
+        self.assertEqual(output[2]["signal_count"], 3)
+        self.assertFalse(selector.pending)
+        # A new period starts at its first signal
+        selector.add(make_signal(6, 0.6))
+        now[0] = 100
+        self.assertFalse(selector.due())
+
+    def test_batched_stream_shares_one_budget(self):
+        scout = MockScout()
+        scout.top_k = TopKSelector(k=2)
+        batches = []
+
+        class RecordingSink:
+            def emit(self, signals):
+                batches.append(list(signals))
+
+            def close(self):
+                pass
+        scout.sinks = [RecordingSink()]
+
+        emitted = scout.emit_stream((make_signal(i, 0.5 + i / 100) for i in range(10)), batch_size=3)
+        delivered = [s for batch in batches for s in batch]
+        self.assertEqual(emitted, 3)
+        self.assertEqual([s["signal_id"] for s in delivered[:2]], ["SIG-9", "SIG-8"])
+        self.assertEqual(delivered[2]["signal_count"], 8)
+        # Nothing left for close()
+        batches.clear()
+        scout.close()
+        self.assertEqual(batches, [])
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Refined by GovSignal Automation
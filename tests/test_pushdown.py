@@ -0,0 +1,67 @@
+import unittest
+import logging
+from govsignal.connectors import SamGovConnector, FederalRegisterConnector
+from govsignal.local_connectors import CaliforniaGoBizConnector
+from .mocks import MockScout
+
+logging.disable(logging.CRITICAL)
+
+
+class TestPushdown(unittest.TestCase):
+    def test_keyword_pushdown(self):
+        self.assertEqual(len(SamGovConnector().get_opportunities(["jamming"])), 1)
+        self.assertEqual(len(SamGovConnector().get_opportunities(["banana"])), 0)
+        self.assertEqual(len(CaliforniaGoBizConnector().get_opportunities(["Tax Credit"])), 1)
+        self.assertEqual(len(CaliforniaGoBizConnector().get_opportunities(["rocket"])), 0)
+
+    def test_structured_filters(self):
+        sam = SamGovConnector()
+        self.assertEqual(len(sam.get_opportunities([], {"naics": ["3345"]})), 1)
+        self.assertEqual(len(sam.get_opportunities([], {"naics": ["5617"]})), 0)
+        self.assertEqual(len(sam.get_opportunities([], {"agency": ["defense"]})), 1)
+        self.assertEqual(len(sam.get_opportunities([], {"date_range": ("2023-10-01", "2023-10-31")})), 1)
+        self.assertEqual(len(sam.get_opportunities([], {"date_range": ("2024-01-01", None)})), 0)
+
+        fr = FederalRegisterConnector()
+        self.assertEqual(len(fr.get_documents(["nanofabrication"], {"agency": ["Commerce"]})), 1)
+        self.assertEqual(len(fr.get_documents(["nanofabrication"], {"agency": ["Energy"]})), 0)
+
+    def test_query_union(self):
+        scout = MockScout()
+        scout.targets = {
+            "A": {"keywords": ["Wafer", "chip"], "naics_codes": [334413]},
+            "B": {"keywords": ["wafer", "radar"]},
+        }
+        keywords, filters = scout._build_query()
+        self.assertEqual(keywords, ["Wafer", "chip", "radar"])
+        # Only one target constrains NAICS, so it cannot be pushed for the whole query
+        self.assertNotIn("naics", filters)
+
+        scout.targets["B"]["naics_codes"] = ["3345"]
+        keywords, filters = scout._build_query("2024-01-01", "2024-03-31")
+        self.assertEqual(filters["naics"], ["334413", "3345"])
+        self.assertEqual(filters["date_range"], ("2024-01-01", "2024-03-31"))
+
+    def test_unsupported_filters_applied_client_side(self):
+        scout = MockScout()
+
+        class NoPushdownConnector:
+            SUPPORTED_FILTERS = frozenset()
+            FILTER_FIELDS = {"agency": "agency"}
+
+            def __init__(self):
+                self.calls = []
+
+            def get_opportunities(self, keywords, filters=None):
+                self.calls.append((keywords, filters))
+                return [{"agency": "Navy"}, {"agency": "Army"}]
+
+        connector = NoPushdownConnector()
+        records = scout._query_source(connector, connector.get_opportunities, ["x"], {"agency": ["navy"]})
+        self.assertEqual(connector.calls, [([], {})])
+        self.assertEqual(records, [{"agency": "Navy"}])
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Refined by GovSignal Automation
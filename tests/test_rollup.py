@@ -0,0 +1,98 @@
+import unittest
+import glob
+import os
+import tempfile
+import logging
+from datetime import datetime
+from govsignal.rollup import WindowedRollup
+from govsignal.sap_export import SapIDocSink
+from .mocks import MockScout
+
+logging.disable(logging.CRITICAL)
+
+BASE = datetime(2025, 3, 1, 12, 0, 0).timestamp()  # aligned to the hour
+
+
+def make_signal(i, offset, probability=0.3, asset="TWT Amplifiers", category="Defense_Systems"):
+    return {"signal_id": f"SIG-{i}", "timestamp": datetime.fromtimestamp(BASE + offset).isoformat(),
+            "source": "SAM.gov", "detected_event": f"Event {i}", "demand_probability": probability,
+            "asset_implication": asset, "target_category": category}
+
+
+class TestRollup(unittest.TestCase):
+    def setUp(self):
+        self.action_for = MockScout()._action_for
+
+    def test_tumbling_window_combines_evidence(self):
+        rollup = WindowedRollup(self.action_for, window_seconds=3600, max_evidence=2)
+        closed = rollup.add_many([make_signal(i, i * 60) for i in range(4)], now=BASE + 600)
+        self.assertEqual(closed, [])
+
+        closed = rollup.advance(BASE + 3600)
+        self.assertEqual(len(closed), 1)
+        aggregate = closed[0]
+        self.assertEqual(aggregate["signal_count"], 4)
+        # Noisy-OR of four 0.3 signals: 1 - 0.7^4
+        self.assertEqual(aggregate["demand_probability"], 0.76)
+        self.assertEqual(aggregate["erp_action_recommendation"], "flag_for_review")
+        self.assertEqual(len(aggregate["evidence"]), 2)
+        self.assertEqual(aggregate["window_start"], datetime.fromtimestamp(BASE).isoformat())
+
+    def test_keys_are_separate_and_expire(self):
+        rollup = WindowedRollup(self.action_for, window_seconds=3600)
+        rollup.add(make_signal(1, 0))
+        rollup.add(make_signal(2, 10, asset="Vacuum Chambers"))
+        closed = rollup.advance(BASE + 2 * 3600)
+        self.assertEqual(len(closed), 2)
+        self.assertEqual(rollup.keys, {})
+
+    def test_sliding_window_emits_per_active_pane(self):
+        rollup = WindowedRollup(self.action_for, window_seconds=3600, slide_seconds=900)
+        rollup.add(make_signal(1, 0, probability=0.5))
+        closed = rollup.add(make_signal(2, 1000, probability=0.5))  # next pane closes the first
+        self.assertEqual([a["signal_count"] for a in closed], [1])
+
+        closed = rollup.advance(BASE + 1800)
+        # The second window still covers the first signal
+        self.assertEqual([a["signal_count"] for a in closed], [2])
+        self.assertEqual(closed[0]["demand_probability"], 0.75)
+
+        # No new evidence: nothing emitted, key kept until its last pane leaves the window
+        self.assertEqual(rollup.advance(BASE + 2700), [])
+        self.assertEqual(len(rollup.keys), 1)
+        rollup.advance(BASE + 5 * 900)
+        self.assertEqual(rollup.keys, {})
+
+    def test_flush_emits_open_windows(self):
+        rollup = WindowedRollup(self.action_for, window_seconds=3600)
+        rollup.add(make_signal(1, 0, probability=0.99))
+        flushed = rollup.flush()
+        self.assertEqual(flushed[0]["demand_probability"], 0.95)  # capped
+        self.assertEqual(flushed[0]["erp_action_recommendation"], "release_capital_hold")
+
+
+    def test_aggregate_reaches_sap_sink(self):
+        rollup = WindowedRollup(self.action_for, window_seconds=3600)
+        signals = [make_signal(i, i * 60, probability=0.5) for i in range(3)]
+        signals.append(dict(make_signal(3, 240, probability=0.6), source="CA GO-Biz"))
+        rollup.add_many(signals, now=BASE + 600)
+        aggregate = rollup.flush()[0]
+        self.assertEqual(aggregate["source"], "SAM.gov")
+        self.assertEqual(aggregate["erp_action_recommendation"], "release_capital_hold")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            sink = SapIDocSink(tmp, max_age_seconds=3600)
+            sink.emit([aggregate])
+            sink.close()
+            self.assertEqual(sink.rejected, 0)
+            files = glob.glob(os.path.join(tmp, "*.idoc"))
+            self.assertEqual(len(files), 1)
+            with open(files[0]) as f:
+                record = f.read().splitlines()[1]
+            self.assertIn(aggregate["signal_id"], record)
+            self.assertIn("SAM_GOV", record)
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Refined by GovSignal Automation
@@ -0,0 +1,81 @@
+import unittest
+import os
+import yaml
+import tempfile
+import logging
+from govsignal.routing import SourceRoutingIndex, connector_domain
+from govsignal.connectors import SamGovConnector
+from govsignal.local_connectors import CaliforniaGoBizConnector, MassLifeSciencesConnector
+from govsignal.scout import ProcurementScout
+
+logging.disable(logging.CRITICAL)
+
+TARGETS = {
+    "Semiconductors": {"related_asset": "High-Vacuum Chamber", "keywords": ["Wafer", "Lithography"]},
+}
+
+
+class TestRouting(unittest.TestCase):
+    def setUp(self):
+        self.sources = {
+            "SAM_GOV": connector_domain(SamGovConnector()),
+            "CA_GO_BIZ": connector_domain(CaliforniaGoBizConnector()),
+            "MASS_LIFE": connector_domain(MassLifeSciencesConnector()),
+        }
+
+    def test_metadata_prior(self):
+        self.assertIsNone(self.sources["SAM_GOV"])
+        self.assertEqual(self.sources["CA_GO_BIZ"], "Semiconductor grants")
+
+        index = SourceRoutingIndex(TARGETS, self.sources, explore_every=0)
+        self.assertEqual(index.plan(), {"SAM_GOV": ["Semiconductors"], "CA_GO_BIZ": ["Semiconductors"]})
+
+    def test_learned_hit_rates(self):
+        index = SourceRoutingIndex(TARGETS, self.sources, min_observations=2, explore_every=0)
+        for _ in range(2):
+            index.record("CA_GO_BIZ", "Semiconductors", False)
+            index.record("SAM_GOV", "Semiconductors", True)
+            index.record("MASS_LIFE", "Semiconductors", True)
+
+        # Observed evidence overrides the metadata prior in both directions
+        self.assertFalse(index.routes("CA_GO_BIZ", "Semiconductors"))
+        self.assertTrue(index.routes("MASS_LIFE", "Semiconductors"))
+
+    def test_exploration_and_persistence(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            state_path = os.path.join(tmp, "routing.json")
+            index = SourceRoutingIndex(TARGETS, self.sources, min_observations=1,
+                                       explore_every=3, state_path=state_path)
+            index.record("CA_GO_BIZ", "Semiconductors", False)
+            index.plan()
+            index.save()
+
+            restored = SourceRoutingIndex(TARGETS, self.sources, min_observations=1,
+                                          explore_every=3, state_path=state_path)
+            self.assertEqual(restored.cycle, 1)
+            self.assertNotIn("CA_GO_BIZ", restored.plan())
+            # Cycle 3 re-probes every pair
+            self.assertIn("CA_GO_BIZ", restored.plan())
+
+    def test_scout_cycle_planner(self):
+        config_data = {
+            "surveillance_targets": {"Semiconductors": {"related_asset": "Asset1", "keywords": ["biomanufacturing", "tax credit"]}},
+            "enabled_local_sources": ["CA_GO_BIZ", "MASS_LIFE"],
+            "routing": {"enabled": True, "explore_every": 0},
+        }
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as tmp:
+            yaml.dump(config_data, tmp)
+        self.addCleanup(os.remove, tmp.name)
+
+        scout = ProcurementScout(tmp.name)
+        signals = scout.collect_signals()
+        sources = {s["source"] for s in signals}
+        # MASS_LIFE would match "biomanufacturing" but is not routed to Semiconductors
+        self.assertEqual(sources, {"CA GO-Biz"})
+        self.assertEqual(scout.router.stats["CA_GO_BIZ|Semiconductors"], [1, 1])
+        self.assertNotIn("MASS_LIFE|Semiconductors", scout.router.stats)
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Refined by GovSignal Automation
@@ -0,0 +1,63 @@
+import unittest
+import os
+import csv
+import tempfile
+import logging
+from govsignal.bulk import iter_sam_csv_chunks
+from govsignal.connectors import SamGovConnector
+from .mocks import MockScout
+
+logging.disable(logging.CRITICAL)
+
+HEADER = ["NoticeId", "Title", "Sol#", "Department/Ind.Agency", "PostedDate", "Type",
+          "NaicsCode", "PopCity", "Description"]
+
+
+class TestSamBulk(unittest.TestCase):
+    def setUp(self):
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False,
+                                         newline='', encoding='utf-8-sig') as tmp:
+            writer = csv.writer(tmp)
+            writer.writerow(HEADER)
+            writer.writerow(["N1", "EW Pods", "SOL-1", "DEPT OF DEFENSE", "2024-01-02", "Solicitation",
+                             "334511", "Dayton", "Next-generation jamming pods,\nmulti-line \"quoted\" text"])
+            for i in range(2, 6):
+                writer.writerow([f"N{i}", "Janitorial", f"SOL-{i}", "GSA", "2024-01-03", "Sources Sought",
+                                 "561720", "Austin", "Custodial services"])
+            self.path = tmp.name
+        self.addCleanup(os.remove, self.path)
+
+    def test_field_mapping(self):
+        records = list(SamGovConnector().iter_bulk_opportunities(self.path))
+        self.assertEqual(len(records), 5)
+
+        first = records[0]
+        self.assertEqual(first["noticeId"], "N1")
+        self.assertEqual(first["solicitationNumber"], "SOL-1")
+        self.assertEqual(first["department"], "DEPT OF DEFENSE")
+        self.assertEqual(first["naicsCode"], "334511")
+        self.assertIn('"quoted"', first["description"])
+        # Unmapped columns are dropped
+        self.assertNotIn("PopCity", first)
+
+    def test_chunking_and_mmap(self):
+        plain = list(iter_sam_csv_chunks(self.path, chunk_size=2))
+        self.assertEqual([len(c) for c in plain], [2, 2, 1])
+
+        mapped = list(iter_sam_csv_chunks(self.path, chunk_size=2, use_mmap=True))
+        self.assertEqual(mapped, plain)
+
+    def test_bulk_scoring_stream(self):
+        scout = MockScout()
+        scout.sam_connector = SamGovConnector()
+        scout.targets = {"Defense_Systems": {"related_asset": "TWT", "keywords": ["jamming pods"]}}
+
+        signals = list(scout.scan_sam_bulk(self.path, chunk_size=2, use_mmap=True))
+        self.assertEqual(len(signals), 1)
+        self.assertEqual(signals[0]["source"], "SAM.gov")
+        self.assertEqual(signals[0]["detected_event"], "EW Pods")
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Refined by GovSignal Automation
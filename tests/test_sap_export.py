@@ -0,0 +1,83 @@
+import unittest
+import os
+import glob
+import tempfile
+import time
+import logging
+from govsignal.sap_export import SapIDocSink, SapPayloadMapper, compile_validator, load_schema, IDocFileWriter
+
+logging.disable(logging.CRITICAL)
+
+
+def make_signal(i, source="SAM.gov", asset="TWT Amplifiers", action="release_capital_hold", event="EW Pods"):
+    return {"signal_id": f"SIG-{i}", "source": source, "detected_event": event, "demand_probability": 0.8,
+            "asset_implication": asset, "erp_action_recommendation": action}
+
+
+class TestSapExport(unittest.TestCase):
+    def setUp(self):
+        self.schema = load_schema()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_mapping_and_validation(self):
+        mapper = SapPayloadMapper(self.schema)
+        validate = compile_validator(self.schema)
+
+        payload = mapper.map(make_signal(1))
+        self.assertEqual(payload["sap_bapi_transaction_code"], "RELEASE_BLOCK_Z1")
+        self.assertEqual(payload["detected_asset"], "TWT_Amplifier")
+        self.assertEqual(payload["sap_doc_type"], "NB")
+        self.assertEqual(validate(payload), [])
+
+        chips = mapper.map(make_signal(2, "Federal Register", "High-Vacuum Chamber", "flag_for_review",
+                                       "CHIPS Act Funding Opportunity"))
+        self.assertEqual((chips["federal_source"], chips["detected_asset"]), ("CHIPS_ACT", "Vacuum_Chamber_UHV"))
+
+        # Non-federal sources are outside the schema's enum
+        local = mapper.map(make_signal(3, "CA GO-Biz"))
+        self.assertEqual(validate(local), ["federal_source must be of type string"])
+        self.assertIn("confidence_score must be <= 1.0", validate(dict(payload, confidence_score=1.5)))
+
+    def test_batched_flushing(self):
+        directory = os.path.join(self.tmp.name, "idoc")
+        sink = SapIDocSink(directory, max_records=2, max_age_seconds=3600)
+        sink.emit([make_signal(i) for i in range(3)] + [make_signal(9, "CA GO-Biz")])
+        self.assertEqual(sink.rejected, 1)
+        self.assertEqual(len(glob.glob(os.path.join(directory, "*.idoc"))), 1)
+
+        sink.close()
+        files = sorted(glob.glob(os.path.join(directory, "*.idoc")))
+        self.assertEqual(len(files), 2)
+        with open(files[0]) as f:
+            lines = f.read().splitlines()
+        self.assertTrue(lines[0].startswith("EDI_DC40"))
+        self.assertTrue(lines[0].endswith("00000002"))
+        self.assertTrue(lines[1].startswith("Z1GOVSIG"))
+        self.assertIn("RELEASE_BLOCK_Z1", lines[1])
+        self.assertEqual(glob.glob(os.path.join(directory, "*.tmp")), [])
+
+    def test_time_based_flush(self):
+        writer = IDocFileWriter(self.tmp.name, max_records=100, max_age_seconds=0)
+        writer.write([{"signal_id": "SIG-1", "confidence_score": 0.5}])
+        self.assertEqual(len(glob.glob(os.path.join(self.tmp.name, "*.idoc"))), 1)
+
+    def test_partial_batch_flushes_without_new_payloads(self):
+        writer = IDocFileWriter(self.tmp.name, max_records=100, max_age_seconds=0.05)
+        writer.write([{"signal_id": "SIG-1", "confidence_score": 0.5}])
+        self.assertEqual(glob.glob(os.path.join(self.tmp.name, "*.idoc")), [])
+        deadline = time.monotonic() + 5
+        while not glob.glob(os.path.join(self.tmp.name, "*.idoc")) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(glob.glob(os.path.join(self.tmp.name, "*.idoc"))), 1)
+        self.assertIsNone(writer.flush())
+
+    def test_null_event_and_asset(self):
+        mapper = SapPayloadMapper(self.schema)
+        payload = mapper.map(dict(make_signal(1, "Federal Register"), detected_event=None, asset_implication=None))
+        self.assertEqual((payload["federal_source"], payload["detected_asset"]), ("FEDERAL_REGISTER", None))
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Refined by GovSignal Automation
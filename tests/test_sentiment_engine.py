@@ -0,0 +1,87 @@
+import unittest
+import logging
+from llm_nexus.cache import LRUTTLCache
+
+try:
+    import numpy as np
+    from llm_nexus.sentiment_engine import SentimentEngine, CompiledLexicon, RISK_LEXICON, NOISE_AMPLITUDE
+except ImportError:  # numpy is part of the full build environment
+    np = None
+
+logging.disable(logging.CRITICAL)
+
+HEADLINES = [
+    "DoD announces blockade in Strait of Hormuz",
+    "Minor delays expected at Port of LA due to labor",
+    "Diplomatic talks yield positive results",
+    "Flash floods in Taiwan impact wafer output",
+]
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestSentimentEngine(unittest.TestCase):
+    def test_lexicon_matches_tiers(self):
+        lexicon = CompiledLexicon(RISK_LEXICON)
+        np.testing.assert_allclose(lexicon.score(HEADLINES), [0.8, 0.5, 0.1, 0.8])
+
+    def test_per_term_weights(self):
+        lexicon = CompiledLexicon({"tariff": 0.3, "embargo": 0.9}, baseline=0.0)
+        np.testing.assert_allclose(lexicon.score(["Tariff talk", "Tariff and EMBARGO", "calm", ""]),
+                                   [0.3, 0.9, 0.0, 0.0])
+
+    def test_batch_returns_bounded_array(self):
+        engine = SentimentEngine()
+        scores = engine.analyze_risk_batch(HEADLINES * 250)
+        self.assertEqual(scores.shape, (1000,))
+        self.assertTrue(np.all(scores >= 0.0) and np.all(scores <= 1.0))
+        self.assertTrue(np.all(np.abs(scores[:4] - [0.8, 0.5, 0.1, 0.8]) <= NOISE_AMPLITUDE + 1e-9))
+        self.assertIsInstance(engine.analyze_risk(HEADLINES[0]), float)
+
+    def test_volatility_update(self):
+        engine = SentimentEngine()
+        signals = [{"content": HEADLINES[0]}, {"content": HEADLINES[3]}]
+        self.assertAlmostEqual(engine.update_volatility_index(signals, 0.2), 0.6)
+
+    def test_scores_are_reproducible(self):
+        first = SentimentEngine(seed=7, cache_size=0).analyze_risk_batch(HEADLINES)
+        second = SentimentEngine(seed=7, cache_size=0).analyze_risk_batch(HEADLINES)
+        np.testing.assert_array_equal(first, second)
+        other_seed = SentimentEngine(seed=8, cache_size=0).analyze_risk_batch(HEADLINES)
+        self.assertFalse(np.array_equal(first, other_seed))
+
+        rng_engine = SentimentEngine(seed=7, noise="rng", cache_size=0)
+        np.testing.assert_array_equal(rng_engine.analyze_risk_batch(HEADLINES),
+                                      SentimentEngine(seed=7, noise="rng", cache_size=0).analyze_risk_batch(HEADLINES))
+
+    def test_content_noise_ignores_formatting(self):
+        engine = SentimentEngine(cache_size=0)
+        self.assertEqual(engine.analyze_risk("Flash floods in Taiwan!"), engine.analyze_risk("  flash FLOODS in taiwan "))
+
+    def test_repeated_headlines_hit_cache(self):
+        engine = SentimentEngine()
+        engine.analyze_risk_batch(HEADLINES)
+        engine.analyze_risk_batch(HEADLINES + [h.upper() for h in HEADLINES])
+        stats = engine.cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (8, 4, 4))
+        self.assertAlmostEqual(stats["hit_rate"], 8 / 12, places=4)
+
+
+class TestMemoCache(unittest.TestCase):
+    def test_lru_and_ttl(self):
+        now = [0.0]
+        cache = LRUTTLCache(maxsize=2, ttl=10, clock=lambda: now[0])
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)  # evicts b, the least recently used
+        self.assertIsNone(cache.get("b"))
+        now[0] = 11
+        self.assertIsNone(cache.get("a"))
+        stats = cache.stats()
+        self.assertEqual((stats["evictions"], stats["expirations"], stats["hits"]), (1, 1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Refined by GovSignal Automation
@@ -0,0 +1,132 @@
+import unittest
+import http.client
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+import logging
+from govsignal.service import ScoringService, ServiceBusy, make_server
+from govsignal.trending import TrendingTerms
+from .mocks import MockScout
+
+logging.disable(logging.CRITICAL)
+
+
+def make_scout():
+    scout = MockScout()
+    scout.targets = {"Defense_Systems": {"related_asset": "TWT Amplifiers", "keywords": ["Electronic Warfare", "Radar"]}}
+    return scout
+
+
+class UnixConnection(http.client.HTTPConnection):
+    def __init__(self, path):
+        super().__init__("localhost")
+        self.unix_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.unix_path)
+
+
+class TestService(unittest.TestCase):
+    def start(self, service, **options):
+        server = make_server(service, port=0, **options)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def request(self, conn, method, path, body=None):
+        conn.request(method, path, body=json.dumps(body) if body is not None else None,
+                     headers={"Content-Type": "application/json"})
+        response = conn.getresponse()
+        return response.status, dict(response.getheaders()), json.loads(response.read())
+
+    def test_score_single_and_batch(self):
+        server = self.start(ScoringService(make_scout()))
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+
+        status, headers, body = self.request(conn, "POST", "/score",
+                                             {"title": "Radar upgrade", "description": "Electronic Warfare suite"})
+        self.assertEqual(status, 200)
+        self.assertEqual(headers["X-Queue-Depth"], "0")
+        signal = body["signals"][0]
+        self.assertEqual(signal["demand_probability"], 0.8)
+        self.assertEqual(signal["erp_action_recommendation"], "release_capital_hold")
+        self.assertEqual(signal["source"], "Analyst Submission")
+
+        status, _, body = self.request(conn, "POST", "/score", {
+            "documents": [{"description": "Radar"}, {"description": "Office furniture"}], "source_name": "Paste"})
+        self.assertEqual((body["scored"], len(body["signals"])), (2, 1))
+
+        status, _, stats = self.request(conn, "GET", "/stats")
+        self.assertEqual(stats["served"], 2)
+        self.assertIn("p99", stats["latency_ms"])
+
+        status, _, _ = self.request(conn, "POST", "/score", "not a document")
+        self.assertEqual(status, 400)
+
+    def test_null_and_non_string_fields(self):
+        server = self.start(ScoringService(make_scout()))
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+
+        status, _, body = self.request(conn, "POST", "/score",
+                                       {"title": "Radar", "description": None, "abstract": None})
+        self.assertEqual(status, 200)
+        self.assertEqual(body["signals"][0]["raw_snippet"], "...")
+
+        status, _, body = self.request(conn, "POST", "/score",
+                                       {"title": 5, "description": ["Electronic Warfare"], "naicsCode": 334511})
+        self.assertEqual(status, 200)
+        self.assertEqual(body["signals"][0]["target_category"], "Defense_Systems")
+
+    def test_probes_do_not_feed_trending(self):
+        scout = make_scout()
+        scout.trending = TrendingTerms(min_count=1, min_growth=1.0)
+        ScoringService(scout).score([{"title": "Radar", "description": "quantum foundry"}])
+        self.assertEqual(scout.trending.current.estimate("quantum foundry"), 0)
+
+    def test_scoring_errors_return_json(self):
+        scout = make_scout()
+        server = self.start(ScoringService(scout))
+
+        def broken(*args, **kwargs):
+            raise RuntimeError("matcher unavailable")
+        scout.score_documents = broken
+        conn = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+        status, _, body = self.request(conn, "POST", "/score", {"title": "Radar"})
+        self.assertEqual(status, 500)
+        self.assertIn("matcher unavailable", body["error"])
+        # The connection stays usable
+        status, _, _ = self.request(conn, "GET", "/stats")
+        self.assertEqual(status, 200)
+
+    def test_unix_socket(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "scout.sock")
+            self.start(ScoringService(make_scout()), unix_socket=path)
+            status, _, body = self.request(UnixConnection(path), "POST", "/score", {"description": "Radar"})
+            self.assertEqual(status, 200)
+            self.assertEqual(len(body["signals"]), 1)
+
+    def test_rejects_when_queue_full(self):
+        service = ScoringService(make_scout(), max_concurrency=1, max_queue=1)
+        service._slots.acquire()  # occupy the only scoring slot
+        waiter = threading.Thread(target=service.score, args=([{"description": "Radar"}],))
+        waiter.start()
+        while service.stats()["queue_depth"] < 1:
+            time.sleep(0.01)
+
+        with self.assertRaises(ServiceBusy):
+            service.score([{"description": "Radar"}])
+        service._slots.release()
+        waiter.join()
+        stats = service.stats()
+        self.assertEqual((stats["served"], stats["rejected"], stats["queue_depth"]), (1, 1, 0))
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Refined by GovSignal Automation
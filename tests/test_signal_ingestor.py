@@ -0,0 +1,130 @@
+import asyncio
+import threading
+import time
+import unittest
+import logging
+from llm_nexus.signal_ingestor import SignalIngestor, StreamingSignalIngestor
+
+logging.disable(logging.CRITICAL)
+
+
+class StubEngine:
+    """Risk engine stand-in: fixed score, optional per-batch delay."""
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.batch_sizes = []
+
+    def analyze_risk_batch(self, texts):
+        time.sleep(self.delay)
+        self.batch_sizes.append(len(texts))
+        return [0.5] * len(texts)
+
+
+class Feed:
+    def __init__(self, source, per_fetch=1, delay=0.0, age=0.0):
+        self.source = source
+        self.per_fetch = per_fetch
+        self.delay = delay
+        self.age = age
+
+    def fetch_latest_signals(self):
+        time.sleep(self.delay)
+        return [{"source": self.source, "timestamp": time.time() - self.age, "content": f"{self.source} {i}"}
+                for i in range(self.per_fetch)]
+
+
+class AsyncFeed(Feed):
+    async def fetch_async(self):
+        return self.fetch_latest_signals()
+
+
+def run_for(ingestor, seconds):
+    async def main():
+        task = asyncio.create_task(ingestor.run())
+        await asyncio.sleep(seconds)
+        ingestor.stop()
+        await task
+    asyncio.run(main())
+
+
+class TestStreamingSignalIngestor(unittest.TestCase):
+    def test_slow_feed_does_not_block_fast_feed(self):
+        scored = []
+        ingestor = StreamingSignalIngestor([Feed("slow", delay=1.0), Feed("fast")], StubEngine(),
+                                           poll_interval=0.01, max_wait=0.01, on_batch=scored.extend)
+        start = time.monotonic()
+        run_for(ingestor, 0.3)
+        fast = ingestor.metrics()["feeds"]["fast"]
+        self.assertGreater(fast["scored"], 5)
+        self.assertTrue(all(s["risk_score"] == 0.5 for s in scored))
+        # Shutdown waited for the slow feed's in-flight fetch and scored it too
+        self.assertGreaterEqual(time.monotonic() - start, 1.0)
+        self.assertEqual(ingestor.metrics()["feeds"]["slow"]["scored"], 1)
+
+    def test_backpressure_and_drain_on_shutdown(self):
+        engine = StubEngine(delay=0.02)
+        ingestor = StreamingSignalIngestor([Feed("burst", per_fetch=50)], engine, poll_interval=0.05,
+                                           queue_size=4, batch_size=4, max_wait=0.01)
+        run_for(ingestor, 0.2)
+        metrics = ingestor.metrics()
+        feed = metrics["feeds"]["burst"]
+        self.assertGreater(feed["backpressure_seconds"], 0.0)
+        self.assertEqual(feed["scored"], feed["signals"])
+        self.assertEqual(metrics["queue_depth"], 0)
+        self.assertLessEqual(max(engine.batch_sizes), 4)
+
+    def test_lag_metrics_and_async_feeds(self):
+        batches = []
+
+        async def on_batch(signals):
+            batches.append(signals)
+
+        ingestor = StreamingSignalIngestor([AsyncFeed("delayed", age=5.0)], StubEngine(), poll_interval=0.05,
+                                           max_wait=0.01, on_batch=on_batch)
+        run_for(ingestor, 0.1)
+        stats = ingestor.metrics()["feeds"]["delayed"]
+        self.assertGreaterEqual(stats["last_lag_seconds"], 5.0)
+        self.assertGreaterEqual(stats["max_lag_seconds"], stats["last_lag_seconds"])
+        self.assertTrue(batches)
+
+    def test_feed_errors_are_counted(self):
+        class Broken(Feed):
+            def fetch_latest_signals(self):
+                raise ConnectionError("feed down")
+
+        ingestor = StreamingSignalIngestor([Broken("down"), SignalIngestor()], StubEngine(), poll_interval=0.01,
+                                           max_wait=0.01)
+        run_for(ingestor, 0.1)
+        feeds = ingestor.metrics()["feeds"]
+        self.assertGreater(feeds["down"]["errors"], 0)
+        self.assertGreater(feeds["defense.gov"]["scored"], 0)
+
+    def test_failing_callback_does_not_stall_ingestion(self):
+        def on_batch(signals):
+            raise RuntimeError("sink down")
+
+        ingestor = StreamingSignalIngestor([Feed("burst", per_fetch=20)], StubEngine(), poll_interval=0.01,
+                                           queue_size=4, batch_size=4, max_wait=0.01, on_batch=on_batch)
+
+        async def main():
+            task = asyncio.create_task(ingestor.run())
+            await asyncio.sleep(0.1)
+            ingestor.stop()
+            await asyncio.wait_for(task, timeout=5)
+        asyncio.run(main())
+
+        metrics = ingestor.metrics()
+        self.assertGreater(metrics["callback_errors"], 1)
+        self.assertEqual(metrics["feeds"]["burst"]["scored"], metrics["feeds"]["burst"]["signals"])
+
+    def test_stop_from_another_thread(self):
+        ingestor = StreamingSignalIngestor([Feed("a")], StubEngine(), poll_interval=0.01, max_wait=0.01)
+        threading.Timer(0.1, ingestor.stop).start()
+        asyncio.run(ingestor.run())
+        self.assertGreater(ingestor.scored, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Refined by GovSignal Automation
@@ -0,0 +1,71 @@
+import unittest
+import os
+import tempfile
+import logging
+from govsignal.store import SignalStore
+from govsignal.sinks import build_sinks
+from .mocks import MockScout
+
+logging.disable(logging.CRITICAL)
+
+
+def make_signal(i, timestamp, asset, action, category="Defense_Systems"):
+    return {
+        "signal_id": f"SIG-{i}", "timestamp": timestamp, "source": "SAM.gov",
+        "detected_event": f"Event {i}", "demand_probability": 0.5 + i / 100,
+        "target_category": category, "asset_implication": asset,
+        "erp_action_recommendation": action, "raw_snippet": "...",
+    }
+
+
+class TestStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.store = SignalStore(os.path.join(self.tmp.name, "signals.db"), batch_size=2)
+        self.addCleanup(self.store.close)
+        self.store.append([
+            make_signal(1, "2025-01-05T10:00:00", "TWT Amplifiers", "release_capital_hold"),
+            make_signal(2, "2025-02-10T10:00:00", "TWT Amplifiers", "release_capital_hold"),
+            make_signal(3, "2025-02-11T10:00:00", "TWT Amplifiers", "flag_for_review"),
+            make_signal(4, "2025-02-12T10:00:00", "Chamber", "release_capital_hold", "Semiconductors"),
+            make_signal(5, "2025-02-13T10:00:00", "TWT Amplifiers", "release_capital_hold"),
+        ])
+
+    def test_range_query(self):
+        results = self.store.query(start="2025-02-01", end="2025-03-01",
+                                   asset_implication="TWT Amplifiers",
+                                   erp_action_recommendation="release_capital_hold")
+        self.assertEqual([s["signal_id"] for s in results], ["SIG-5", "SIG-2"])
+        self.assertEqual(len(self.store.query(target_category="Semiconductors")), 1)
+        self.assertEqual(len(self.store.query(limit=2)), 2)
+        with self.assertRaises(ValueError):
+            self.store.query(raw_snippet="x")
+
+    def test_rollup(self):
+        rollup = self.store.rollup()
+        top = rollup[0]
+        self.assertEqual((top["asset_implication"], top["erp_action_recommendation"], top["count"]),
+                         ("TWT Amplifiers", "release_capital_hold", 3))
+        self.assertEqual(top["last_seen"], "2025-02-13T10:00:00")
+        by_category = self.store.rollup(by=("target_category",), start="2025-02-01")
+        self.assertEqual({r["target_category"]: r["count"] for r in by_category},
+                         {"Defense_Systems": 3, "Semiconductors": 1})
+
+    def test_scout_sink(self):
+        path = os.path.join(self.tmp.name, "sink.db")
+        sinks = build_sinks([{"type": "sqlite", "path": path}])
+        scout = MockScout()
+        scout.targets = {"Semiconductors": {"related_asset": "Chamber", "keywords": ["wafer"]}}
+        signals = list(scout.score_documents([{"title": "Wafer fab", "description": "wafer"}]))
+        sinks[0].emit(signals)
+        sinks[0].close()
+
+        stored = SignalStore(path)
+        self.addCleanup(stored.close)
+        self.assertEqual(stored.query(target_category="Semiconductors"), signals)
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Refined by GovSignal Automation
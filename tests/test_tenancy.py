@@ -0,0 +1,160 @@
+import unittest
+import os
+import json
+import yaml
+import tempfile
+import logging
+from govsignal.scout import ProcurementScout
+from govsignal.tenancy import MultiTenantScout
+from govsignal.matcher import KeywordMatcher
+
+try:
+    import faiss  # noqa: F401
+    from govsignal.semantic import SemanticMatcher
+    from .test_semantic import ConceptEmbedder
+except ImportError:  # faiss-cpu is part of the full build environment
+    SemanticMatcher = None
+
+logging.disable(logging.CRITICAL)
+
+
+class TestTenancy(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _config(self, name, data):
+        path = os.path.join(self.tmp.name, f"{name}.yaml")
+        with open(path, 'w') as f:
+            yaml.dump(data, f)
+        return path
+
+    def test_matcher_equivalence(self):
+        patterns = ["chip", "chips act", "hip", "wafer", "afe"]
+        matcher = KeywordMatcher.compile(patterns)
+        text = "The CHIPS Act funds safer wafer fabs"
+        expected = {i for i, p in enumerate(patterns) if p in text.lower()}
+        self.assertEqual(matcher.scan(text), expected)
+
+    def test_shared_fetch_and_split(self):
+        sink_a = os.path.join(self.tmp.name, "a.jsonl")
+        tenant_a = self._config("a", {
+            "surveillance_targets": {"Defense": {"related_asset": "TWT", "keywords": ["jamming pods", "resilience"]}},
+            "enabled_local_sources": ["TX_TEF"],
+            "sinks": [{"type": "jsonl", "path": sink_a}],
+        })
+        tenant_b = self._config("b", {
+            "surveillance_targets": {"Semis": {"related_asset": "Chamber", "keywords": ["nanofabrication", "tax credit"]}},
+            "enabled_local_sources": ["CA_GO_BIZ", "TX_TEF"],
+            "thresholds": {"release_capital_hold": 0.6},
+            "sinks": [{"type": "jsonl", "path": os.path.join(self.tmp.name, "b.jsonl")}],
+        })
+        multi = MultiTenantScout({"a": tenant_a, "b": tenant_b})
+
+        calls = []
+        for key, (connector, fetch, name, fields) in list(multi.sources.items()):
+            def counting(keywords, filters, _fetch=fetch, _key=key):
+                calls.append(_key)
+                return _fetch(keywords, filters)
+            multi.sources[key] = (connector, counting, name, fields)
+
+        results = multi.run()
+        # One upstream query per source regardless of tenant count
+        self.assertEqual(sorted(calls), sorted(["SAM_GOV", "FEDERAL_REGISTER", "TX_TEF", "CA_GO_BIZ"]))
+
+        sources_a = {s["source"] for s in results["a"]}
+        self.assertEqual(sources_a, {"SAM.gov", "Texas TEF"})
+        self.assertNotIn("CA GO-Biz", sources_a)
+
+        by_source_b = {s["source"]: s for s in results["b"]}
+        self.assertIn("CA GO-Biz", by_source_b)
+        # Tenant b's own release threshold applies to a single-keyword (0.6) match
+        self.assertEqual(by_source_b["CA GO-Biz"]["erp_action_recommendation"], "release_capital_hold")
+
+        with open(sink_a) as f:
+            self.assertEqual(len([json.loads(line) for line in f]), len(results["a"]))
+
+    def test_tenants_score_like_single_scout(self):
+        # Code routing only: the SAM.gov record (NAICS 334511) has none of the keywords
+        config = self._config("coded", {
+            "surveillance_targets": {"Defense": {"assets": ["Traveling Wave Tube (TWT)"], "keywords": ["radome"]}},
+            "enabled_local_sources": [],
+            "code_routing": {"enabled": True},
+        })
+        key = lambda s: (s["source"], s["target_category"], s.get("matched_codes"), s["demand_probability"])
+        single = sorted(map(key, ProcurementScout(config).collect_signals()))
+        tenants = sorted(map(key, MultiTenantScout({"a": config}).collect_signals()["a"]))
+        self.assertEqual(tenants, single)
+        self.assertIn(("SAM.gov", "Defense", ["NAICS:334511"], 0.6), tenants)
+
+    def _count_fetches(self, multi):
+        fetched = []
+        for key, (connector, fetch, name, fields) in list(multi.sources.items()):
+            def counting(keywords, filters, _fetch=fetch):
+                records = _fetch(keywords, filters)
+                fetched.extend(records)
+                return records
+            multi.sources[key] = (connector, counting, name, fields)
+        return fetched
+
+    def test_one_scoring_pass_per_document(self):
+        configs = {
+            "a": self._config("a", {
+                "surveillance_targets": {"Defense": {"assets": ["Traveling Wave Tube (TWT)"],
+                                                     "keywords": ["jamming pods", "resilience"]}},
+                "enabled_local_sources": ["TX_TEF"],
+                "code_routing": {"enabled": True},
+            }),
+            "b": self._config("b", {
+                "surveillance_targets": {"Semis": {"related_asset": "Chamber", "keywords": ["nanofabrication", "wafer"]},
+                                         "EW": {"related_asset": "TWT", "keywords": ["electronic warfare"]}},
+                "enabled_local_sources": ["CA_GO_BIZ", "TX_TEF"],
+                "thresholds": {"release_capital_hold": 0.6},
+            }),
+        }
+        multi = MultiTenantScout(configs)
+        fetched = self._count_fetches(multi)
+        scans = []
+        scan = multi.matcher.scan
+        multi.matcher.scan = lambda text: scans.append(text) or scan(text)
+        for tenant in multi.tenants.values():
+            tenant._compiled_targets = lambda: self.fail("tenants must not rescan documents")
+
+        results = multi.collect_signals()
+        self.assertEqual(len(scans), len(fetched))
+
+        key = lambda s: (s["source"], s["target_category"], s.get("matched_codes"), s["demand_probability"],
+                         s["erp_action_recommendation"])
+        for name, path in configs.items():
+            self.assertEqual(sorted(map(key, results[name])),
+                             sorted(map(key, ProcurementScout(path).collect_signals())))
+        self.assertIn(("SAM.gov", "Defense", ["NAICS:334511"], 0.6, "flag_for_review"),
+                      list(map(key, results["a"])))
+
+    @unittest.skipIf(SemanticMatcher is None, "faiss/numpy not installed")
+    def test_semantic_tenants_embed_each_batch_once(self):
+        multi = MultiTenantScout({
+            name: self._config(name, {
+                "surveillance_targets": {category: {"related_asset": "TWT", "keywords": ["radome"]}},
+                "enabled_local_sources": [],
+                "semantic_matching": {"enabled": True},
+            }) for name, category in (("a", "Defense"), ("b", "Jamming"))
+        })
+        embedder = ConceptEmbedder()
+        for tenant in multi.tenants.values():
+            tenant._semantic = SemanticMatcher(embedder, [], threshold=0.5, weight=0.8)
+            tenant._semantic.sync(tenant.targets)
+        already_embedded = len(embedder.embedded)
+        fetched = self._count_fetches(multi)
+
+        results = multi.collect_signals()
+        self.assertEqual(len(embedder.embedded) - already_embedded, len(fetched))
+        # Each tenant still searches its own index
+        self.assertEqual({s["target_category"] for s in results["b"]}, {"Jamming"})
+        self.assertTrue(all("semantic_similarity" in s for s in results["b"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Refined by GovSignal Automation
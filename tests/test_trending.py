@@ -0,0 +1,106 @@
+import unittest
+import os
+import tempfile
+import threading
+import logging
+from govsignal.trending import CountMinSketch, HeavyHitters, TrendingTerms, extract_terms
+
+logging.disable(logging.CRITICAL)
+
+DAY = 86400
+
+
+class TestTrending(unittest.TestCase):
+    def test_extract_terms(self):
+        terms = extract_terms("The NSTC launches a CHIPS program")
+        self.assertIn("nstc", terms)
+        self.assertIn("chips program", terms)
+        self.assertNotIn("the", terms)
+
+    def test_sketch_never_undercounts(self):
+        sketch = CountMinSketch(width=64, depth=3)
+        for i in range(500):
+            sketch.add(f"term{i % 50}")
+        self.assertTrue(all(sketch.estimate(f"term{i}") >= 10 for i in range(50)))
+        self.assertEqual(len(sketch.counters), 64 * 3)
+
+    def test_heavy_hitters_bounded(self):
+        hitters = HeavyHitters(capacity=5)
+        for i in range(100):
+            hitters.add(f"noise{i}")
+            hitters.add("signal")
+        self.assertEqual(len(hitters.entries), 5)
+        self.assertEqual(hitters.top(1)[0][0], "signal")
+
+    def test_heavy_hitters_space_saving_guarantees(self):
+        hitters = HeavyHitters(capacity=20)
+        truth = {}
+        for i in range(5000):
+            term = f"t{(i * i) % 97}" if i % 3 else "hot"
+            truth[term] = truth.get(term, 0) + 1
+            hitters.add(term)
+        # Counts sum to the stream length, never undercount, and overcount by at most the floor
+        self.assertEqual(sum(count for count, _ in hitters.entries.values()), 5000)
+        for term, (count, overestimate) in hitters.entries.items():
+            self.assertGreaterEqual(count, truth[term])
+            self.assertGreaterEqual(truth[term], count - overestimate)
+        self.assertEqual(hitters.top(1)[0][0], "hot")
+        self.assertLessEqual(len(hitters._heap), 4 * hitters.capacity + 1)
+
+        # Entries restored from saved state keep evicting the true minimum
+        restored = HeavyHitters(capacity=2)
+        restored.entries = {"big": [9, 0], "small": [1, 0]}
+        restored.add("new")
+        self.assertEqual(sorted(restored.entries), ["big", "new"])
+        self.assertEqual(restored.entries["new"], [2, 1])
+
+    def test_accelerating_term_reported(self):
+        trending = TrendingTerms(window_seconds=DAY, min_count=5, min_growth=3.0, known_terms=["radar"])
+        for day in range(3):
+            for _ in range(10):
+                trending.observe("state grant for radar systems", now=day * DAY)
+        for _ in range(10):
+            trending.observe("state grant for radar systems under the NQIA initiative", now=3 * DAY)
+
+        terms = [c["term"] for c in trending.candidates()]
+        self.assertIn("nqia", terms)
+        self.assertNotIn("grant", terms)   # steady
+        self.assertNotIn("radar", terms)   # already configured
+
+    def test_state_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "trending.json")
+            trending = TrendingTerms(window_seconds=DAY, min_count=2, state_path=path)
+            for _ in range(3):
+                trending.observe("quantum foundry", now=0)
+            trending.save()
+
+            restored = TrendingTerms(window_seconds=DAY, min_count=2, state_path=path)
+            self.assertEqual(restored.current.estimate("quantum foundry"), 3)
+            self.assertEqual(restored.candidates(), trending.candidates())
+
+    def test_concurrent_observers(self):
+        trending = TrendingTerms(window_seconds=DAY, top_terms=20, min_count=1, min_growth=1.0)
+        errors = []
+
+        def observe(worker):
+            try:
+                for i in range(500):
+                    trending.observe(f"lidar buoy {worker}-{i}", now=0)
+                    trending.candidates()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=observe, args=(w,)) for w in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(trending.current.estimate("lidar buoy"), 2000)
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Refined by GovSignal Automation
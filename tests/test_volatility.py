@@ -0,0 +1,125 @@
+import math
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import logging
+from llm_nexus.volatility import VolatilityEstimator
+
+try:
+    import numpy as np
+    from llm_nexus.sentiment_engine import SentimentEngine
+except ImportError:  # numpy is part of the full build environment
+    np = None
+
+logging.disable(logging.CRITICAL)
+
+T0 = 1_700_000_000.0
+
+
+class TestVolatilityEstimator(unittest.TestCase):
+    def test_batching_does_not_matter(self):
+        scores = [0.8, 0.1, 0.5, 0.9, 0.2, 0.8]
+        times = [T0 + 600 * i for i in range(len(scores))]
+        one_by_one = VolatilityEstimator(clock=lambda: times[-1])
+        for risk, t in zip(scores, times):
+            one_by_one.update(risk, t)
+        batched = VolatilityEstimator(clock=lambda: times[-1])
+        batched.update_many(scores[:2], times[:2])
+        batched.update_many(scores[2:], times[2:])
+        for horizon, value in one_by_one.value().items():
+            self.assertAlmostEqual(value, batched.value(horizon))
+
+    def test_matches_direct_decayed_mean(self):
+        estimator = VolatilityEstimator(horizons={"1h": 3600}, prior_weight=0.0)
+        events = [(0.9, T0), (0.3, T0 + 1800), (0.6, T0 + 900)]  # last one arrives late
+        for risk, t in events:
+            estimator.update(risk, t)
+        now = T0 + 3600
+        weights = [math.exp(-(now - t) / 3600) for _, t in events]
+        expected = sum(w * r for w, (r, _) in zip(weights, events)) / sum(weights)
+        self.assertAlmostEqual(estimator.value("1h", now=now), expected)
+
+    def test_horizons_react_at_different_speeds(self):
+        estimator = VolatilityEstimator()
+        for i in range(100):
+            estimator.update(0.1, T0 + i * 3600)  # calm for 100 hours
+        for i in range(5):
+            estimator.update(0.9, T0 + 100 * 3600 + i * 60)  # sudden burst
+        now = T0 + 100 * 3600 + 300
+        values = estimator.value(now=now)
+        self.assertGreater(values["1h"], values["24h"])
+        self.assertGreater(values["24h"], values["7d"])
+
+    def test_decays_to_baseline_without_signals(self):
+        estimator = VolatilityEstimator(baseline=0.1)
+        estimator.update(0.9, T0)
+        self.assertGreater(estimator.value("1h", now=T0), 0.4)
+        self.assertAlmostEqual(estimator.value("1h", now=T0 + 30 * 3600), 0.1, places=3)
+
+    def test_concurrent_producers(self):
+        estimator = VolatilityEstimator(horizons={"7d": 604800}, prior_weight=0.0, shards=4)
+
+        def produce(risk):
+            for _ in range(2000):
+                estimator.update(risk, T0)
+
+        threads = [threading.Thread(target=produce, args=(r,)) for r in (0.2, 0.4, 0.6, 0.8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertAlmostEqual(estimator.evidence(now=T0)["7d"], 8000.0)
+        self.assertAlmostEqual(estimator.value("7d", now=T0), 0.5)
+
+    def test_threads_spread_across_shards(self):
+        estimator = VolatilityEstimator(shards=4)
+        used = []
+        lock = threading.Lock()
+
+        def record():
+            shard = estimator._shard()
+            self.assertIs(estimator._shard(), shard)  # pinned
+            with lock:
+                used.append(id(shard))
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(set(used)), 4)
+
+    def test_checkpoint_and_restore(self):
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, "volatility.json")
+            estimator = VolatilityEstimator(clock=lambda: T0 + 60)
+            estimator.update(0.9, T0)
+            estimator.update(0.4, T0 + 30)
+            estimator.checkpoint(path)
+
+            restored = VolatilityEstimator.restore(path, clock=lambda: T0 + 60)
+            for horizon, value in estimator.value().items():
+                self.assertAlmostEqual(restored.value(horizon), value)
+            restored.update(0.7, T0 + 90)
+            estimator.update(0.7, T0 + 90)
+            self.assertAlmostEqual(restored.value("1h", now=T0 + 120), estimator.value("1h", now=T0 + 120))
+            self.assertEqual(VolatilityEstimator.restore(os.path.join(tmp, "missing.json")).value("24h"), 0.0)
+        finally:
+            shutil.rmtree(tmp)
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_engine_feeds_estimator(self):
+        estimator = VolatilityEstimator(prior_weight=0.0, clock=lambda: T0)
+        signals = [{"content": "DoD announces blockade in Strait of Hormuz", "timestamp": T0},
+                   {"content": "Diplomatic talks yield positive results", "timestamp": T0}]
+        values = SentimentEngine(noise="none").feed_volatility(signals, estimator)
+        self.assertAlmostEqual(values["1h"], 0.45)
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Refined by GovSignal Automation
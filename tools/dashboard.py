@@ -1,8 +1,38 @@
+import os
+import sys
 import streamlit as st
 import pandas as pd
 import numpy as np
 import time
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from govsignal.store import SignalStore
+
+# Scout signal store (see `sinks:` in examples/config.yaml); mock signals are shown when absent
+SIGNAL_STORE_PATH = os.environ.get("GOVSIGNAL_STORE", "output/signals.db")
+
+RISK_BY_ACTION = {"release_capital_hold": "HIGH", "flag_for_review": "MEDIUM", "monitor": "LOW"}
+
+def load_stored_signals(limit=10):
+    if not os.path.exists(SIGNAL_STORE_PATH):
+        return None
+    store = SignalStore(SIGNAL_STORE_PATH)
+    try:
+        stored = store.query(limit=limit)
+    finally:
+        store.close()
+    signals = []
+    for s in stored:
+        entry = {
+            "time": s["timestamp"][11:16],
+            "msg": s["detected_event"],
+            "risk": RISK_BY_ACTION.get(s["erp_action_recommendation"], "LOW"),
+        }
+        if s["erp_action_recommendation"] != "monitor":
+            entry["action"] = f"{s['erp_action_recommendation']} ({s['asset_implication']})"
+        signals.append(entry)
+    return signals
+
 # Helper function to mock simulation data if we can't run the full orchestrator live in Streamlit easily
 def generate_mock_data():
     steps = 100
@@ -30,8 +60,8 @@ st.markdown("**Financial Intelligence for Critical Supply Chains**")
 st.sidebar.header("📡 Live Geopolitical Signals")
 st.sidebar.markdown("Monitoring `defense.gov` & `sam.gov`...")
 
-# Mock Signals
-signals = [
+# Stored scout signals, falling back to mock signals
+signals = load_stored_signals() or [
     {"time": "10:42 AM", "msg": "Trade Agreement with key ally signed", "risk": "LOW"},
     {"time": "09:15 AM", "msg": "Semiconductor export restrictions under review", "risk": "MEDIUM"},
     {"time": "08:30 AM", "msg": "DoD announces blockage in Strait of Hormuz", "risk": "HIGH", "action": "Triggered Pre-emptive Buy"},